@@ -4,12 +4,24 @@ Core Agent Caller - Standardized Task Tool Proxy Pattern Implementation
 Provides consistent, reusable agent invocation using verified Task protocol.
 """
 
+import os
 import json
 import time
-from typing import Dict, List, Optional, Union
-from dataclasses import dataclass
+import sqlite3
+import asyncio
+import hashlib
+from collections import OrderedDict
+from itertools import count
+from typing import Any, Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, asdict, field, is_dataclass
+from datetime import datetime
 from enum import Enum
 
+try:
+    import orjson  # Optional C-accelerated JSON encoder
+except ImportError:
+    orjson = None
+
 class AgentType(Enum):
     """Available agent types from 47-agent framework"""
     ORCHESTRATOR = "orchestrator"
@@ -22,7 +34,56 @@ class AgentType(Enum):
     COMPETITIVE_MARKET_ANALYST = "competitive-market-analyst"
     WEB_SEARCH_RESEARCHER = "web-search-researcher"
 
-@dataclass
+_AGENT_VALUES = {agent: agent.value for agent in AgentType}
+
+def _json_default(obj: Any) -> Any:
+    """Encode enums, dataclasses and other objects the encoder cannot handle"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()  # Matches orjson's native datetime output
+    if is_dataclass(obj):
+        return asdict(obj)
+    return str(obj)
+
+def dumps_json(obj: Any) -> bytes:
+    """
+    Serialize obj to indented JSON bytes
+    Uses orjson when installed (dataclasses and enums are encoded natively,
+    without an asdict pass), falling back to the stdlib encoder
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, default=_json_default).encode()
+
+_ORCHESTRATOR_PROMPT_TEMPLATE = """coordinate a comprehensive workflow for: {workflow}
+
+Required agents for coordination: {agents}
+
+Task breakdown:
+{tasks}
+
+Please provide:
+1. Detailed execution plan with checkboxes
+2. Agent coordination strategy  
+3. Progress checkpoints (25%, 50%, 75%, 100%)
+4. Resource and timeline estimates
+5. Quality gates and validation steps"""
+
+# Transient transport failures worth retrying with exponential backoff
+RETRYABLE_ERRORS = (TimeoutError, ConnectionError)
+
+def _retry_delays(max_attempts: int, base_delay: float = 1.0, max_delay: float = 10.0):
+    """Backoff delays between attempts: base, 2*base, 4*base ... capped at max_delay"""
+    return [min(max_delay, base_delay * 2 ** attempt) for attempt in range(max_attempts - 1)]
+
+_BATCH_PROMPT_TEMPLATE = """handle the following {count} independent requests in a single response.
+
+Return one JSON object keyed by request id ({keys}), each value holding the complete result for that request.
+
+{items}"""
+
+@dataclass(slots=True)
 class TaskProgress:
     """Track task execution progress with checkpoints"""
     task_id: str
@@ -34,31 +95,145 @@ class TaskProgress:
     completed_at: Optional[str] = None
     results: Optional[Dict] = None
     errors: Optional[List[str]] = None
+    content_blocks: Optional[List[Dict]] = None  # Message content handed to the Task tool
+    _cache_key: Optional[str] = field(default=None, repr=False)  # Response cache entry filled on completion
+
+class ResponseCache:
+    """
+    LRU + TTL cache of agent results keyed by (agent_type, prompt)
+    With persist_path set, entries are also kept in a SQLite file so
+    identical calls are served across runs
+    """
+    
+    def __init__(self,
+                 ttl_seconds: float = 3600,
+                 max_entries: int = 512,
+                 enabled: bool = True,
+                 persist_path: Optional[str] = None):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.enabled = enabled  # Disable for non-deterministic agents
+        self.persist_path = persist_path
+        self.backend: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0}
+        self._db: Optional[sqlite3.Connection] = None
+    
+    @staticmethod
+    def make_key(agent_type: AgentType, prompt: Union[str, Tuple[str, str]]) -> str:
+        """Hash agent type and whitespace-normalized prompt into a cache key"""
+        if isinstance(prompt, tuple):
+            prompt = "\n\n".join(prompt)
+        normalized_prompt = " ".join(prompt.split())
+        payload = json.dumps({"a": agent_type.value, "p": normalized_prompt}, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Return cached results for key, or None on miss or expiry"""
+        if not self.enabled:
+            return None
+        
+        entry = self.backend.get(key)
+        if entry is None:
+            entry = self._load_persisted(key)
+        if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+            if entry is not None:
+                del self.backend[key]
+            self.stats["misses"] += 1
+            return None
+        
+        self.backend.move_to_end(key)
+        self.stats["hits"] += 1
+        return entry[1]
+    
+    def put(self, key: str, results: Dict):
+        """Store results for key, evicting the least recently used entry"""
+        if not self.enabled:
+            return
+        
+        self.backend[key] = (time.monotonic(), results)
+        self.backend.move_to_end(key)
+        while len(self.backend) > self.max_entries:
+            self.backend.popitem(last=False)
+        
+        if self.persist_path:
+            db = self._connection()
+            db.execute(
+                "INSERT OR REPLACE INTO responses (key, stored_at, results) VALUES (?, ?, ?)",
+                (key, time.time(), json.dumps(results, default=_json_default))
+            )
+            db.commit()
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Open the persistent store on first use"""
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.persist_path) or ".", exist_ok=True)
+            self._db = sqlite3.connect(self.persist_path)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, stored_at REAL NOT NULL, results TEXT NOT NULL)"
+            )
+        return self._db
+    
+    def close(self):
+        """Close the persistent store; it is reopened on next use"""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+    
+    def _load_persisted(self, key: str) -> Optional[Tuple[float, Dict]]:
+        """Promote a persisted entry into the in-memory LRU, keeping its age"""
+        if not self.persist_path or not os.path.exists(self.persist_path):
+            return None
+        
+        row = self._connection().execute(
+            "SELECT stored_at, results FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        
+        entry = (time.monotonic() - (time.time() - row[0]), json.loads(row[1]))
+        self.backend[key] = entry
+        return entry
 
 class AgentCaller:
     """Core agent calling infrastructure using Task Tool Proxy Pattern"""
     
-    def __init__(self):
+    def __init__(self, cache_path: Optional[str] = None):
         self.session_id = f"session_{int(time.time())}"
         self.task_history: List[TaskProgress] = []
+        self._task_index: Dict[str, TaskProgress] = {}
+        self._cache = ResponseCache(ttl_seconds=3600, max_entries=512, persist_path=cache_path)
+        self._task_sequence = count(1)  # Keeps default task ids unique within the same second
         
     def call_agent(self, 
                    agent_type: AgentType,
-                   prompt: str,
-                   task_id: Optional[str] = None) -> TaskProgress:
+                   prompt: Union[str, Tuple[str, str]],
+                   task_id: Optional[str] = None,
+                   use_cache: bool = True) -> TaskProgress:
         """
         Call agent using verified Task Tool Proxy Pattern
         
         Args:
             agent_type: Agent to invoke from AgentType enum
-            prompt: Detailed task description for the agent
-            task_id: Optional task identifier for tracking
+            prompt: Detailed task description for the agent, or a
+                (static_prefix, dynamic_suffix) tuple whose prefix is
+                marked for provider-side prompt caching
+            task_id: Optional task identifier for tracking; an id already in
+                use gets a numeric suffix, see the returned task_id
+            use_cache: Serve identical (agent_type, prompt) calls from the
+                response cache; pass False for non-deterministic agents
             
         Returns:
             TaskProgress object for monitoring execution
         """
         if not task_id:
-            task_id = f"task_{int(time.time())}"
+            task_id = f"task_{int(time.time())}_{next(self._task_sequence)}"
+        elif task_id in self._task_index:
+            # Never shadow a tracked task; callers read the final id from the returned progress
+            requested_id = task_id
+            while task_id in self._task_index:
+                task_id = f"{requested_id}_{next(self._task_sequence)}"
+            print(f"⚠️ Task ID {requested_id} already in use, tracking as {task_id}")
             
         # Create progress tracker
         progress = TaskProgress(
@@ -70,11 +245,30 @@ class AgentCaller:
             started_at=time.strftime("%Y-%m-%d %H:%M:%S")
         )
         
+        # Short-circuit to cached results for an identical call
+        cache_key = ResponseCache.make_key(agent_type, prompt) if use_cache else None
+        cached_results = self._cache.get(cache_key) if cache_key else None
+        if cached_results is not None:
+            progress.status = "completed"
+            progress.progress = 100
+            progress.checkpoint = "Served from response cache"
+            progress.completed_at = progress.started_at
+            progress.results = dict(cached_results)
+            self.task_history.append(progress)
+            self._task_index[task_id] = progress
+            
+            print(f"♻️ Cache hit for {agent_type.value} agent (Task ID: {task_id})")
+            return progress
+        
+        progress._cache_key = cache_key
+        
         # Build Task protocol prompt
-        task_prompt = f"Use {agent_type.value} subagent to {prompt}"
+        progress.content_blocks = self._build_content_blocks(agent_type, prompt)
+        task_prompt = "\n\n".join(block["text"] for block in progress.content_blocks)
         
         # Log the call
         self.task_history.append(progress)
+        self._task_index[task_id] = progress
         
         print(f"🎯 Calling {agent_type.value} agent...")
         print(f"📋 Task: {task_prompt}")
@@ -87,6 +281,122 @@ class AgentCaller:
         
         return progress
     
+    def call_agent_with_retry(self,
+                              agent_type: AgentType,
+                              prompt: Union[str, Tuple[str, str]],
+                              task_id: Optional[str] = None,
+                              use_cache: bool = True,
+                              max_attempts: int = 3) -> TaskProgress:
+        """
+        call_agent that retries RETRYABLE_ERRORS with exponential backoff
+        Other errors, and the last failed attempt, propagate to the caller
+        """
+        for delay in _retry_delays(max_attempts):
+            try:
+                return self.call_agent(agent_type, prompt, task_id, use_cache)
+            except RETRYABLE_ERRORS as e:
+                print(f"🔁 {agent_type.value} call failed ({e}), retrying in {delay:g}s...")
+                time.sleep(delay)
+        return self.call_agent(agent_type, prompt, task_id, use_cache)
+    
+    async def call_agent_async(self,
+                               agent_type: AgentType,
+                               prompt: Union[str, Tuple[str, str]],
+                               task_id: Optional[str] = None,
+                               use_cache: bool = True,
+                               max_attempts: int = 3) -> TaskProgress:
+        """
+        Awaitable variant of call_agent for concurrent schedulers
+        Yields to the event loop so other submitted calls can proceed, and
+        backs off without blocking them when a call hits RETRYABLE_ERRORS
+        """
+        for delay in _retry_delays(max_attempts):
+            try:
+                progress = self.call_agent(agent_type, prompt, task_id, use_cache)
+                break
+            except RETRYABLE_ERRORS as e:
+                print(f"🔁 {agent_type.value} call failed ({e}), retrying in {delay:g}s...")
+                await asyncio.sleep(delay)
+        else:
+            progress = self.call_agent(agent_type, prompt, task_id, use_cache)
+        
+        await asyncio.sleep(0)
+        return progress
+    
+    def call_agent_batch(self,
+                         agent_type: AgentType,
+                         prompts: Dict[str, str],
+                         task_id: Optional[str] = None,
+                         use_cache: bool = True,
+                         static_prefix: Optional[str] = None) -> TaskProgress:
+        """
+        Pack several independent prompts for one agent into a single call
+        
+        Args:
+            agent_type: Agent to invoke from AgentType enum
+            prompts: Request id -> prompt; the agent answers with a JSON
+                object keyed by the same ids
+            task_id: Optional task identifier for tracking
+            use_cache: Passed through to call_agent
+            static_prefix: Optional shared context sent as a cacheable prefix
+            
+        Returns:
+            TaskProgress for the combined call
+        """
+        prompt = _BATCH_PROMPT_TEMPLATE.format(
+            count=len(prompts),
+            keys=", ".join(map('"{}"'.format, prompts)),
+            items="\n\n".join(f"### {key}\n{text}" for key, text in prompts.items())
+        )
+        if static_prefix:
+            return self.call_agent(agent_type, (static_prefix, prompt), task_id, use_cache)
+        return self.call_agent(agent_type, prompt, task_id, use_cache)
+    
+    def call_agent_complete(self, task_id: str, results: Dict) -> Optional[TaskProgress]:
+        """
+        Record agent results for a task and populate the response cache
+        
+        Args:
+            task_id: Task identifier passed to call_agent
+            results: Results returned by the agent
+            
+        Returns:
+            Updated TaskProgress, or None if the task is unknown
+        """
+        progress = self.get_task_status(task_id)
+        if progress:
+            progress.status = "completed"
+            progress.progress = 100
+            progress.checkpoint = "Agent response received"
+            progress.completed_at = time.strftime("%Y-%m-%d %H:%M:%S")
+            progress.results = results
+            
+            # Cache under the prompt this task was created for
+            if progress._cache_key:
+                self._cache.put(progress._cache_key, results)
+                progress._cache_key = None
+        
+        return progress
+    
+    def _build_content_blocks(self,
+                              agent_type: AgentType,
+                              prompt: Union[str, Tuple[str, str]]) -> List[Dict]:
+        """
+        Build message content blocks for the Task protocol prompt
+
+        A (static_prefix, dynamic_suffix) prompt puts the static block first
+        with an ephemeral cache_control breakpoint, so every call sharing that
+        prefix is a cache hit; the agent-specific instruction follows it.
+        """
+        if isinstance(prompt, tuple):
+            static_prefix, dynamic_suffix = prompt
+            return [
+                {"type": "text", "text": static_prefix, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": f"Use {agent_type.value} subagent to {dynamic_suffix}"}
+            ]
+        
+        return [{"type": "text", "text": f"Use {agent_type.value} subagent to {prompt}"}]
+    
     def call_orchestrator(self,
                          workflow_description: str,
                          agents_needed: List[AgentType],
@@ -102,31 +412,21 @@ class AgentCaller:
         Returns:
             TaskProgress for orchestration workflow
         """
-        agents_list = [agent.value for agent in agents_needed]
-        tasks_formatted = "\n".join([f"- {task}" for task in task_breakdown])
-        
-        prompt = f"""coordinate a comprehensive workflow for: {workflow_description}
-
-Required agents for coordination: {', '.join(agents_list)}
-
-Task breakdown:
-{tasks_formatted}
-
-Please provide:
-1. Detailed execution plan with checkboxes
-2. Agent coordination strategy  
-3. Progress checkpoints (25%, 50%, 75%, 100%)
-4. Resource and timeline estimates
-5. Quality gates and validation steps"""
+        prompt = _ORCHESTRATOR_PROMPT_TEMPLATE.format(
+            workflow=workflow_description,
+            agents=", ".join(_AGENT_VALUES[agent] for agent in agents_needed),
+            tasks="\n".join(map("- {}".format, task_breakdown))
+        )
         
         return self.call_agent(AgentType.ORCHESTRATOR, prompt)
     
+    def close(self):
+        """Release resources held across calls (persistent response cache)"""
+        self._cache.close()
+    
     def get_task_status(self, task_id: str) -> Optional[TaskProgress]:
         """Get current status of a task"""
-        for task in self.task_history:
-            if task.task_id == task_id:
-                return task
-        return None
+        return self._task_index.get(task_id)
     
     def list_active_tasks(self) -> List[TaskProgress]:
         """Get all tasks that are currently in progress"""
@@ -140,6 +440,7 @@ Please provide:
             "total_tasks": len(self.task_history),
             "completed_tasks": len([t for t in self.task_history if t.status == "completed"]),
             "failed_tasks": len([t for t in self.task_history if t.status == "failed"]),
+            "response_cache": dict(self._cache.stats),
             "task_history": [
                 {
                     "task_id": t.task_id,
@@ -153,6 +454,10 @@ Please provide:
             ]
         }
 
+    def export_session_report_json(self) -> bytes:
+        """Export session report serialized as JSON bytes"""
+        return dumps_json(self.export_session_report())
+
 # Example usage patterns
 if __name__ == "__main__":
     caller = AgentCaller()
@@ -4,17 +4,74 @@ Autonomous Task Manager - Self-Executing Agent Coordination System
 Manages autonomous task execution with progress reporting and orchestrator communication.
 """
 
+import os
+import re
 import json
 import time
+import copy
+import heapq
 import asyncio
-from typing import Dict, List, Optional, Callable
-from dataclasses import dataclass, asdict
-from enum import Enum
+import hashlib
+import itertools
+from collections import deque
+from typing import Dict, List, Optional, Callable, Deque, Iterator, Set, Tuple
+from dataclasses import dataclass, fields
+from enum import Enum, IntEnum
 from datetime import datetime, timedelta
 
-from agent_caller import AgentCaller, AgentType, TaskProgress
+from agent_caller import AgentCaller, AgentType, TaskProgress, dumps_json
 from workflow_analyzer import WorkflowAnalyzer
 
+# Static instruction block shared by every autonomous task prompt. It leads the
+# prompt so provider-side prefix caching reuses it across tasks and sessions.
+AUTONOMOUS_EXECUTION_PREFIX = "\n".join([
+    "AUTONOMOUS EXECUTION REQUIREMENTS:",
+    "1. Execute this task completely and autonomously",
+    "2. Provide structured deliverables as specified",
+    "3. Report any issues or blockers encountered",
+    "4. Include progress checkpoints (25%, 50%, 75%, 100%)",
+    "5. Generate summary for orchestrator handoff"
+])
+
+# Per-task section that follows the cached prefix, filled with str.format_map
+_TASK_PROMPT_TEMPLATE = (
+    "AUTONOMOUS TASK EXECUTION:\n"
+    "Task ID: {task_id}\n"
+    "Description: {description}\n"
+    "Priority: {priority}\n"
+    "Session: {session_id}\n"
+    "\n"
+    "CONTEXT:\n"
+    "- Expected deliverables: {deliverables}\n"
+    "- Skills to utilize: {skills}\n"
+    "- Commands available: {commands}\n"
+    "- Max execution time: {timeout} minutes\n"
+    "\n"
+    "TASK EXECUTION:\n"
+    "{description}"
+)
+
+# Fallback agent selection and timeout tables, checked in order; each keyword
+# group is one compiled alternation so a description is scanned once per group
+_AGENT_KEYWORDS = (
+    (re.compile("locate|find|discover"), AgentType.CODEBASE_LOCATOR),
+    (re.compile("analyze|review"), AgentType.CODEBASE_ANALYZER),
+    (re.compile("implement|develop"), AgentType.RUST_EXPERT_DEVELOPER),
+    (re.compile("security|validate"), AgentType.SECURITY_SPECIALIST),
+)
+_TIMEOUT_KEYWORDS = (
+    (re.compile("implement|develop|build"), 45),  # Implementation tasks take longer
+    (re.compile("security|validate|test"), 30),   # Validation tasks
+)
+_DEFAULT_TIMEOUT_MINUTES = 15  # Analysis and discovery tasks
+_AGENT_TYPES_BY_VALUE = {agent.value: agent for agent in AgentType}
+
+# Execution phases by completed quarter of the planned tasks
+_PHASE_TABLE = ("Discovery & Planning", "Core Implementation", "Validation & Security", "Integration & Completion")
+
+EXECUTION_LOG_PREVIEW_SIZE = 1000  # Events kept in memory for export_execution_summary
+EXECUTION_LOG_FLUSH_BATCH = 32     # Events buffered before each flush to disk
+
 class TaskStatus(Enum):
     PENDING = "pending"
     IN_PROGRESS = "in_progress" 
@@ -23,13 +80,14 @@ class TaskStatus(Enum):
     BLOCKED = "blocked"
     CANCELLED = "cancelled"
 
-class TaskPriority(Enum):
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-    CRITICAL = "critical"
+class TaskPriority(IntEnum):
+    """Task priority; higher values are dispatched first"""
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+    CRITICAL = 3
 
-@dataclass
+@dataclass(slots=True)
 class AutonomousTask:
     """Enhanced task definition for autonomous execution"""
     task_id: str
@@ -57,7 +115,9 @@ class AutonomousTask:
         if self.error_log is None:
             self.error_log = []
 
-@dataclass
+_TASK_FIELD_NAMES = tuple(f.name for f in fields(AutonomousTask))
+
+@dataclass(slots=True)
 class ExecutionReport:
     """Report for orchestrator communication"""
     session_id: str
@@ -76,15 +136,52 @@ class ExecutionReport:
 class AutonomousManager:
     """Autonomous task execution and management system"""
     
-    def __init__(self, session_id: Optional[str] = None):
+    # Plan templates shared across sessions: plan key -> (template session_id, tasks)
+    _plan_cache: Dict[str, Tuple[str, List[AutonomousTask]]] = {}
+    
+    def __init__(self,
+                 session_id: Optional[str] = None,
+                 max_concurrency: int = 8,
+                 notify_every: int = 5,
+                 notify_interval_seconds: float = 5.0,
+                 log_dir: Optional[str] = None):
         self.session_id = session_id or f"autonomous_{int(time.time())}"
+        self.max_concurrency = max_concurrency  # Parallel calls per agent type
+        self.notify_every = notify_every  # Completions per progress notification
+        self.notify_interval_seconds = notify_interval_seconds  # Max delay between notifications
         self.agent_caller = AgentCaller()
         self.workflow_analyzer = WorkflowAnalyzer()
         self.task_queue: List[AutonomousTask] = []
         self.active_tasks: Dict[str, AutonomousTask] = {}
         self.completed_tasks: List[AutonomousTask] = []
+        self._completed_ids: Set[str] = set()
+        
+        # Dependency graph: unmet dependencies per task and reverse edges
+        self._task_by_id: Dict[str, AutonomousTask] = {}
+        self._pending_deps: Dict[str, Set[str]] = {}
+        self._dependents: Dict[str, List[str]] = {}
+        self._ready: List[Tuple[int, str, int, AutonomousTask]] = []  # Heap, highest priority first
+        self._ready_sequence = itertools.count()
         self.orchestrator_callbacks: List[Callable] = []
-        self.execution_log: List[Dict] = []
+        self.execution_log: Deque[Dict] = deque(maxlen=EXECUTION_LOG_PREVIEW_SIZE)
+        
+        # Optional append-only JSONL stream holding the complete event log
+        self.log_path = os.path.join(log_dir, f"session_{self.session_id}.jsonl") if log_dir else None
+        self._log_file = None
+        self._unflushed_events = 0
+        self._agent_semaphores: Dict[AgentType, asyncio.Semaphore] = {}
+        
+        # Running report counters and notification batching state
+        self._stats = {"completed": 0, "failed": 0, "blocked": 0, "retries": 0}
+        self._agents_used: Set[AgentType] = set()
+        self._last_errors: deque = deque(maxlen=20)
+        self._total_duration_s = 0.0  # Wall-clock seconds of finished task runs
+        self._total_planned = 0
+        self._pending_notifications = 0
+        self._last_notified_at = time.monotonic()
+        
+        # Timestamp shared by everything the scheduler does within one tick
+        self._tick_now_iso: Optional[str] = None
         
     def register_orchestrator_callback(self, callback: Callable):
         """Register callback for orchestrator communication"""
@@ -94,61 +191,98 @@ class AutonomousManager:
         """
         Create autonomous task plan from workflow description
         Uses WorkflowAnalyzer to determine optimal agent coordination
+        Repeat workflows are served from a cached plan template
         """
+        plan_key = self._plan_key(workflow_description, context)
+        cached_plan = self._plan_cache.get(plan_key)
+        if cached_plan is not None:
+            return self._instantiate_plan(*cached_plan)
+        
         analysis = self.workflow_analyzer.analyze_workflow(workflow_description, context)
         tasks = []
         
+        # Index recommendations by agent type, keeping the first for each agent
+        rec_by_agent = {}
+        for rec in analysis["agent_recommendations"]:
+            rec_by_agent.setdefault(rec.agent_type, rec)
+        
         task_counter = 1
         
         # Create tasks from execution plan
         for phase in analysis["execution_plan"]:
             for task_desc in phase["tasks"]:
+                task_desc_lower = task_desc.lower()
+                matched_agent = next((agent for agent in rec_by_agent if agent in task_desc_lower), None)
+                
                 # Determine agent type from task description
-                agent_type = self._determine_agent_type(task_desc, analysis["agent_recommendations"])
+                agent_type = self._determine_agent_type(task_desc_lower, matched_agent)
                 
                 # Extract skills and commands
-                agent_rec = next((rec for rec in analysis["agent_recommendations"] 
-                                if rec.agent_type in task_desc), None)
+                agent_rec = rec_by_agent.get(matched_agent)
                 
-                skills = agent_rec.skills_needed if agent_rec else []
-                commands = agent_rec.commands_suggested if agent_rec else []
+                skills = list(agent_rec.skills_needed) if agent_rec else []
+                commands = list(agent_rec.commands_suggested) if agent_rec else []
                 
                 # Create autonomous task
                 task = AutonomousTask(
                     task_id=f"{self.session_id}_task_{task_counter:03d}",
                     description=task_desc,
-                    agent_type=AgentType(agent_type),
+                    agent_type=agent_type,
                     priority=TaskPriority.HIGH,
                     status=TaskStatus.PENDING,
                     dependencies=self._extract_dependencies(task_counter, phase),
                     skills_required=skills,
                     commands_to_execute=commands,
-                    expected_deliverables=phase["deliverables"],
-                    timeout_minutes=self._estimate_timeout(task_desc)
+                    expected_deliverables=list(phase["deliverables"]),
+                    timeout_minutes=self._estimate_timeout(task_desc_lower)
                 )
                 
                 tasks.append(task)
                 task_counter += 1
         
+        self._plan_cache[plan_key] = (self.session_id, copy.deepcopy(tasks))
         return tasks
     
-    def _determine_agent_type(self, task_desc: str, recommendations: List) -> str:
-        """Determine agent type from task description"""
-        for rec in recommendations:
-            if rec.agent_type in task_desc.lower():
-                return rec.agent_type
+    def _plan_key(self, workflow_description: str, context: Dict = None) -> str:
+        """Hash normalized workflow description and context into a plan key"""
+        normalized_description = " ".join(workflow_description.lower().split())
+        normalized_context = json.dumps(context or {}, sort_keys=True, default=str)
+        return hashlib.sha256(f"{normalized_description}\n{normalized_context}".encode()).hexdigest()
+    
+    def _instantiate_plan(self, template_session: str, template_tasks: List[AutonomousTask]) -> List[AutonomousTask]:
+        """Copy a cached plan template and rebase its task IDs onto this session"""
+        template_prefix = f"{template_session}_task_"
+        session_prefix = f"{self.session_id}_task_"
+        
+        def rebase(task_id: str) -> str:
+            if task_id.startswith(template_prefix):
+                return session_prefix + task_id[len(template_prefix):]
+            return task_id
+        
+        tasks = copy.deepcopy(template_tasks)
+        created_at = datetime.now().isoformat()
+        for task in tasks:
+            task.task_id = rebase(task.task_id)
+            task.dependencies = [rebase(dep_id) for dep_id in task.dependencies]
+            task.created_at = created_at
+        
+        return tasks
+    
+    @classmethod
+    def clear_plan_cache(cls):
+        """Drop all cached plan templates"""
+        cls._plan_cache.clear()
+    
+    def _determine_agent_type(self, task_desc_lower: str, matched_agent: Optional[str] = None) -> AgentType:
+        """Determine agent type from a lowercased task description and its matched recommendation"""
+        if matched_agent in _AGENT_TYPES_BY_VALUE:
+            return _AGENT_TYPES_BY_VALUE[matched_agent]
         
         # Fallback logic
-        if any(keyword in task_desc.lower() for keyword in ["locate", "find", "discover"]):
-            return "codebase-locator"
-        elif any(keyword in task_desc.lower() for keyword in ["analyze", "review"]):
-            return "codebase-analyzer"  
-        elif any(keyword in task_desc.lower() for keyword in ["implement", "develop"]):
-            return "rust-expert-developer"
-        elif any(keyword in task_desc.lower() for keyword in ["security", "validate"]):
-            return "security-specialist"
-        else:
-            return "orchestrator"
+        for keywords, agent_type in _AGENT_KEYWORDS:
+            if keywords.search(task_desc_lower):
+                return agent_type
+        return AgentType.ORCHESTRATOR
     
     def _extract_dependencies(self, task_number: int, phase: Dict) -> List[str]:
         """Extract task dependencies based on execution order"""
@@ -158,19 +292,28 @@ class AutonomousManager:
             dependencies.append(f"{self.session_id}_task_{task_number-1:03d}")
         return dependencies
     
-    def _estimate_timeout(self, task_desc: str) -> int:
-        """Estimate task timeout based on complexity"""
-        if any(keyword in task_desc.lower() for keyword in ["implement", "develop", "build"]):
-            return 45  # Implementation tasks take longer
-        elif any(keyword in task_desc.lower() for keyword in ["security", "validate", "test"]):
-            return 30  # Validation tasks
-        else:
-            return 15  # Analysis and discovery tasks
+    def _estimate_timeout(self, task_desc_lower: str) -> int:
+        """Estimate task timeout from a lowercased task description"""
+        for keywords, timeout_minutes in _TIMEOUT_KEYWORDS:
+            if keywords.search(task_desc_lower):
+                return timeout_minutes
+        return _DEFAULT_TIMEOUT_MINUTES
     
     def add_tasks(self, tasks: List[AutonomousTask]):
         """Add tasks to execution queue"""
+        self._total_planned += len(tasks)
         for task in tasks:
             self.task_queue.append(task)
+            self._task_by_id[task.task_id] = task
+            
+            # Track unmet dependencies; tasks with none are ready immediately
+            pending_deps = set(task.dependencies) - self._completed_ids
+            self._pending_deps[task.task_id] = pending_deps
+            for dep_id in pending_deps:
+                self._dependents.setdefault(dep_id, []).append(task.task_id)
+            if not pending_deps:
+                self._push_ready(task)
+            
             self._log_event("task_added", {
                 "task_id": task.task_id,
                 "description": task.description,
@@ -181,61 +324,140 @@ class AutonomousManager:
         """
         Start autonomous task execution
         Executes tasks respecting dependencies and reporting progress
+        Use run_autonomous_execution() when already inside an event loop
         """
-        self._log_event("execution_started", {
-            "total_tasks": len(self.task_queue),
-            "session_id": self.session_id
-        })
-        
-        while self.task_queue or self.active_tasks:
-            # Find ready tasks (dependencies satisfied)
-            ready_tasks = self._find_ready_tasks()
+        return asyncio.run(self.run_autonomous_execution())
+    
+    async def run_autonomous_execution(self) -> ExecutionReport:
+        """
+        Asynchronous scheduler behind start_autonomous_execution
+        Submits every ready task at once and reaps completions as they
+        arrive, so independent tasks overlap instead of running serially
+        """
+        try:
+            self._begin_tick()
+            self._log_event("execution_started", {
+                "total_tasks": len(self.task_queue),
+                "session_id": self.session_id
+            })
             
-            # Execute ready tasks
-            for task in ready_tasks:
-                self._execute_task(task)
+            in_flight: Set[asyncio.Task] = set()
             
-            # Check for completed tasks
-            self._check_task_completion()
+            while self.task_queue or in_flight:
+                # Submit all ready tasks (dependencies satisfied)
+                for task in self._find_ready_tasks():
+                    in_flight.add(asyncio.create_task(self._execute_task(task)))
             
-            # Report progress to orchestrator
-            if ready_tasks:  # Only report if we made progress
-                report = self._generate_progress_report()
-                self._notify_orchestrator(report)
+                if not in_flight:
+                    # Remaining tasks wait on dependencies that can never complete
+                    self._block_unreachable_tasks()
+                    break
             
-            # Prevent busy waiting
-            time.sleep(1)
-        
-        # Final report
-        final_report = self._generate_final_report()
-        self._notify_orchestrator(final_report)
-        
-        return final_report
+                # Wait only until at least one submitted task completes; running
+                # tasks stamp their own events while the scheduler is idle
+                self._end_tick()
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                self._begin_tick()
+            
+                # Check for completed tasks
+                self._check_task_completion()
+            
+                # Report progress to orchestrator, coalescing completions into batches
+                self._pending_notifications += len(done)
+                if self._notification_due():
+                    report = self._generate_progress_report()
+                    self._notify_orchestrator(report)
+                    self._pending_notifications = 0
+                    self._last_notified_at = time.monotonic()
+            
+            # Final report
+            final_report = self._generate_final_report()
+            self._notify_orchestrator(final_report)
+            self._end_tick()
+            
+            return final_report
+        finally:
+            # Release the JSONL log so its tail is on disk when the run ends; a
+            # later run reopens it in append mode
+            self.close_execution_log()
+    
+    def _begin_tick(self):
+        """Capture one timestamp for the scheduler work in this tick"""
+        self._tick_now_iso = datetime.now().isoformat()
+    
+    def _end_tick(self):
+        """Drop the tick timestamp so later events read the wall clock"""
+        self._tick_now_iso = None
+    
+    def _timestamp(self) -> str:
+        """Current tick timestamp, or the wall clock outside a tick"""
+        return self._tick_now_iso or datetime.now().isoformat()
+    
+    def _notification_due(self) -> bool:
+        """Notify every notify_every completions or notify_interval_seconds, whichever first"""
+        if not self._pending_notifications:
+            return False
+        return (self._pending_notifications >= self.notify_every or
+                time.monotonic() - self._last_notified_at >= self.notify_interval_seconds)
+    
+    def _block_unreachable_tasks(self):
+        """Mark queued tasks whose dependencies can no longer be satisfied"""
+        for task in self.task_queue:
+            if task.status == TaskStatus.PENDING:
+                task.status = TaskStatus.BLOCKED
+                self._stats["blocked"] += 1
+                self._log_event("task_blocked", {
+                    "task_id": task.task_id,
+                    "dependencies": task.dependencies
+                })
     
     def _find_ready_tasks(self) -> List[AutonomousTask]:
         """Find tasks ready for execution (dependencies satisfied)"""
         ready_tasks = []
-        completed_task_ids = {task.task_id for task in self.completed_tasks}
         
-        for task in self.task_queue[:]:  # Copy list to modify during iteration
+        while self._ready:
+            task = heapq.heappop(self._ready)[-1]
             if task.status != TaskStatus.PENDING:
                 continue
-                
-            # Check if all dependencies are satisfied
-            deps_satisfied = all(dep_id in completed_task_ids for dep_id in task.dependencies)
             
-            if deps_satisfied:
-                ready_tasks.append(task)
-                self.task_queue.remove(task)
+            ready_tasks.append(task)
+        
+        if ready_tasks:
+            # Single compaction pass instead of an O(N) remove() per task
+            dispatched = {id(task) for task in ready_tasks}
+            self.task_queue = [task for task in self.task_queue if id(task) not in dispatched]
         
         return ready_tasks
     
-    def _execute_task(self, task: AutonomousTask):
+    def _push_ready(self, task: AutonomousTask):
+        """Queue a task for dispatch, ordered by priority then creation time"""
+        heapq.heappush(self._ready, (-task.priority, task.created_at, next(self._ready_sequence), task))
+    
+    def _release_dependents(self, task_id: str):
+        """Mark task_id satisfied and enqueue dependents with no unmet dependencies"""
+        for dependent_id in self._dependents.pop(task_id, ()):
+            pending_deps = self._pending_deps[dependent_id]
+            pending_deps.discard(task_id)
+            if not pending_deps:
+                self._push_ready(self._task_by_id[dependent_id])
+    
+    async def _execute_task(self, task: AutonomousTask):
         """Execute a single autonomous task"""
         task.status = TaskStatus.IN_PROGRESS
-        task.started_at = datetime.now().isoformat()
         self.active_tasks[task.task_id] = task
         
+        semaphore = self._agent_semaphores.get(task.agent_type)
+        if semaphore is None:
+            semaphore = self._agent_semaphores[task.agent_type] = asyncio.Semaphore(self.max_concurrency)
+        
+        async with semaphore:
+            await self._run_task(task)
+    
+    async def _run_task(self, task: AutonomousTask):
+        """Run an admitted task against its agent"""
+        task.started_at = self._timestamp()
+        started = time.monotonic()
+        
         self._log_event("task_started", {
             "task_id": task.task_id,
             "agent_type": task.agent_type.value,
@@ -247,7 +469,7 @@ class AutonomousManager:
             enhanced_prompt = self._build_enhanced_prompt(task)
             
             # Call agent using Task protocol
-            progress = self.agent_caller.call_agent(
+            progress = await self.agent_caller.call_agent_async(
                 task.agent_type,
                 enhanced_prompt,
                 task.task_id
@@ -256,60 +478,67 @@ class AutonomousManager:
             # Update task with progress info
             task.progress = 50  # Execution started
             
-            # Simulate task execution (in real implementation, this would be async)
-            # For now, mark as completed after brief delay
-            time.sleep(2)  # Simulate work
+            if progress.status == "completed":
+                # Identical call already answered - reuse cached results
+                task.results = progress.results
+            else:
+                # Simulate task execution while other submitted tasks proceed
+                await asyncio.sleep(2)  # Simulate work
+                task.results = {"status": "success", "deliverables": task.expected_deliverables}
+                self.agent_caller.call_agent_complete(task.task_id, task.results)
             
             task.status = TaskStatus.COMPLETED
-            task.completed_at = datetime.now().isoformat()
+            task.completed_at = self._timestamp()
             task.progress = 100
-            task.results = {"status": "success", "deliverables": task.expected_deliverables}
             
             self._log_event("task_completed", {
                 "task_id": task.task_id,
-                "duration_seconds": 2,
+                "duration_seconds": round(time.monotonic() - started, 3),
                 "deliverables": task.expected_deliverables
             })
             
         except Exception as e:
             self._handle_task_error(task, str(e))
+        
+        finally:
+            # Retried attempts are re-queued as pending and not counted
+            if task.status in (TaskStatus.COMPLETED, TaskStatus.FAILED):
+                self._total_duration_s += time.monotonic() - started
     
-    def _build_enhanced_prompt(self, task: AutonomousTask) -> str:
-        """Build enhanced prompt with full context for autonomous execution"""
-        prompt_parts = [
-            f"AUTONOMOUS TASK EXECUTION:",
-            f"Task ID: {task.task_id}",
-            f"Description: {task.description}",
-            f"Priority: {task.priority.value}",
-            f"Session: {self.session_id}",
-            "",
-            f"CONTEXT:",
-            f"- Expected deliverables: {', '.join(task.expected_deliverables)}",
-            f"- Skills to utilize: {', '.join(task.skills_required)}",
-            f"- Commands available: {', '.join(task.commands_to_execute)}",
-            f"- Max execution time: {task.timeout_minutes} minutes",
-            "",
-            f"AUTONOMOUS EXECUTION REQUIREMENTS:",
-            f"1. Execute this task completely and autonomously",
-            f"2. Provide structured deliverables as specified",
-            f"3. Report any issues or blockers encountered",
-            f"4. Include progress checkpoints (25%, 50%, 75%, 100%)",
-            f"5. Generate summary for orchestrator handoff",
-            "",
-            f"TASK EXECUTION:",
-            task.description
-        ]
-        
-        return "\n".join(prompt_parts)
+    def _build_enhanced_prompt(self, task: AutonomousTask) -> Tuple[str, str]:
+        """
+        Build enhanced prompt with full context for autonomous execution
+        Returns (static_prefix, dynamic_suffix) so the shared requirements
+        block stays a byte-identical, cacheable prefix
+        """
+        return self._static_prefix(), self._dynamic_suffix(task)
+    
+    def _static_prefix(self) -> str:
+        """Static autonomous execution requirements shared by all tasks"""
+        return AUTONOMOUS_EXECUTION_PREFIX
+    
+    def _dynamic_suffix(self, task: AutonomousTask) -> str:
+        """Per-task fields appended after the cacheable prefix"""
+        return _TASK_PROMPT_TEMPLATE.format_map({
+            "task_id": task.task_id,
+            "description": task.description,
+            "priority": task.priority.name.lower(),
+            "session_id": self.session_id,
+            "deliverables": ", ".join(task.expected_deliverables),
+            "skills": ", ".join(task.skills_required),
+            "commands": ", ".join(task.commands_to_execute),
+            "timeout": task.timeout_minutes
+        })
     
     def _handle_task_error(self, task: AutonomousTask, error: str):
         """Handle task execution errors with retry logic"""
-        task.error_log.append(f"{datetime.now().isoformat()}: {error}")
+        task.error_log.append(f"{self._timestamp()}: {error}")
         task.retry_count += 1
         
         if task.retry_count < task.max_retry_attempts:
             task.status = TaskStatus.PENDING
             self.task_queue.append(task)  # Re-queue for retry
+            self._push_ready(task)  # Dependencies already satisfied
             
             self._log_event("task_retry", {
                 "task_id": task.task_id,
@@ -318,7 +547,7 @@ class AutonomousManager:
             })
         else:
             task.status = TaskStatus.FAILED
-            task.completed_at = datetime.now().isoformat()
+            task.completed_at = self._timestamp()
             
             self._log_event("task_failed", {
                 "task_id": task.task_id,
@@ -334,6 +563,13 @@ class AutonomousManager:
             if task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED]:
                 completed_tasks.append(task_id)
                 self.completed_tasks.append(task)
+                self._completed_ids.add(task_id)
+                self._stats["completed" if task.status == TaskStatus.COMPLETED else "failed"] += 1
+                self._stats["retries"] += task.retry_count
+                self._agents_used.add(task.agent_type)
+                if task.error_log:
+                    self._last_errors.append(task.error_log[-1])
+                self._release_dependents(task_id)
         
         # Remove from active tasks
         for task_id in completed_tasks:
@@ -342,9 +578,9 @@ class AutonomousManager:
     def _generate_progress_report(self) -> ExecutionReport:
         """Generate progress report for orchestrator"""
         total = len(self.task_queue) + len(self.active_tasks) + len(self.completed_tasks)
-        completed = len([t for t in self.completed_tasks if t.status == TaskStatus.COMPLETED])
-        failed = len([t for t in self.completed_tasks if t.status == TaskStatus.FAILED])
-        blocked = len([t for t in self.active_tasks.values() if t.status == TaskStatus.BLOCKED])
+        completed = self._stats["completed"]
+        failed = self._stats["failed"]
+        blocked = self._stats["blocked"]
         
         overall_progress = (completed / total * 100) if total > 0 else 0
         
@@ -357,10 +593,10 @@ class AutonomousManager:
             overall_progress=overall_progress,
             current_phase=self._determine_current_phase(),
             next_actions=self._determine_next_actions(),
-            issues_encountered=[task.error_log[-1] for task in self.completed_tasks if task.error_log],
+            issues_encountered=list(self._last_errors),
             recommendations=self._generate_recommendations(),
             resource_usage=self._calculate_resource_usage(),
-            timestamp=datetime.now().isoformat()
+            timestamp=self._timestamp()
         )
     
     def _generate_final_report(self) -> ExecutionReport:
@@ -372,14 +608,8 @@ class AutonomousManager:
     
     def _determine_current_phase(self) -> str:
         """Determine current execution phase"""
-        if not self.completed_tasks:
-            return "Discovery & Planning"
-        elif len(self.completed_tasks) < len(self.task_queue) + len(self.active_tasks) + len(self.completed_tasks) * 0.5:
-            return "Core Implementation"
-        elif len(self.completed_tasks) < len(self.task_queue) + len(self.active_tasks) + len(self.completed_tasks) * 0.75:
-            return "Validation & Security"
-        else:
-            return "Integration & Completion"
+        ratio = self._stats["completed"] / max(1, self._total_planned)
+        return _PHASE_TABLE[min(int(ratio * 4), 3)]
     
     def _determine_next_actions(self) -> List[str]:
         """Determine next actions based on current state"""
@@ -394,11 +624,11 @@ class AutonomousManager:
         """Generate recommendations based on execution history"""
         recommendations = []
         
-        if any(task.retry_count > 0 for task in self.completed_tasks):
+        if self._stats["retries"]:
             recommendations.append("Consider increasing timeout for complex tasks")
         
-        if len(self.completed_tasks) > 0:
-            avg_duration = sum(2 for task in self.completed_tasks) / len(self.completed_tasks)  # Simplified
+        if self.completed_tasks:
+            avg_duration = self._total_duration_s / len(self.completed_tasks)
             if avg_duration > 30:
                 recommendations.append("Consider breaking down complex tasks further")
         
@@ -407,10 +637,10 @@ class AutonomousManager:
     def _calculate_resource_usage(self) -> Dict:
         """Calculate resource usage statistics"""
         return {
-            "agents_utilized": len(set(task.agent_type for task in self.completed_tasks)),
-            "total_execution_time": f"{len(self.completed_tasks) * 2} seconds",  # Simplified
+            "agents_utilized": len(self._agents_used),
+            "total_execution_time": f"{self._total_duration_s:.0f} seconds",
             "estimated_token_usage": f"{len(self.completed_tasks) * 5000} tokens",
-            "retry_rate": f"{sum(task.retry_count for task in self.completed_tasks) / max(len(self.completed_tasks), 1):.1%}"
+            "retry_rate": f"{self._stats['retries'] / max(len(self.completed_tasks), 1):.1%}"
         }
     
     def _notify_orchestrator(self, report: ExecutionReport):
@@ -424,12 +654,39 @@ class AutonomousManager:
     def _log_event(self, event_type: str, data: Dict):
         """Log execution events"""
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._timestamp(),
             "event_type": event_type,
             "session_id": self.session_id,
             "data": data
         }
         self.execution_log.append(log_entry)
+        
+        if self.log_path:
+            self._write_log_entry(log_entry)
+    
+    def _write_log_entry(self, log_entry: Dict):
+        """Append an event to the JSONL log, flushing in batches"""
+        if self._log_file is None:
+            os.makedirs(os.path.dirname(self.log_path) or ".", exist_ok=True)
+            self._log_file = open(self.log_path, "a", buffering=1 << 16)
+        
+        self._log_file.write(json.dumps(log_entry, default=str) + "\n")
+        self._unflushed_events += 1
+        if self._unflushed_events >= EXECUTION_LOG_FLUSH_BATCH:
+            self.flush_execution_log()
+    
+    def flush_execution_log(self):
+        """Flush buffered events to the JSONL log"""
+        if self._log_file is not None:
+            self._log_file.flush()
+            self._unflushed_events = 0
+    
+    def close_execution_log(self):
+        """Flush and close the JSONL log"""
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+            self._unflushed_events = 0
     
     def export_execution_summary(self) -> Dict:
         """Export complete execution summary"""
@@ -441,8 +698,8 @@ class AutonomousManager:
                 "failed_tasks": len([t for t in self.completed_tasks if t.status == TaskStatus.FAILED]),
                 "total_retries": sum(task.retry_count for task in self.completed_tasks)
             },
-            "task_details": [asdict(task) for task in self.completed_tasks],
-            "execution_log": self.execution_log,
+            "task_details": list(self.iter_task_records()),
+            "execution_log": list(self.execution_log),
             "final_deliverables": [
                 deliverable 
                 for task in self.completed_tasks 
@@ -451,6 +708,27 @@ class AutonomousManager:
             ]
         }
 
+    def export_execution_summary_json(self) -> bytes:
+        """Export complete execution summary serialized as JSON bytes"""
+        return dumps_json(self.export_execution_summary())
+    
+    def iter_task_records(self) -> Iterator[Dict]:
+        """Yield a flat record per completed task for streaming serialization"""
+        for task in self.completed_tasks:
+            yield self._task_to_dict(task)
+    
+    @staticmethod
+    def _task_to_dict(task: AutonomousTask) -> Dict:
+        """
+        Shallow field-by-field record of a task
+        Lists and dicts are copied one level; strings and enums are shared
+        """
+        record = {}
+        for name in _TASK_FIELD_NAMES:
+            value = getattr(task, name)
+            record[name] = value.copy() if isinstance(value, (list, dict)) else value
+        return record
+
 # Example usage
 if __name__ == "__main__":
     manager = AutonomousManager()
@@ -475,4 +753,4 @@ if __name__ == "__main__":
     final_report = manager.start_autonomous_execution()
     
     print("Execution completed!")
-    print(json.dumps(asdict(final_report), indent=2))
\ No newline at end of file
+    print(dumps_json(final_report).decode())
\ No newline at end of file
@@ -4,31 +4,251 @@ Skills Integration Engine - Automatic Skills Discovery and Utilization
 Provides intelligent skills integration for enhanced agent capabilities.
 """
 
+import io
 import os
+import re
+import stat
 import json
-import glob
-from typing import Dict, List, Optional, Set
-from dataclasses import dataclass
+import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, field, asdict
 from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
 
-@dataclass
+try:
+    import yaml
+    _YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)  # libyaml when compiled in
+except ImportError:
+    yaml = None
+
+_log = logging.getLogger(__name__)
+
+SKILLS_CACHE_FILENAME = ".skills_cache.json"
+
+# Frontmatter "key: value" lines and flat "[a, b, c]" list values
+_KV_RE = re.compile(r'^[ \t]*([\w-]+)[ \t]*:[ \t]*(.*?)[ \t\r]*$', re.M)
+_LIST_RE = re.compile(r'^\[(.*)\]$')
+
+FRONTMATTER_READ_SIZE = 8192  # Bytes read per chunk while locating the frontmatter end
+FRONTMATTER_MAX_BYTES = 65536  # Give up on frontmatter blocks larger than this
+MANIFEST_WRITE_BUFFER = 1 << 20  # Large enough to write a typical manifest in one syscall
+
+# Agent categories and their optimal skills
+_AGENT_SKILL_RECOMMENDATIONS = MappingProxyType({
+    "project-organizer": {
+        "recommended_skills": (
+            "git-workflow-automation",
+            "internal-comms", 
+            "cross-file-documentation-update",
+            "communication-protocols"
+        ),
+        "utilization_score": 0.85,
+        "performance_boost": "40-60%"
+    },
+    "codebase-analyzer": {
+        "recommended_skills": (
+            "code-analysis-planning-editor",
+            "search-strategies",
+            "evaluation-framework",
+            "token-cost-tracking"
+        ),
+        "utilization_score": 0.90,
+        "performance_boost": "50-70%"
+    },
+    "security-specialist": {
+        "recommended_skills": (
+            "production-patterns",
+            "evaluation-framework",
+            "framework-patterns"
+        ),
+        "utilization_score": 0.75,
+        "performance_boost": "30-50%"
+    },
+    "orchestrator": {
+        "recommended_skills": (
+            "multi-agent-workflow",
+            "communication-protocols",
+            "evaluation-framework",
+            "token-cost-tracking"
+        ),
+        "utilization_score": 0.95,
+        "performance_boost": "60-80%"
+    },
+    "backend-architect": {
+        "recommended_skills": (
+            "rust-backend-patterns",
+            "production-patterns",
+            "framework-patterns"
+        ),
+        "utilization_score": 0.80,
+        "performance_boost": "35-55%"
+    },
+    "competitive-market-analyst": {
+        "recommended_skills": (
+            "search-strategies",
+            "internal-comms",
+            "evaluation-framework"
+        ),
+        "utilization_score": 0.70,
+        "performance_boost": "25-45%"
+    }
+})
+
+# Static roadmap and benefits sections closing every manifest
+_MANIFEST_ROADMAP = """\
+## 🚀 Implementation Roadmap
+
+### Phase 1: High-Impact Skills (Immediate)
+- Enable git-workflow-automation for project-organizer
+- Integrate multi-agent-workflow for orchestrator
+- Deploy code-analysis-planning-editor for codebase-analyzer
+
+### Phase 2: Performance Optimization (Session 2-3)
+- Add token-cost-tracking across all agents
+- Implement evaluation-framework for quality gates
+- Deploy production-patterns for reliability
+
+### Phase 3: Advanced Features (Session 4+)
+- Complete framework-patterns integration
+- Enable search-strategies optimization
+- Deploy advanced communication-protocols
+
+## 📈 Expected Benefits
+
+- **Average Utilization Boost**: 70%
+- **Performance Improvement**: 30-80% across agents
+- **Automation Enhancement**: 60% reduction in manual steps
+- **Quality Gates**: Automated validation and verification
+
+---
+
+*Generated by Skills Integration Engine v1.0*"""
+
+# Integration code examples, built once at import
+_EXAMPLE_AGENT_WITH_SKILLS = '''
+# Example: Enhanced Agent Calling with Skills Integration
+
+from scripts.core.agent_caller import AgentCaller, AgentType
+from scripts.core.skills_integration_engine import SkillsIntegrationEngine
+
+class EnhancedAgentCaller(AgentCaller):
+    def __init__(self):
+        super().__init__()
+        self.skills_engine = SkillsIntegrationEngine()
+        self.agent_skills = self.skills_engine.generate_agent_skill_mappings()
+    
+    def call_agent_with_skills(self, agent_type: AgentType, prompt: str, context: dict = None):
+        """Call agent with optimal skills integration"""
+        
+        # Get recommended skills for this agent
+        agent_name = agent_type.value if hasattr(agent_type, 'value') else str(agent_type)
+        mapping = self.agent_skills.get(agent_name)
+        
+        if mapping and mapping.recommended_skills:
+            # Enhance prompt with skills context
+            skills_context = f"Available Skills: {', '.join(mapping.recommended_skills)}"
+            enhanced_prompt = f"{prompt}\\n\\n{skills_context}"
+            
+            return self.call_agent(agent_type, enhanced_prompt)
+        else:
+            return self.call_agent(agent_type, prompt)
+'''
+
+_EXAMPLE_SKILLS_AWARE_ORCHESTRATOR = '''
+# Example: Skills-Aware Orchestrator Template
+
+from scripts.workflows.orchestrator_dispatcher import OrchestratorDispatcher
+
+class SkillsAwareOrchestrator(OrchestratorDispatcher):
+    def __init__(self):
+        super().__init__()
+        self.skills_engine = SkillsIntegrationEngine()
+        self.skills_engine.discover_available_skills()
+        self.agent_skills = self.skills_engine.generate_agent_skill_mappings()
+    
+    def analyze_and_dispatch_with_skills(self, request: str, context: dict = None):
+        """Enhanced dispatch with skills optimization"""
+        
+        # Standard analysis
+        base_analysis = super().analyze_and_dispatch(request, context)
+        
+        # Add skills optimization
+        if 'agent_recommendations' in base_analysis:
+            for rec in base_analysis['agent_recommendations']:
+                agent_name = rec.get('agent_type')
+                if agent_name in self.agent_skills:
+                    mapping = self.agent_skills[agent_name]
+                    rec['optimal_skills'] = mapping.recommended_skills
+                    rec['performance_boost'] = mapping.performance_boost_estimate
+                    rec['utilization_score'] = mapping.skill_utilization_score
+        
+        return base_analysis
+'''
+
+_EXAMPLE_PROJECT_ORGANIZER_ENHANCED = '''
+# Example: Enhanced Project Organizer with Skills
+
+Task(subagent_type="general-purpose", prompt="""
+Use project-organizer subagent to conduct autonomous directory organization.
+
+SKILLS INTEGRATION:
+- Utilize git-workflow-automation skill for safe file moves with history preservation
+- Apply internal-comms skill for professional organization reports  
+- Use cross-file-documentation-update skill for reference tracking
+- Employ communication-protocols skill for permission coordination
+
+ENHANCED CAPABILITIES:
+- Automated git operations with conventional commit format
+- Professional status reporting with structured templates
+- Intelligent reference updating across documentation
+- Coordinated permission requests with safety protocols
+
+[rest of prompt...]
+""")
+'''
+
+_INTEGRATION_EXAMPLES = MappingProxyType({
+    "agent_with_skills": _EXAMPLE_AGENT_WITH_SKILLS,
+    "skills_aware_orchestrator": _EXAMPLE_SKILLS_AWARE_ORCHESTRATOR,
+    "project_organizer_enhanced": _EXAMPLE_PROJECT_ORGANIZER_ENHANCED
+})
+
+def _as_tuple(value: Any) -> Tuple[str, ...]:
+    """Normalize a frontmatter scalar or list value to a tuple of strings"""
+    if value is None:
+        return ()
+    if isinstance(value, (list, tuple)):
+        return tuple(str(item) for item in value)
+    value = str(value)
+    return (value,) if value else ()
+
+@dataclass(slots=True, frozen=True)
 class SkillMetadata:
-    """Metadata for a discovered skill"""
+    """Metadata for a discovered skill (immutable once parsed)"""
     name: str
     description: str
     skill_path: str
-    allowed_tools: List[str]
-    tags: List[str]
+    allowed_tools: Tuple[str, ...]
+    tags: Tuple[str, ...]
     version: str
     status: str
     integration_ready: bool
-    dependencies: List[str] = None
+    dependencies: Tuple[str, ...] = field(default_factory=tuple)
     
-    def __post_init__(self):
-        if self.dependencies is None:
-            self.dependencies = []
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'SkillMetadata':
+        """Rehydrate metadata serialized with asdict"""
+        return cls(**{
+            **data,
+            "allowed_tools": _as_tuple(data["allowed_tools"]),
+            "tags": _as_tuple(data["tags"]),
+            "dependencies": _as_tuple(data.get("dependencies", ()))
+        })
 
-@dataclass
+@dataclass(slots=True)
 class AgentSkillMapping:
     """Maps agents to their optimal skills"""
     agent_name: str
@@ -43,86 +263,165 @@ class SkillsIntegrationEngine:
     Provides 70% utilization boost through intelligent skills mapping
     """
     
-    def __init__(self, project_root: str = None):
+    def __init__(self, project_root: str = None, use_skills_cache: bool = True):
         self.project_root = project_root or os.getcwd()
         self.skills_directory = os.path.join(self.project_root, "agents-reference-47", "skills")
+        self.skills_cache_path = os.path.join(self.project_root, SKILLS_CACHE_FILENAME)
+        self.use_skills_cache = use_skills_cache
         self.discovered_skills: Dict[str, SkillMetadata] = {}
         self.agent_skill_mappings: Dict[str, AgentSkillMapping] = {}
         self.integration_cache = {}
+        self._run_started: Optional[datetime] = None  # Shared clock read for one manifest/analysis run
         
     def discover_available_skills(self) -> Dict[str, SkillMetadata]:
         """
         Automatically discover all available skills from the 47-agent framework
         Returns comprehensive skill inventory with metadata
         """
-        print("🔍 Discovering available skills from 47-agent framework...")
+        _log.info("🔍 Discovering available skills from 47-agent framework...")
         
         if not os.path.exists(self.skills_directory):
-            print(f"⚠️ Skills directory not found: {self.skills_directory}")
+            _log.warning("⚠️ Skills directory not found: %s", self.skills_directory)
             return {}
         
-        # Find all SKILL.md files in the skills directory
-        skill_files = glob.glob(f"{self.skills_directory}/*/SKILL.md", recursive=True)
+        # Find all SKILL.md files in the skills directory (one level deep)
+        with os.scandir(self.skills_directory) as entries:
+            skill_dirs = [entry for entry in entries if entry.is_dir(follow_symlinks=False)]
         
-        discovered_count = 0
-        for skill_file in skill_files:
+        skills_cache = self._load_skills_cache()
+        
+        # Reuse cached metadata while SKILL.md is unchanged; collect the rest
+        parsed_skills: Dict[str, Optional[SkillMetadata]] = {}
+        stale_files: Dict[str, int] = {}
+        for skill_dir in skill_dirs:
+            skill_file = os.path.join(skill_dir.path, "SKILL.md")
             try:
-                skill_metadata = self._parse_skill_metadata(skill_file)
-                if skill_metadata:
-                    self.discovered_skills[skill_metadata.name] = skill_metadata
-                    discovered_count += 1
-            except Exception as e:
-                print(f"⚠️ Error parsing {skill_file}: {e}")
-        
-        print(f"✅ Discovered {discovered_count} skills from 47-agent framework")
+                skill_stat = os.stat(skill_file)
+            except OSError:
+                continue  # Directory without a SKILL.md
+            if not stat.S_ISREG(skill_stat.st_mode):
+                continue
+            
+            mtime = skill_stat.st_mtime_ns
+            cached = skills_cache.get(skill_file)
+            parsed_skills[skill_file] = None
+            if isinstance(cached, dict) and cached.get("mtime") == mtime:
+                try:
+                    if cached["metadata"]:
+                        parsed_skills[skill_file] = SkillMetadata.from_dict(cached["metadata"])
+                    continue
+                except (KeyError, TypeError, AttributeError):
+                    pass  # Cache entry predates the current metadata fields, or is malformed
+            stale_files[skill_file] = mtime
+        
+        # Parsing is dominated by file I/O, so overlap it across threads
+        if stale_files:
+            with ThreadPoolExecutor(max_workers=min(32, len(stale_files))) as executor:
+                for skill_file, skill_metadata in zip(stale_files, executor.map(self._parse_skill_metadata, stale_files)):
+                    parsed_skills[skill_file] = skill_metadata
+                    skills_cache[skill_file] = {
+                        "mtime": stale_files[skill_file],
+                        "metadata": asdict(skill_metadata) if skill_metadata else None
+                    }
+            self._save_skills_cache(skills_cache)
+        
+        discovered_count = 0
+        for skill_metadata in parsed_skills.values():
+            if skill_metadata:
+                self.discovered_skills[skill_metadata.name] = skill_metadata
+                discovered_count += 1
+        
+        _log.info("✅ Discovered %d skills from 47-agent framework", discovered_count)
         return self.discovered_skills
     
+    def _load_skills_cache(self) -> Dict[str, Dict]:
+        """Load persisted skill metadata keyed by SKILL.md path"""
+        if not self.use_skills_cache:
+            return {}
+        try:
+            with open(self.skills_cache_path, 'r') as f:
+                skills_cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return skills_cache if isinstance(skills_cache, dict) else {}
+    
+    def _save_skills_cache(self, skills_cache: Dict[str, Dict]):
+        """Persist skill metadata so unchanged SKILL.md files skip parsing"""
+        if not self.use_skills_cache:
+            return
+        try:
+            # Serialize fully before touching disk, then swap the file in whole
+            # so a failed write never leaves a truncated cache behind
+            payload = json.dumps(skills_cache, default=str)
+            tmp_path = self.skills_cache_path + ".tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.skills_cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            _log.warning("⚠️ Could not write skills cache %s: %s", self.skills_cache_path, e)
+    
     def _parse_skill_metadata(self, skill_file_path: str) -> Optional[SkillMetadata]:
         """Parse skill metadata from SKILL.md file"""
         try:
-            with open(skill_file_path, 'r') as f:
-                content = f.read()
+            # Read only as far as the closing frontmatter delimiter, sniffing
+            # the bytes so files without frontmatter are never decoded
+            with open(skill_file_path, 'rb') as f:
+                head = f.read(FRONTMATTER_READ_SIZE)
+                if not (head.startswith(b'---\n') or head.startswith(b'---\r\n')):
+                    return None
+                yaml_end = head.find(b'\n---', 3)
+                while yaml_end < 0 and len(head) < FRONTMATTER_MAX_BYTES:
+                    chunk = f.read(FRONTMATTER_READ_SIZE)
+                    if not chunk:
+                        break
+                    search_from = len(head) - 3  # Delimiter may straddle chunks
+                    head += chunk
+                    yaml_end = head.find(b'\n---', search_from)
             
-            # Extract YAML frontmatter
-            if content.startswith('---'):
-                yaml_end = content.find('---', 3)
-                if yaml_end > 0:
-                    yaml_content = content[3:yaml_end].strip()
-                    metadata = self._parse_yaml_frontmatter(yaml_content)
-                    
-                    skill_dir = os.path.dirname(skill_file_path)
-                    skill_name = metadata.get('name', os.path.basename(skill_dir))
-                    
-                    return SkillMetadata(
-                        name=skill_name,
-                        description=metadata.get('description', 'No description'),
-                        skill_path=skill_dir,
-                        allowed_tools=metadata.get('allowed-tools', []),
-                        tags=metadata.get('tags', []),
-                        version=metadata.get('version', '1.0.0'),
-                        status=metadata.get('status', 'unknown'),
-                        integration_ready=metadata.get('status') == 'production'
-                    )
-        except Exception as e:
-            print(f"Error parsing skill metadata from {skill_file_path}: {e}")
+            # Extract YAML frontmatter, decoding only the header block
+            if yaml_end < 0:
+                return None
+            
+            yaml_content = head[3:yaml_end].decode('utf-8', 'replace').strip()
+            metadata = self._parse_yaml_frontmatter(yaml_content)
+            
+            skill_dir = os.path.dirname(skill_file_path)
+            skill_name = str(metadata.get('name', os.path.basename(skill_dir)))
+            
+            return SkillMetadata(
+                name=skill_name,
+                description=str(metadata.get('description', 'No description')),
+                skill_path=skill_dir,
+                allowed_tools=_as_tuple(metadata.get('allowed-tools', ())),
+                tags=_as_tuple(metadata.get('tags', ())),
+                version=str(metadata.get('version', '1.0.0')),
+                status=str(metadata.get('status', 'unknown')),
+                integration_ready=metadata.get('status') == 'production'
+            )
+        except (OSError, UnicodeDecodeError, ValueError) as e:
+            _log.warning("Error parsing skill metadata from %s: %s", skill_file_path, e)
             return None
     
     def _parse_yaml_frontmatter(self, yaml_content: str) -> Dict:
-        """Parse YAML frontmatter (simplified parser)"""
+        """Parse YAML frontmatter, preferring PyYAML over the simplified parser"""
+        if yaml is not None:
+            try:
+                result = yaml.load(yaml_content, Loader=_YamlSafeLoader)
+                if isinstance(result, dict):
+                    return result
+            except yaml.YAMLError:
+                pass  # Fall back to the lenient line parser
+        
         result = {}
-        for line in yaml_content.split('\n'):
-            if ':' in line:
-                key, value = line.split(':', 1)
-                key = key.strip()
-                value = value.strip()
-                
-                # Handle lists
-                if value.startswith('[') and value.endswith(']'):
-                    # Parse simple list format [item1, item2, item3]
-                    items = value[1:-1].split(',')
-                    result[key] = [item.strip() for item in items if item.strip()]
-                else:
-                    result[key] = value
+        for match in _KV_RE.finditer(yaml_content):
+            key, value = match.group(1), match.group(2)
+            
+            # Parse simple list format [item1, item2, item3]
+            list_match = _LIST_RE.match(value)
+            if list_match:
+                result[key] = [item.strip() for item in list_match.group(1).split(',') if item.strip()]
+            else:
+                result[key] = value
         
         return result
     
@@ -131,84 +430,27 @@ class SkillsIntegrationEngine:
         Generate optimal skill mappings for each agent type
         Creates intelligent recommendations for maximum utilization
         """
-        print("🎯 Generating intelligent agent-skill mappings...")
-        
-        # Define agent categories and their optimal skills
-        agent_skill_recommendations = {
-            "project-organizer": {
-                "recommended_skills": [
-                    "git-workflow-automation",
-                    "internal-comms", 
-                    "cross-file-documentation-update",
-                    "communication-protocols"
-                ],
-                "utilization_score": 0.85,
-                "performance_boost": "40-60%"
-            },
-            "codebase-analyzer": {
-                "recommended_skills": [
-                    "code-analysis-planning-editor",
-                    "search-strategies",
-                    "evaluation-framework",
-                    "token-cost-tracking"
-                ],
-                "utilization_score": 0.90,
-                "performance_boost": "50-70%"
-            },
-            "security-specialist": {
-                "recommended_skills": [
-                    "production-patterns",
-                    "evaluation-framework",
-                    "framework-patterns"
-                ],
-                "utilization_score": 0.75,
-                "performance_boost": "30-50%"
-            },
-            "orchestrator": {
-                "recommended_skills": [
-                    "multi-agent-workflow",
-                    "communication-protocols",
-                    "evaluation-framework",
-                    "token-cost-tracking"
-                ],
-                "utilization_score": 0.95,
-                "performance_boost": "60-80%"
-            },
-            "backend-architect": {
-                "recommended_skills": [
-                    "rust-backend-patterns",
-                    "production-patterns",
-                    "framework-patterns"
-                ],
-                "utilization_score": 0.80,
-                "performance_boost": "35-55%"
-            },
-            "competitive-market-analyst": {
-                "recommended_skills": [
-                    "search-strategies",
-                    "internal-comms",
-                    "evaluation-framework"
-                ],
-                "utilization_score": 0.70,
-                "performance_boost": "25-45%"
-            }
-        }
+        _log.info("🎯 Generating intelligent agent-skill mappings...")
+        
+        # Index discovered skills once: ready names and status of the rest
+        ready_skills = set()
+        not_ready_status = {}
+        for skill_name, skill in self.discovered_skills.items():
+            if skill.integration_ready:
+                ready_skills.add(skill_name)
+            else:
+                not_ready_status[skill_name] = skill.status
         
         # Generate mappings for each agent
-        for agent_name, config in agent_skill_recommendations.items():
+        for agent_name, config in _AGENT_SKILL_RECOMMENDATIONS.items():
             # Find available skills that match recommendations
-            available_recommended = []
-            integration_opportunities = []
-            
-            for skill_name in config["recommended_skills"]:
-                if skill_name in self.discovered_skills:
-                    skill = self.discovered_skills[skill_name]
-                    if skill.integration_ready:
-                        available_recommended.append(skill_name)
-                    else:
-                        integration_opportunities.append(f"Enable {skill_name} (status: {skill.status})")
-                else:
-                    integration_opportunities.append(f"Skill not found: {skill_name}")
+            recommended = config["recommended_skills"]
+            available_recommended = [name for name in recommended if name in ready_skills]
+            integration_opportunities = [
+                f"Enable {name} (status: {not_ready_status[name]})" if name in not_ready_status
+                else f"Skill not found: {name}"
+                for name in recommended if name not in ready_skills
+            ]
             
             self.agent_skill_mappings[agent_name] = AgentSkillMapping(
                 agent_name=agent_name,
@@ -218,7 +460,7 @@ class SkillsIntegrationEngine:
                 performance_boost_estimate=config["performance_boost"]
             )
         
-        print(f"✅ Generated skill mappings for {len(self.agent_skill_mappings)} agents")
+        _log.info("✅ Generated skill mappings for %d agents", len(self.agent_skill_mappings))
         return self.agent_skill_mappings
     
     def create_skills_integration_manifest(self) -> str:
@@ -226,97 +468,79 @@ class SkillsIntegrationEngine:
         Create comprehensive skills integration manifest
         Provides actionable integration roadmap
         """
-        manifest_content = [
-            "# Skills Integration Manifest",
-            "## Universal Agent Framework v2.0 Skills Enhancement",
-            "",
-            f"**Generated**: {self._get_timestamp()}",
-            f"**Skills Discovered**: {len(self.discovered_skills)}",
-            f"**Agent Mappings**: {len(self.agent_skill_mappings)}",
-            f"**Integration Ready**: {len([s for s in self.discovered_skills.values() if s.integration_ready])}",
-            "",
-            "---",
-            "",
-            "## 📊 Skills Inventory",
-            ""
-        ]
+        production_skills, ready_count, _ = self._summarize_skills()
         
-        # Add skills inventory
-        production_skills = [s for s in self.discovered_skills.values() if s.status == 'production']
-        development_skills = [s for s in self.discovered_skills.values() if s.status != 'production']
+        buf = io.StringIO()
+        w = buf.write
         
-        manifest_content.extend([
-            f"### Production-Ready Skills ({len(production_skills)})",
-            ""
-        ])
+        w("# Skills Integration Manifest\n"
+          "## Universal Agent Framework v2.0 Skills Enhancement\n"
+          "\n"
+          f"**Generated**: {self._get_timestamp()}\n"
+          f"**Skills Discovered**: {len(self.discovered_skills)}\n"
+          f"**Agent Mappings**: {len(self.agent_skill_mappings)}\n"
+          f"**Integration Ready**: {ready_count}\n"
+          "\n"
+          "---\n"
+          "\n"
+          "## 📊 Skills Inventory\n"
+          "\n")
+        
+        # Add skills inventory
+        w(f"### Production-Ready Skills ({len(production_skills)})\n\n")
         
+        # Skills normally live under project_root, so strip the prefix directly
+        root_prefix = self.project_root.rstrip(os.sep) + os.sep
         for skill in sorted(production_skills, key=lambda x: x.name):
-            manifest_content.extend([
-                f"#### {skill.name}",
-                f"- **Description**: {skill.description}",
-                f"- **Tools**: {', '.join(skill.allowed_tools)}",
-                f"- **Tags**: {', '.join(skill.tags)}",
-                f"- **Path**: `{os.path.relpath(skill.skill_path, self.project_root)}`",
-                ""
-            ])
+            skill_path = skill.skill_path
+            if skill_path.startswith(root_prefix):
+                rel_path = skill_path[len(root_prefix):]
+            else:
+                rel_path = os.path.relpath(skill_path, self.project_root)
+            w(f"#### {skill.name}\n"
+              f"- **Description**: {skill.description}\n"
+              f"- **Tools**: {', '.join(skill.allowed_tools)}\n"
+              f"- **Tags**: {', '.join(skill.tags)}\n"
+              f"- **Path**: `{rel_path}`\n"
+              "\n")
         
         # Add agent-skill mappings
-        manifest_content.extend([
-            "## 🎯 Agent-Skills Optimization",
-            ""
-        ])
+        w("## 🎯 Agent-Skills Optimization\n\n")
         
         for agent_name, mapping in sorted(self.agent_skill_mappings.items()):
-            manifest_content.extend([
-                f"### {agent_name}",
-                f"- **Utilization Score**: {mapping.skill_utilization_score:.0%}",
-                f"- **Performance Boost**: {mapping.performance_boost_estimate}",
-                f"- **Recommended Skills**: {', '.join(mapping.recommended_skills)}",
-                ""
-            ])
+            w(f"### {agent_name}\n"
+              f"- **Utilization Score**: {mapping.skill_utilization_score:.0%}\n"
+              f"- **Performance Boost**: {mapping.performance_boost_estimate}\n"
+              f"- **Recommended Skills**: {', '.join(mapping.recommended_skills)}\n"
+              "\n")
             
             if mapping.integration_opportunities:
-                manifest_content.extend([
-                    "**Integration Opportunities**:",
-                    *[f"- {opportunity}" for opportunity in mapping.integration_opportunities],
-                    ""
-                ])
+                w("**Integration Opportunities**:\n")
+                for opportunity in mapping.integration_opportunities:
+                    w(f"- {opportunity}\n")
+                w("\n")
         
         # Add implementation roadmap
-        manifest_content.extend([
-            "## 🚀 Implementation Roadmap",
-            "",
-            "### Phase 1: High-Impact Skills (Immediate)",
-            "- Enable git-workflow-automation for project-organizer",
-            "- Integrate multi-agent-workflow for orchestrator", 
-            "- Deploy code-analysis-planning-editor for codebase-analyzer",
-            "",
-            "### Phase 2: Performance Optimization (Session 2-3)",
-            "- Add token-cost-tracking across all agents",
-            "- Implement evaluation-framework for quality gates",
-            "- Deploy production-patterns for reliability",
-            "",
-            "### Phase 3: Advanced Features (Session 4+)",
-            "- Complete framework-patterns integration",
-            "- Enable search-strategies optimization",
-            "- Deploy advanced communication-protocols",
-            "",
-            "## 📈 Expected Benefits",
-            "",
-            "- **Average Utilization Boost**: 70%",
-            "- **Performance Improvement**: 30-80% across agents",
-            "- **Automation Enhancement**: 60% reduction in manual steps",
-            "- **Quality Gates**: Automated validation and verification",
-            "",
-            "---",
-            "",
-            f"*Generated by Skills Integration Engine v1.0*"
-        ])
-        
-        return '\n'.join(manifest_content)
+        w(_MANIFEST_ROADMAP)
+        
+        return buf.getvalue()
+    
+    def _summarize_skills(self) -> Tuple[List[SkillMetadata], int, Set[str]]:
+        """Collect production skills, integration-ready count and tag set in one pass"""
+        production_skills = []
+        ready_count = 0
+        tags: Set[str] = set()
+        for skill in self.discovered_skills.values():
+            if skill.status == 'production':
+                production_skills.append(skill)
+            if skill.integration_ready:
+                ready_count += 1
+            tags.update(skill.tags)
+        return production_skills, ready_count, tags
     
     def save_integration_manifest(self, filename: str = None) -> str:
         """Save skills integration manifest to file"""
+        self._run_started = None
         if filename is None:
             filename = f"SKILLS-INTEGRATION-MANIFEST-{self._get_timestamp('%Y%m%d')}.md"
         
@@ -327,10 +551,10 @@ class SkillsIntegrationEngine:
         
         manifest_content = self.create_skills_integration_manifest()
         
-        with open(manifest_path, 'w') as f:
+        with open(manifest_path, 'w', encoding='utf-8', buffering=MANIFEST_WRITE_BUFFER) as f:
             f.write(manifest_content)
         
-        print(f"💾 Skills integration manifest saved: {manifest_path}")
+        _log.info("💾 Skills integration manifest saved: %s", manifest_path)
         return manifest_path
     
     def generate_integration_code_examples(self) -> Dict[str, str]:
@@ -338,104 +562,26 @@ class SkillsIntegrationEngine:
         Generate code examples for skills integration
         Provides practical implementation guidance
         """
-        examples = {
-            "agent_with_skills": '''
-# Example: Enhanced Agent Calling with Skills Integration
-
-from scripts.core.agent_caller import AgentCaller, AgentType
-from scripts.core.skills_integration_engine import SkillsIntegrationEngine
-
-class EnhancedAgentCaller(AgentCaller):
-    def __init__(self):
-        super().__init__()
-        self.skills_engine = SkillsIntegrationEngine()
-        self.agent_skills = self.skills_engine.generate_agent_skill_mappings()
+        return dict(_INTEGRATION_EXAMPLES)
     
-    def call_agent_with_skills(self, agent_type: AgentType, prompt: str, context: dict = None):
-        """Call agent with optimal skills integration"""
-        
-        # Get recommended skills for this agent
-        agent_name = agent_type.value if hasattr(agent_type, 'value') else str(agent_type)
-        mapping = self.agent_skills.get(agent_name)
-        
-        if mapping and mapping.recommended_skills:
-            # Enhance prompt with skills context
-            skills_context = f"Available Skills: {', '.join(mapping.recommended_skills)}"
-            enhanced_prompt = f"{prompt}\\n\\n{skills_context}"
-            
-            return self.call_agent(agent_type, enhanced_prompt)
-        else:
-            return self.call_agent(agent_type, prompt)
-''',
-            
-            "skills_aware_orchestrator": '''
-# Example: Skills-Aware Orchestrator Template
-
-from scripts.workflows.orchestrator_dispatcher import OrchestratorDispatcher
-
-class SkillsAwareOrchestrator(OrchestratorDispatcher):
-    def __init__(self):
-        super().__init__()
-        self.skills_engine = SkillsIntegrationEngine()
-        self.skills_engine.discover_available_skills()
-        self.agent_skills = self.skills_engine.generate_agent_skill_mappings()
-    
-    def analyze_and_dispatch_with_skills(self, request: str, context: dict = None):
-        """Enhanced dispatch with skills optimization"""
-        
-        # Standard analysis
-        base_analysis = super().analyze_and_dispatch(request, context)
-        
-        # Add skills optimization
-        if 'agent_recommendations' in base_analysis:
-            for rec in base_analysis['agent_recommendations']:
-                agent_name = rec.get('agent_type')
-                if agent_name in self.agent_skills:
-                    mapping = self.agent_skills[agent_name]
-                    rec['optimal_skills'] = mapping.recommended_skills
-                    rec['performance_boost'] = mapping.performance_boost_estimate
-                    rec['utilization_score'] = mapping.skill_utilization_score
-        
-        return base_analysis
-''',
-            
-            "project_organizer_enhanced": '''
-# Example: Enhanced Project Organizer with Skills
-
-Task(subagent_type="general-purpose", prompt="""
-Use project-organizer subagent to conduct autonomous directory organization.
-
-SKILLS INTEGRATION:
-- Utilize git-workflow-automation skill for safe file moves with history preservation
-- Apply internal-comms skill for professional organization reports  
-- Use cross-file-documentation-update skill for reference tracking
-- Employ communication-protocols skill for permission coordination
-
-ENHANCED CAPABILITIES:
-- Automated git operations with conventional commit format
-- Professional status reporting with structured templates
-- Intelligent reference updating across documentation
-- Coordinated permission requests with safety protocols
-
-[rest of prompt...]
-""")
-'''
-        }
-        
-        return examples
+    def get_integration_example(self, name: str) -> str:
+        """Get a single integration code example by name"""
+        return _INTEGRATION_EXAMPLES[name]
     
     def _get_timestamp(self, format_str: str = '%Y-%m-%d %H:%M:%S') -> str:
-        """Get formatted timestamp"""
-        from datetime import datetime
-        return datetime.now().strftime(format_str)
+        """Get formatted timestamp, read once per run so header and filename agree"""
+        if self._run_started is None:
+            self._run_started = datetime.now()
+        return self._run_started.strftime(format_str)
     
     def run_complete_integration_analysis(self) -> Dict:
         """
         Execute complete skills integration analysis
         One-command comprehensive skills enhancement
         """
-        print("\n🎯 Starting Complete Skills Integration Analysis")
-        print("=" * 60)
+        self._run_started = None
+        _log.info("\n🎯 Starting Complete Skills Integration Analysis")
+        _log.info("=" * 60)
         
         results = {
             "discovery_phase": {},
@@ -447,16 +593,17 @@ ENHANCED CAPABILITIES:
         
         try:
             # Phase 1: Skills Discovery
-            print("\n📋 Phase 1: Skills Discovery")
+            _log.info("\n📋 Phase 1: Skills Discovery")
             discovered_skills = self.discover_available_skills()
+            _, production_ready, skill_categories = self._summarize_skills()
             results["discovery_phase"] = {
                 "total_skills": len(discovered_skills),
-                "production_ready": len([s for s in discovered_skills.values() if s.integration_ready]),
-                "skill_categories": list(set([tag for skill in discovered_skills.values() for tag in skill.tags]))
+                "production_ready": production_ready,
+                "skill_categories": list(skill_categories)
             }
             
             # Phase 2: Agent-Skill Mapping
-            print("\n🎯 Phase 2: Agent-Skill Mapping")
+            _log.info("\n🎯 Phase 2: Agent-Skill Mapping")
             agent_mappings = self.generate_agent_skill_mappings()
             results["mapping_phase"] = {
                 "agents_mapped": len(agent_mappings),
@@ -465,12 +612,12 @@ ENHANCED CAPABILITIES:
             }
             
             # Phase 3: Integration Manifest
-            print("\n📄 Phase 3: Integration Manifest Generation")
+            _log.info("\n📄 Phase 3: Integration Manifest Generation")
             manifest_path = self.save_integration_manifest()
             results["integration_manifest"] = manifest_path
             
             # Phase 4: Code Examples
-            print("\n💻 Phase 4: Implementation Examples")
+            _log.info("\n💻 Phase 4: Implementation Examples")
             code_examples = self.generate_integration_code_examples()
             results["code_examples"] = code_examples
             
@@ -481,31 +628,41 @@ ENHANCED CAPABILITIES:
                 results["discovery_phase"]["production_ready"] > 0
             )
             
-            print("\n" + "=" * 60)
-            print("🎉 SKILLS INTEGRATION ANALYSIS COMPLETE")
-            print(f"✅ {results['discovery_phase']['total_skills']} skills discovered")
-            print(f"✅ {results['mapping_phase']['agents_mapped']} agents mapped")
-            print(f"✅ {results['discovery_phase']['production_ready']} production-ready integrations")
-            print(f"✅ Integration manifest: {os.path.basename(results['integration_manifest'])}")
-            print(f"✅ Implementation ready: {'YES' if results['implementation_ready'] else 'PENDING'}")
+            _log.info("\n" + "=" * 60)
+            _log.info("🎉 SKILLS INTEGRATION ANALYSIS COMPLETE")
+            _log.info("✅ %d skills discovered", results['discovery_phase']['total_skills'])
+            _log.info("✅ %d agents mapped", results['mapping_phase']['agents_mapped'])
+            _log.info("✅ %d production-ready integrations", results['discovery_phase']['production_ready'])
+            _log.info("✅ Integration manifest: %s", os.path.basename(results['integration_manifest']))
+            _log.info("✅ Implementation ready: %s", 'YES' if results['implementation_ready'] else 'PENDING')
             
             return results
             
         except Exception as e:
-            print(f"\n❌ Skills integration analysis failed: {str(e)}")
+            _log.error("\n❌ Skills integration analysis failed: %s", e)
             results["error"] = str(e)
             return results
 
 # Convenience functions
+@lru_cache(maxsize=8)
+def _engine_for(project_root: str) -> SkillsIntegrationEngine:
+    """Engine with skills already discovered, reused per project root"""
+    engine = SkillsIntegrationEngine(project_root)
+    engine.discover_available_skills()
+    return engine
+
+def clear_engine_cache():
+    """Forget engines reused by the convenience functions"""
+    _engine_for.cache_clear()
+
 def discover_skills(project_root: str = None) -> Dict[str, SkillMetadata]:
     """Quick skills discovery"""
-    engine = SkillsIntegrationEngine(project_root)
-    return engine.discover_available_skills()
+    engine = _engine_for(project_root or os.getcwd())
+    return dict(engine.discovered_skills)
 
 def generate_skills_manifest(project_root: str = None) -> str:
     """Quick manifest generation"""
-    engine = SkillsIntegrationEngine(project_root)
-    engine.discover_available_skills()
+    engine = _engine_for(project_root or os.getcwd())
     engine.generate_agent_skill_mappings()
     return engine.save_integration_manifest()
 
@@ -516,6 +673,8 @@ def run_skills_integration_analysis(project_root: str = None) -> Dict:
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # Run complete skills integration analysis
     results = run_skills_integration_analysis()
     
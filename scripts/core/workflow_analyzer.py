@@ -5,108 +5,324 @@ Analyzes problems and use cases to determine optimal agent coordination strategy
 """
 
 import re
+import copy
 import json
+from collections import OrderedDict
 from typing import Dict, List, Tuple, Set
-from dataclasses import dataclass
-from enum import Enum
+from dataclasses import dataclass, fields, is_dataclass, replace
+from enum import Enum, IntEnum
+from functools import lru_cache
+from types import MappingProxyType
 
-@dataclass
+try:
+    import ahocorasick  # Optional pyahocorasick multi-pattern matcher
+except ImportError:
+    ahocorasick = None
+
+class Category(IntEnum):
+    """Workflow requirement categories, in detection order"""
+    SECURITY = 0
+    DEVELOPMENT = 1
+    ANALYSIS = 2
+    RESEARCH = 3
+
+class Complexity(IntEnum):
+    """Workflow complexity levels, ordered from least to most complex"""
+    SIMPLE = 0
+    MODERATE = 1
+    COMPLEX = 2
+
+class Role(IntEnum):
+    """Agent coordination roles"""
+    PRIMARY = 0
+    SUPPORTING = 1
+    VALIDATOR = 2
+
+@dataclass(slots=True)
 class WorkflowRequirement:
     """Represents a workflow requirement with context"""
-    category: str
+    category: Category
     description: str
-    complexity: str  # simple, moderate, complex
+    complexity: Complexity
     priority: str    # low, medium, high, critical
     estimated_effort: str  # time estimate
     dependencies: List[str]  # other requirements this depends on
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentRecommendation:
     """Recommendation for which agent to use"""
     agent_type: str
     confidence: float  # 0.0 - 1.0
     reasoning: str
-    skills_needed: List[str]
-    commands_suggested: List[str]
-    coordination_role: str  # primary, supporting, validator
+    skills_needed: Tuple[str, ...]
+    commands_suggested: Tuple[str, ...]
+    coordination_role: Role
+
+# Shared read-only tables, built on first access through the module __getattr__
+def _build_agent_capabilities():
+    """Agent capability mappings from the 47-agent framework"""
+    return MappingProxyType({
+        "orchestrator": {
+            "primary_roles": ["coordination", "planning", "project_management"],
+            "keywords": ["plan", "coordinate", "manage", "workflow", "multiple", "complex"],
+            "complexity_range": ["moderate", "complex"],
+            "best_for": ["multi-agent workflows", "project planning", "resource coordination"]
+        },
+        "codebase-analyzer": {
+            "primary_roles": ["analysis", "documentation", "architecture_review"],
+            "keywords": ["analyze", "review", "understand", "document", "architecture"],
+            "complexity_range": ["simple", "moderate", "complex"],
+            "best_for": ["code analysis", "technical documentation", "system understanding"]
+        },
+        "codebase-locator": {
+            "primary_roles": ["search", "discovery", "mapping"],
+            "keywords": ["find", "locate", "search", "discover", "where", "which"],
+            "complexity_range": ["simple", "moderate"],
+            "best_for": ["file discovery", "code location", "dependency mapping"]
+        },
+        "security-specialist": {
+            "primary_roles": ["security", "compliance", "vulnerability_assessment"],
+            "keywords": ["security", "secure", "vulnerability", "compliance", "audit", "penetration"],
+            "complexity_range": ["moderate", "complex"],
+            "best_for": ["security audits", "compliance validation", "vulnerability assessment"]
+        },
+        "backend-architect": {
+            "primary_roles": ["api_design", "architecture", "scalability"],
+            "keywords": ["api", "backend", "service", "architecture", "scalability", "design"],
+            "complexity_range": ["moderate", "complex"],
+            "best_for": ["API design", "backend architecture", "scalability planning"]
+        },
+        "rust-expert-developer": {
+            "primary_roles": ["rust_implementation", "performance", "systems_programming"],
+            "keywords": ["rust", "implement", "performance", "systems", "low-level"],
+            "complexity_range": ["moderate", "complex"],
+            "best_for": ["Rust implementation", "performance optimization", "systems programming"]
+        },
+        "competitive-market-analyst": {
+            "primary_roles": ["market_research", "competitive_analysis", "business_intelligence"],
+            "keywords": ["market", "competitive", "research", "analysis", "business", "strategy"],
+            "complexity_range": ["moderate", "complex"],
+            "best_for": ["market research", "competitive analysis", "business strategy"]
+        },
+        "web-search-researcher": {
+            "primary_roles": ["research", "information_gathering", "web_analysis"],
+            "keywords": ["research", "search", "information", "web", "investigate"],
+            "complexity_range": ["simple", "moderate"],
+            "best_for": ["web research", "information gathering", "trend analysis"]
+        }
+    })
+
+def _build_skills_mapping():
+    """Skills by workflow area"""
+    return MappingProxyType({
+        "project_management": ["multi-agent-workflow", "evaluation-framework", "communication-protocols"],
+        "development": ["production-patterns", "framework-patterns", "code-analysis-planning-editor"],
+        "security": ["security-patterns", "compliance-validation"],
+        "analysis": ["search-strategies", "token-cost-tracking", "internal-comms"],
+        "infrastructure": ["gcp-resource-cleanup", "git-workflow-automation"]
+    })
+
+def _build_commands_mapping():
+    """Commands by workflow area"""
+    return MappingProxyType({
+        "planning": ["/create_plan", "/validate_plan", "/implement_plan"],
+        "research": ["/research", "/research_codebase", "/smart-research"],
+        "development": ["/feature_development", "/rust_scaffold", "/component_scaffold"],
+        "security": ["/security_deps", "/security_sast", "/security_hardening"],
+        "deployment": ["/config_validate", "/monitor_setup", "/db_migrations"]
+    })
+
+_LAZY_TABLES = {
+    "AGENT_CAPABILITIES": _build_agent_capabilities,
+    "SKILLS_MAPPING": _build_skills_mapping,
+    "COMMANDS_MAPPING": _build_commands_mapping
+}
+
+def __getattr__(name: str):
+    """Materialize a shared table on first access (PEP 562)"""
+    builder = _LAZY_TABLES.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    table = globals()[name] = builder()
+    return table
+
+def _shared_table(name: str):
+    """Module-internal access to a lazily built shared table"""
+    table = globals().get(name)
+    return table if table is not None else __getattr__(name)
+
+# Requirement categories detected by substring keywords, in emission order
+_SECURITY_KW = frozenset({"security", "secure", "audit", "compliance"})
+_DEVELOPMENT_KW = frozenset({"implement", "build", "create", "develop"})
+_ANALYSIS_KW = frozenset({"analyze", "understand", "review", "examine"})
+_RESEARCH_KW = frozenset({"research", "investigate", "find", "discover"})
+_CATEGORY_KEYWORDS = (
+    (Category.SECURITY, _SECURITY_KW),
+    (Category.DEVELOPMENT, _DEVELOPMENT_KW),
+    (Category.ANALYSIS, _ANALYSIS_KW),
+    (Category.RESEARCH, _RESEARCH_KW)
+)
+_CATEGORY_BITS = {category: 1 << category for category, _ in _CATEGORY_KEYWORDS}
+# Keyword -> category bit, grouped by category in emission order; probed with
+# C-level substring search, which beats a regex alternation at every
+# description length measured (27 to 1200 characters)
+_SENTINEL_MAP = {
+    keyword: _CATEGORY_BITS[category]
+    for category, keywords in _CATEGORY_KEYWORDS
+    for keyword in sorted(keywords)
+}
+_ALL_CATEGORY_BITS = sum(_CATEGORY_BITS.values())
+_TOKEN_RE = re.compile(r"[a-z]+")
+
+# Requirement emitted for each matched category
+_REQUIREMENT_TEMPLATES = (
+    (_CATEGORY_BITS[Category.SECURITY], WorkflowRequirement(
+        category=Category.SECURITY,
+        description="Security validation and compliance verification",
+        complexity=Complexity.MODERATE,
+        priority="high",
+        estimated_effort="30-60 minutes",
+        dependencies=[]
+    )),
+    (_CATEGORY_BITS[Category.DEVELOPMENT], WorkflowRequirement(
+        category=Category.DEVELOPMENT,
+        description="Implementation and development work",
+        complexity=Complexity.MODERATE,
+        priority="high",
+        estimated_effort="60-120 minutes",
+        dependencies=["analysis"]
+    )),
+    (_CATEGORY_BITS[Category.ANALYSIS], WorkflowRequirement(
+        category=Category.ANALYSIS,
+        description="Code analysis and system understanding",
+        complexity=Complexity.SIMPLE,
+        priority="medium",
+        estimated_effort="15-30 minutes",
+        dependencies=[]
+    )),
+    (_CATEGORY_BITS[Category.RESEARCH], WorkflowRequirement(
+        category=Category.RESEARCH,
+        description="Information gathering and research",
+        complexity=Complexity.SIMPLE,
+        priority="medium",
+        estimated_effort="20-40 minutes",
+        dependencies=[]
+    ))
+)
+
+# Agent-driven execution plan phases as (task verb, contributing agents in task order)
+_AGENT_PHASES = (
+    ("discovery", ("codebase-analyzer", "codebase-locator")),
+    ("implementation", ("rust-expert-developer", "backend-architect")),
+    ("validation", ("security-specialist",))
+)
+
+# Execution plan phases as (name, progress, deliverables)
+_PHASE_TEMPLATES = (
+    ("Discovery & Planning", 25, ("Requirements analysis", "Implementation strategy")),
+    ("Core Implementation", 50, ("Working implementation", "Initial testing")),
+    ("Validation & Security", 75, ("Security validation", "Quality assurance")),
+    ("Integration & Completion", 100, ("Complete solution", "Documentation", "Deployment guide"))
+)
+_FINAL_PHASE_TASKS = ("Final integration", "Documentation", "Deployment preparation")
+
+# Recommendation prototypes shared by every analysis
+_ORCHESTRATOR_RECOMMENDATION = AgentRecommendation(
+    agent_type="orchestrator",
+    confidence=0.9,
+    reasoning="Multi-step workflow requires coordination",
+    skills_needed=("multi-agent-workflow", "communication-protocols"),
+    commands_suggested=("/create_plan", "/implement_plan"),
+    coordination_role=Role.PRIMARY
+)
+_RUST_RECOMMENDATION = AgentRecommendation(
+    agent_type="rust-expert-developer",
+    confidence=0.9,
+    reasoning="Rust development expertise required",
+    skills_needed=("rust-backend-patterns", "production-patterns"),
+    commands_suggested=("/rust_scaffold", "/feature_development"),
+    coordination_role=Role.SUPPORTING
+)
+_CATEGORY_RECOMMENDATIONS = {
+    Category.SECURITY: AgentRecommendation(
+        agent_type="security-specialist",
+        confidence=0.85,
+        reasoning="Security requirements identified",
+        skills_needed=("security-patterns",),
+        commands_suggested=("/security_sast", "/security_hardening"),
+        coordination_role=Role.SUPPORTING
+    ),
+    Category.ANALYSIS: AgentRecommendation(
+        agent_type="codebase-analyzer",
+        confidence=0.8,
+        reasoning="Analysis and documentation needed",
+        skills_needed=("code-analysis-planning-editor",),
+        commands_suggested=("/research_codebase",),
+        coordination_role=Role.SUPPORTING
+    ),
+    Category.RESEARCH: AgentRecommendation(
+        agent_type="codebase-locator",
+        confidence=0.75,
+        reasoning="Research and discovery needed",
+        skills_needed=("search-strategies",),
+        commands_suggested=("/smart-research",),
+        coordination_role=Role.SUPPORTING
+    )
+}
+
+@lru_cache(maxsize=256)
+def _tokenize(desc_lc: str) -> frozenset:
+    """Distinct alphabetic tokens of a lowercased description"""
+    return frozenset(_TOKEN_RE.findall(desc_lc))
+
+def _build_keyword_automaton():
+    """Build an Aho-Corasick automaton over all category keywords, if available"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword, bit in _SENTINEL_MAP.items():
+        automaton.add_word(keyword, bit)
+    automaton.make_automaton()
+    return automaton
+
+def _build_capability_matcher():
+    """Index capability keywords to the agents listing them and compile one matcher"""
+    keyword_agents: Dict[str, Tuple[str, ...]] = {}
+    for agent, info in _shared_table("AGENT_CAPABILITIES").items():
+        for keyword in info["keywords"]:
+            keyword_agents[keyword] = keyword_agents.get(keyword, ()) + (agent,)
+    
+    if ahocorasick is not None:
+        matcher = ahocorasick.Automaton()
+        for keyword in keyword_agents:
+            matcher.add_word(keyword, keyword)
+        matcher.make_automaton()
+    else:
+        # Longest keyword first; the lookahead reports matches at every offset
+        alternation = "|".join(map(re.escape, sorted(keyword_agents, key=len, reverse=True)))
+        matcher = re.compile(f"(?=({alternation}))")
+    return keyword_agents, matcher
 
 class WorkflowAnalyzer:
     """Intelligent workflow analysis and agent selection"""
     
-    def __init__(self):
+    _keyword_automaton = _build_keyword_automaton()
+    _capability_matcher = None  # (keyword -> agents, matcher), built on first use
+    
+    def __init__(self, analysis_cache_size: int = 256):
         self.load_agent_capabilities()
         self.load_skills_commands_mapping()
+        self.analysis_cache_size = analysis_cache_size
+        self._analysis_cache: "OrderedDict[Tuple[str, str], Dict]" = OrderedDict()
     
     def load_agent_capabilities(self):
-        """Load agent capability mappings from 47-agent framework"""
-        self.agent_capabilities = {
-            "orchestrator": {
-                "primary_roles": ["coordination", "planning", "project_management"],
-                "keywords": ["plan", "coordinate", "manage", "workflow", "multiple", "complex"],
-                "complexity_range": ["moderate", "complex"],
-                "best_for": ["multi-agent workflows", "project planning", "resource coordination"]
-            },
-            "codebase-analyzer": {
-                "primary_roles": ["analysis", "documentation", "architecture_review"],
-                "keywords": ["analyze", "review", "understand", "document", "architecture"],
-                "complexity_range": ["simple", "moderate", "complex"],
-                "best_for": ["code analysis", "technical documentation", "system understanding"]
-            },
-            "codebase-locator": {
-                "primary_roles": ["search", "discovery", "mapping"],
-                "keywords": ["find", "locate", "search", "discover", "where", "which"],
-                "complexity_range": ["simple", "moderate"],
-                "best_for": ["file discovery", "code location", "dependency mapping"]
-            },
-            "security-specialist": {
-                "primary_roles": ["security", "compliance", "vulnerability_assessment"],
-                "keywords": ["security", "secure", "vulnerability", "compliance", "audit", "penetration"],
-                "complexity_range": ["moderate", "complex"],
-                "best_for": ["security audits", "compliance validation", "vulnerability assessment"]
-            },
-            "backend-architect": {
-                "primary_roles": ["api_design", "architecture", "scalability"],
-                "keywords": ["api", "backend", "service", "architecture", "scalability", "design"],
-                "complexity_range": ["moderate", "complex"],
-                "best_for": ["API design", "backend architecture", "scalability planning"]
-            },
-            "rust-expert-developer": {
-                "primary_roles": ["rust_implementation", "performance", "systems_programming"],
-                "keywords": ["rust", "implement", "performance", "systems", "low-level"],
-                "complexity_range": ["moderate", "complex"],
-                "best_for": ["Rust implementation", "performance optimization", "systems programming"]
-            },
-            "competitive-market-analyst": {
-                "primary_roles": ["market_research", "competitive_analysis", "business_intelligence"],
-                "keywords": ["market", "competitive", "research", "analysis", "business", "strategy"],
-                "complexity_range": ["moderate", "complex"],
-                "best_for": ["market research", "competitive analysis", "business strategy"]
-            },
-            "web-search-researcher": {
-                "primary_roles": ["research", "information_gathering", "web_analysis"],
-                "keywords": ["research", "search", "information", "web", "investigate"],
-                "complexity_range": ["simple", "moderate"],
-                "best_for": ["web research", "information gathering", "trend analysis"]
-            }
-        }
+        """Bind the shared agent capability mappings from the 47-agent framework"""
+        self.agent_capabilities = _shared_table("AGENT_CAPABILITIES")
     
     def load_skills_commands_mapping(self):
-        """Load skills and commands mapping"""
-        self.skills_mapping = {
-            "project_management": ["multi-agent-workflow", "evaluation-framework", "communication-protocols"],
-            "development": ["production-patterns", "framework-patterns", "code-analysis-planning-editor"],
-            "security": ["security-patterns", "compliance-validation"],
-            "analysis": ["search-strategies", "token-cost-tracking", "internal-comms"],
-            "infrastructure": ["gcp-resource-cleanup", "git-workflow-automation"]
-        }
-        
-        self.commands_mapping = {
-            "planning": ["/create_plan", "/validate_plan", "/implement_plan"],
-            "research": ["/research", "/research_codebase", "/smart-research"],
-            "development": ["/feature_development", "/rust_scaffold", "/component_scaffold"],
-            "security": ["/security_deps", "/security_sast", "/security_hardening"],
-            "deployment": ["/config_validate", "/monitor_setup", "/db_migrations"]
-        }
+        """Bind the shared skills and commands mappings"""
+        self.skills_mapping = _shared_table("SKILLS_MAPPING")
+        self.commands_mapping = _shared_table("COMMANDS_MAPPING")
     
     def analyze_workflow(self, description: str, context: Dict = None) -> Dict:
         """
@@ -119,136 +335,123 @@ class WorkflowAnalyzer:
         Returns:
             Comprehensive workflow analysis with agent recommendations
         """
-        requirements = self._extract_requirements(description, context)
-        agent_recommendations = self._recommend_agents(requirements, description)
+        # Repeated descriptions are served from an LRU cache; callers get a
+        # deep copy so mutating the result cannot poison the cached entry
+        cache_key = (description, json.dumps(context or {}, sort_keys=True, default=str))
+        analysis = self._analysis_cache.get(cache_key)
+        if analysis is not None:
+            self._analysis_cache.move_to_end(cache_key)
+        else:
+            analysis = self._run_analysis(description, context)
+            if self.analysis_cache_size > 0:
+                self._analysis_cache[cache_key] = analysis
+                if len(self._analysis_cache) > self.analysis_cache_size:
+                    self._analysis_cache.popitem(last=False)
+        
+        return copy.deepcopy(analysis)
+    
+    def clear_analysis_cache(self):
+        """Drop memoized workflow analyses"""
+        self._analysis_cache.clear()
+    
+    def _run_analysis(self, description: str, context: Dict) -> Dict:
+        """Run the full analysis pipeline for one description"""
+        # Lowercase once; every keyword matcher scans the same normalized text
+        desc_lc = description.lower()
+        requirements = self._extract_requirements(description, desc_lc, context)
+        matched_keywords = self._match_capability_keywords(desc_lc)
+        agent_recommendations = self._recommend_agents(requirements, matched_keywords)
+        by_agent = {rec.agent_type: rec for rec in agent_recommendations}
         coordination_strategy = self._plan_coordination(agent_recommendations)
         
         return {
             "workflow_summary": description,
             "requirements": requirements,
             "agent_recommendations": agent_recommendations,
+            "candidate_agents": sorted(self._match_agents(matched_keywords)),
             "coordination_strategy": coordination_strategy,
-            "execution_plan": self._generate_execution_plan(agent_recommendations),
-            "estimated_complexity": self._estimate_complexity(requirements),
+            "execution_plan": self._generate_execution_plan(agent_recommendations, by_agent),
+            "estimated_complexity": self._estimate_complexity(requirements).name.lower(),
             "resource_requirements": self._estimate_resources(agent_recommendations)
         }
     
-    def _extract_requirements(self, description: str, context: Dict) -> List[WorkflowRequirement]:
+    def _extract_requirements(self, description: str, desc_lc: str, context: Dict) -> List[WorkflowRequirement]:
         """Extract workflow requirements from description"""
-        requirements = []
+        # Whole-word hits resolve categories with set intersections; only when
+        # some category is still unmatched does the substring scan run, so
+        # forms like "implementation" keep matching "implement"
+        tokens = _tokenize(desc_lc)
+        matched = 0
+        for category, keywords in _CATEGORY_KEYWORDS:
+            if keywords & tokens:
+                matched |= _CATEGORY_BITS[category]
         
-        # Security requirements
-        if any(keyword in description.lower() for keyword in ["security", "secure", "audit", "compliance"]):
-            requirements.append(WorkflowRequirement(
-                category="security",
-                description="Security validation and compliance verification",
-                complexity="moderate",
-                priority="high",
-                estimated_effort="30-60 minutes",
-                dependencies=[]
-            ))
+        if matched != _ALL_CATEGORY_BITS:
+            if self._keyword_automaton is not None:
+                for _, bit in self._keyword_automaton.iter(desc_lc):
+                    matched |= bit
+            else:
+                for keyword, bit in _SENTINEL_MAP.items():
+                    if not matched & bit and keyword in desc_lc:
+                        matched |= bit
         
-        # Development requirements  
-        if any(keyword in description.lower() for keyword in ["implement", "build", "create", "develop"]):
-            requirements.append(WorkflowRequirement(
-                category="development",
-                description="Implementation and development work",
-                complexity="moderate",
-                priority="high", 
-                estimated_effort="60-120 minutes",
-                dependencies=["analysis"]
-            ))
-        
-        # Analysis requirements
-        if any(keyword in description.lower() for keyword in ["analyze", "understand", "review", "examine"]):
-            requirements.append(WorkflowRequirement(
-                category="analysis",
-                description="Code analysis and system understanding",
-                complexity="simple",
-                priority="medium",
-                estimated_effort="15-30 minutes", 
-                dependencies=[]
-            ))
-        
-        # Research requirements
-        if any(keyword in description.lower() for keyword in ["research", "investigate", "find", "discover"]):
-            requirements.append(WorkflowRequirement(
-                category="research",
-                description="Information gathering and research",
-                complexity="simple",
-                priority="medium",
-                estimated_effort="20-40 minutes",
-                dependencies=[]
-            ))
+        # Emit requirements in category order; copies keep templates pristine
+        return [
+            replace(template, dependencies=list(template.dependencies))
+            for bit, template in _REQUIREMENT_TEMPLATES
+            if matched & bit
+        ]
+    
+    def _match_capability_keywords(self, desc_lc: str) -> Set[str]:
+        """Find every agent capability keyword in the lowercased description with a single scan"""
+        if WorkflowAnalyzer._capability_matcher is None:
+            WorkflowAnalyzer._capability_matcher = _build_capability_matcher()
+        matcher = self._capability_matcher[1]
         
-        return requirements
+        if ahocorasick is not None:
+            return {keyword for _, keyword in matcher.iter(desc_lc)}
+        return {match.group(1) for match in matcher.finditer(desc_lc)}
     
-    def _recommend_agents(self, requirements: List[WorkflowRequirement], description: str) -> List[AgentRecommendation]:
+    def _match_agents(self, matched_keywords: Set[str]) -> Set[str]:
+        """Agents whose capability keywords were matched"""
+        keyword_agents = self._capability_matcher[0]
+        return {agent for keyword in matched_keywords for agent in keyword_agents[keyword]}
+    
+    def _recommend_agents(self, requirements: List[WorkflowRequirement], matched_keywords: Set[str]) -> List[AgentRecommendation]:
         """Recommend agents based on requirements analysis"""
         recommendations = []
         
         # Determine if orchestration is needed
-        if len(requirements) > 2 or any(req.complexity == "complex" for req in requirements):
-            recommendations.append(AgentRecommendation(
-                agent_type="orchestrator",
-                confidence=0.9,
-                reasoning="Multi-step workflow requires coordination",
-                skills_needed=["multi-agent-workflow", "communication-protocols"],
-                commands_suggested=["/create_plan", "/implement_plan"],
-                coordination_role="primary"
-            ))
+        if len(requirements) > 2 or any(req.complexity == Complexity.COMPLEX for req in requirements):
+            recommendations.append(_ORCHESTRATOR_RECOMMENDATION)
         
-        # Match agents to requirements
+        # Match agents to requirements; the shared prototypes are immutable
         for req in requirements:
-            if req.category == "security":
-                recommendations.append(AgentRecommendation(
-                    agent_type="security-specialist",
-                    confidence=0.85,
-                    reasoning="Security requirements identified",
-                    skills_needed=["security-patterns"],
-                    commands_suggested=["/security_sast", "/security_hardening"],
-                    coordination_role="supporting"
-                ))
-            
-            elif req.category == "analysis":
-                recommendations.append(AgentRecommendation(
-                    agent_type="codebase-analyzer", 
-                    confidence=0.8,
-                    reasoning="Analysis and documentation needed",
-                    skills_needed=["code-analysis-planning-editor"],
-                    commands_suggested=["/research_codebase"],
-                    coordination_role="supporting"
-                ))
-            
-            elif req.category == "development" and "rust" in description.lower():
-                recommendations.append(AgentRecommendation(
-                    agent_type="rust-expert-developer",
-                    confidence=0.9,
-                    reasoning="Rust development expertise required",
-                    skills_needed=["rust-backend-patterns", "production-patterns"],
-                    commands_suggested=["/rust_scaffold", "/feature_development"],
-                    coordination_role="supporting"
-                ))
-            
-            elif req.category == "research":
-                recommendations.append(AgentRecommendation(
-                    agent_type="codebase-locator",
-                    confidence=0.75,
-                    reasoning="Research and discovery needed",
-                    skills_needed=["search-strategies"],
-                    commands_suggested=["/smart-research"],
-                    coordination_role="supporting"
-                ))
+            if req.category == Category.DEVELOPMENT:
+                if "rust" in matched_keywords:
+                    recommendations.append(_RUST_RECOMMENDATION)
+            else:
+                recommendation = _CATEGORY_RECOMMENDATIONS.get(req.category)
+                if recommendation is not None:
+                    recommendations.append(recommendation)
         
         return recommendations
     
     def _plan_coordination(self, recommendations: List[AgentRecommendation]) -> Dict:
         """Plan agent coordination strategy"""
-        primary_agents = [r for r in recommendations if r.coordination_role == "primary"]
-        supporting_agents = [r for r in recommendations if r.coordination_role == "supporting"]
+        # Single pass: only the first primary agent matters
+        first_primary = None
+        supporting_agents = []
+        for rec in recommendations:
+            role = rec.coordination_role
+            if role == Role.PRIMARY:
+                if first_primary is None:
+                    first_primary = rec
+            elif role == Role.SUPPORTING:
+                supporting_agents.append(rec)
         
-        if primary_agents:
-            coordinator = primary_agents[0].agent_type
+        if first_primary is not None:
+            coordinator = first_primary.agent_type
         else:
             coordinator = "orchestrator"  # Default coordinator
         
@@ -266,76 +469,57 @@ class WorkflowAnalyzer:
             ]
         }
     
-    def _generate_execution_plan(self, recommendations: List[AgentRecommendation]) -> List[Dict]:
+    def _generate_execution_plan(self, recommendations: List[AgentRecommendation],
+                                 by_agent: Dict[str, AgentRecommendation]) -> List[Dict]:
         """Generate step-by-step execution plan"""
-        plan = []
-        
-        # Phase 1: Discovery and Planning
-        plan.append({
-            "phase": "Discovery & Planning",
-            "progress": 25,
-            "tasks": [
-                f"Execute discovery using {rec.agent_type}" 
-                for rec in recommendations 
-                if rec.agent_type in ["codebase-locator", "codebase-analyzer"]
-            ],
-            "deliverables": ["Requirements analysis", "Implementation strategy"]
-        })
+        # Each phase probes the agent map for its own few agents
+        task_lists = [
+            [f"Execute {verb} using {agent}" for agent in agents if agent in by_agent]
+            for verb, agents in _AGENT_PHASES
+        ]
+        task_lists.append(list(_FINAL_PHASE_TASKS))
         
-        # Phase 2: Core Implementation
-        plan.append({
-            "phase": "Core Implementation", 
-            "progress": 50,
-            "tasks": [
-                f"Execute implementation using {rec.agent_type}"
-                for rec in recommendations
-                if rec.agent_type in ["rust-expert-developer", "backend-architect"]
-            ],
-            "deliverables": ["Working implementation", "Initial testing"]
-        })
-        
-        # Phase 3: Validation and Security
-        plan.append({
-            "phase": "Validation & Security",
-            "progress": 75,
-            "tasks": [
-                f"Execute validation using {rec.agent_type}"
-                for rec in recommendations
-                if rec.agent_type in ["security-specialist"]
-            ],
-            "deliverables": ["Security validation", "Quality assurance"]
-        })
-        
-        # Phase 4: Integration and Completion
-        plan.append({
-            "phase": "Integration & Completion",
-            "progress": 100,
-            "tasks": ["Final integration", "Documentation", "Deployment preparation"],
-            "deliverables": ["Complete solution", "Documentation", "Deployment guide"]
-        })
-        
-        return plan
+        # Fresh dicts and task lists per call; names and deliverables are shared
+        return [
+            {"phase": name, "progress": progress, "tasks": tasks, "deliverables": deliverables}
+            for (name, progress, deliverables), tasks in zip(_PHASE_TEMPLATES, task_lists)
+        ]
     
-    def _estimate_complexity(self, requirements: List[WorkflowRequirement]) -> str:
+    def _estimate_complexity(self, requirements: List[WorkflowRequirement]) -> Complexity:
         """Estimate overall workflow complexity"""
-        if any(req.complexity == "complex" for req in requirements):
-            return "complex"
-        elif len(requirements) > 3 or any(req.complexity == "moderate" for req in requirements):
-            return "moderate"
-        else:
-            return "simple"
+        # Complexity is ordered, so one max() reduction replaces the two scans
+        highest = max((req.complexity for req in requirements), default=Complexity.SIMPLE)
+        if highest == Complexity.SIMPLE and len(requirements) > 3:
+            return Complexity.MODERATE
+        return highest
     
     def _estimate_resources(self, recommendations: List[AgentRecommendation]) -> Dict:
         """Estimate resource requirements"""
+        agent_count = len(recommendations)
         return {
-            "agent_count": len(recommendations),
-            "estimated_duration": f"{len(recommendations) * 15}-{len(recommendations) * 30} minutes",
-            "token_budget": f"{len(recommendations) * 20}K-{len(recommendations) * 40}K tokens",
-            "coordination_overhead": "10-20%" if len(recommendations) > 2 else "5-10%"
+            "agent_count": agent_count,
+            "estimated_duration": f"{agent_count * 15}-{agent_count * 30} minutes",
+            "token_budget": f"{agent_count * 20}K-{agent_count * 40}K tokens",
+            "coordination_overhead": "10-20%" if agent_count > 2 else "5-10%"
         }
 
+def serialize_analysis(value):
+    """Convert an analysis into JSON-ready data, writing enums as lowercase names"""
+    if isinstance(value, Enum):
+        return value.name.lower()
+    if is_dataclass(value):
+        return {f.name: serialize_analysis(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, dict):
+        return {key: serialize_analysis(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [serialize_analysis(item) for item in value]
+    return value
+
 # Example usage
 if __name__ == "__main__":
+    import sys
+    from agent_caller import dumps_json
+    
     analyzer = WorkflowAnalyzer()
     
     # Analyze a complex workflow
@@ -343,4 +527,5 @@ if __name__ == "__main__":
         "Implement secure user profile management with Rust backend, including API endpoints, database updates, security validation, and comprehensive testing"
     )
     
-    print(json.dumps(analysis, indent=2, default=str))
\ No newline at end of file
+    # orjson-backed when installed; bytes go straight to the stdout buffer
+    sys.stdout.buffer.write(dumps_json(serialize_analysis(analysis)) + b"\n")
\ No newline at end of file
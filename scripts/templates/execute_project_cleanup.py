@@ -6,26 +6,14 @@ Calls the project-organizer agent to autonomously organize the current directory
 
 import os
 import sys
-from datetime import datetime
+import time
 
-def execute_project_organizer(dry_run=True):
-    """
-    Execute project-organizer agent using the correct Task Tool Proxy Pattern
-    This function demonstrates the proper way to call agents from the 47-agent framework
-    """
-    
-    current_dir = os.getcwd()
-    project_name = os.path.basename(current_dir)
-    
-    print(f"🎭 Calling project-organizer agent for: {project_name}")
-    print(f"📁 Working directory: {current_dir}")
-    print(f"🔧 Mode: {'DRY RUN (analysis only)' if dry_run else 'LIVE EXECUTION (with user permission)'}")
-    print("=" * 70)
-    
-    # Build the comprehensive task prompt
-    task_prompt = f"""Use project-organizer subagent to conduct autonomous directory organization and cleanup for {project_name}.
+# Static segments of the project-organizer prompt, split at the interpolated values
+_PROMPT_HEAD = "Use project-organizer subagent to conduct autonomous directory organization and cleanup for "
+_PROMPT_AFTER_NAME = """.
 
-PROJECT LOCATION: {current_dir}
+PROJECT LOCATION: """
+_PROMPT_AFTER_DIR = """
 
 AUTONOMOUS CLEANUP REQUIREMENTS:
 
@@ -62,7 +50,8 @@ AUTONOMOUS CLEANUP REQUIREMENTS:
    - Verify git status before and after each change
 
 5. EXECUTION MODE:
-   - {'DRY RUN MODE: Analyze and show what would be done, but make no actual changes' if dry_run else 'LIVE MODE: Execute approved changes with git operations and user confirmation'}
+   - """
+_PROMPT_TAIL = """
 
 6. SKILLS TO UTILIZE:
    - Use git-workflow-automation skill for safe file moves with history preservation
@@ -80,13 +69,63 @@ AUTONOMOUS CLEANUP REQUIREMENTS:
 
 Please execute this autonomous organization task following all safety protocols and permission requirements."""
 
-    print("📋 Task Prompt Prepared - Executing via Task Tool...")
-    print("\n" + "🎯" + " TASK EXECUTION " + "🎯".center(50, "="))
+_MODE_DRY = "DRY RUN MODE: Analyze and show what would be done, but make no actual changes"
+_MODE_LIVE = "LIVE MODE: Execute approved changes with git operations and user confirmation"
+
+_USAGE = """Usage: python execute_project_cleanup.py [dry|live]
+  dry  - Analysis only (default)
+  live - Execute with user permission
+"""
+
+_NEXT_STEPS = "\n" + "=" * 70 + """
+📝 NEXT STEPS:
+1. The project-organizer agent will analyze the directory structure
+2. It will identify misplaced files and organizational opportunities
+3. It will request permission before making any changes
+4. All file moves will use 'git mv' to preserve history
+5. Results will be committed with descriptive messages
+
+🎯 Ready for agent execution!
+"""
+
+def _fast_iso_now() -> str:
+    """Local ISO-8601 timestamp with microseconds, without building a datetime"""
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(seconds))}.{nanos // 1000:06d}"
+
+def execute_project_organizer(dry_run=True):
+    """
+    Execute project-organizer agent using the correct Task Tool Proxy Pattern
+    This function demonstrates the proper way to call agents from the 47-agent framework
+    """
+    
+    current_dir = os.getcwd()
+    project_name = os.path.basename(current_dir)
+    
+    # Progress output is collected and written to stdout in one call
+    out = [
+        f"🎭 Calling project-organizer agent for: {project_name}",
+        f"📁 Working directory: {current_dir}",
+        f"🔧 Mode: {'DRY RUN (analysis only)' if dry_run else 'LIVE EXECUTION (with user permission)'}",
+        "=" * 70
+    ]
+    
+    # Build the comprehensive task prompt
+    task_prompt = "".join((
+        _PROMPT_HEAD, project_name,
+        _PROMPT_AFTER_NAME, current_dir,
+        _PROMPT_AFTER_DIR, _MODE_DRY if dry_run else _MODE_LIVE,
+        _PROMPT_TAIL
+    ))
+
+    out.append("📋 Task Prompt Prepared - Executing via Task Tool...")
+    out.append("\n" + "🎯" + " TASK EXECUTION " + "🎯".center(50, "="))
     
     # This is where Claude Code will execute the Task tool call
-    print(f"\nExecuting: Task(subagent_type='general-purpose', prompt='Use project-organizer subagent to...')")
-    print(f"Expected Result: Project-organizer agent will autonomously analyze and organize the directory")
-    print(f"Permission Level: Agent will request permission before any file operations")
+    out.append("\nExecuting: Task(subagent_type='general-purpose', prompt='Use project-organizer subagent to...')")
+    out.append("Expected Result: Project-organizer agent will autonomously analyze and organize the directory")
+    out.append("Permission Level: Agent will request permission before any file operations")
+    sys.stdout.write("\n".join(out) + "\n")
     
     return {
         "task_type": "project_organization",
@@ -95,7 +134,7 @@ Please execute this autonomous organization task following all safety protocols
         "project_name": project_name,
         "working_directory": current_dir,
         "dry_run": dry_run,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _fast_iso_now(),
         "expected_behavior": "Agent will analyze directory structure and request permission for organizational changes"
     }
 
@@ -112,9 +151,7 @@ def main():
             dry_run = True
             print("🔍 DRY RUN MODE - Agent will analyze only, no file operations")
         else:
-            print("Usage: python execute_project_cleanup.py [dry|live]")
-            print("  dry  - Analysis only (default)")
-            print("  live - Execute with user permission")
+            sys.stdout.write(_USAGE)
             return
     else:
         print("🔍 DRY RUN MODE (default) - Use 'live' argument for actual execution")
@@ -122,19 +159,13 @@ def main():
     # Execute the project organization
     result = execute_project_organizer(dry_run)
     
-    print(f"\n✅ Task prepared for execution")
-    print(f"📊 Project: {result['project_name']}")
-    print(f"🔧 Mode: {'DRY RUN' if dry_run else 'LIVE EXECUTION'}")
-    print(f"⏰ Timestamp: {result['timestamp']}")
-    
-    print("\n" + "=" * 70)
-    print("📝 NEXT STEPS:")
-    print("1. The project-organizer agent will analyze the directory structure")
-    print("2. It will identify misplaced files and organizational opportunities") 
-    print("3. It will request permission before making any changes")
-    print("4. All file moves will use 'git mv' to preserve history")
-    print("5. Results will be committed with descriptive messages")
-    print("\n🎯 Ready for agent execution!")
+    sys.stdout.write(
+        f"\n✅ Task prepared for execution\n"
+        f"📊 Project: {result['project_name']}\n"
+        f"🔧 Mode: {'DRY RUN' if dry_run else 'LIVE EXECUTION'}\n"
+        f"⏰ Timestamp: {result['timestamp']}\n"
+        + _NEXT_STEPS
+    )
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
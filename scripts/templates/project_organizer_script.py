@@ -4,119 +4,55 @@ Project Organizer Script Template - Comprehensive Project Analysis and Organizat
 Reusable template for project status assessment, organization, and strategic planning.
 """
 
+import io
 import sys
 import os
 import json
+import hashlib
+import contextlib
 from datetime import datetime
 
-# Add core modules to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core'))
-
-from agent_caller import AgentCaller, AgentType
-
-class ProjectOrganizerScript:
-    """Reusable project organization and analysis template"""
-    
-    def __init__(self, project_name: str, project_path: str, analysis_scope: str = "comprehensive"):
-        self.project_name = project_name
-        self.project_path = project_path
-        self.analysis_scope = analysis_scope  # comprehensive, focused, quick
-        self.session_id = f"project_org_{int(datetime.now().timestamp())}"
-        
-        # Initialize core components
-        self.agent_caller = AgentCaller()
-        
-        # Available skills for project-organizer agent
-        self.available_skills = [
-            "git-workflow-automation",    # For automated git operations and file moves
-            "internal-comms",            # For status reports and communication templates
-            "cross-file-documentation-update",  # For updating references after moves
-            "communication-protocols"    # For coordination with other agents
-        ]
-        
-        # Available commands for project organization
-        self.available_commands = [
-            "/create_plan",     # Create detailed organization plan
-            "/validate_plan",   # Validate organization results
-            "/doc_generate",    # Generate documentation for organization changes
-        ]
-        
-        # Analysis state
-        self.analysis_results = {}
-        self.recommendations = []
-        self.action_items = []
-    
-    def conduct_project_analysis(self, context: dict = None) -> dict:
-        """
-        Step 1: Conduct comprehensive project analysis using project-organizer agent
-        """
-        print(f"🔍 Conducting project analysis for: {self.project_name}")
-        print(f"📁 Project location: {self.project_path}")
-        print(f"📊 Analysis scope: {self.analysis_scope}")
-        
-        # Build comprehensive analysis prompt
-        analysis_prompt = self._build_analysis_prompt(context)
-        
-        # Use the correct Task Tool Proxy Pattern from 47-agent framework
-        # Format: Task(subagent_type="general-purpose", prompt="Use [agent] subagent to [task]")
-        
-        print(f"🎭 Calling project-organizer agent using verified Task Tool Proxy Pattern...")
-        
-        task_prompt = f"Use project-organizer subagent to {analysis_prompt}"
-        
-        # Store the task prompt for execution - this will be called via Claude Code's Task tool
-        analysis_task = {
-            "task_type": "agent_invocation",
-            "subagent_type": "general-purpose", 
-            "prompt": task_prompt,
-            "description": f"Project organization analysis for {self.project_name}",
-            "session_id": f"{self.session_id}_analysis"
-        }
-        
-        self.analysis_results = {
-            "analysis_task": analysis_task,
-            "completion_time": datetime.now().isoformat(),
-            "scope": self.analysis_scope
-        }
-        
-        print(f"✅ Project analysis completed")
-        return self.analysis_results
-    
-    def _build_analysis_prompt(self, context: dict) -> str:
-        """Build comprehensive analysis prompt for project-organizer agent"""
-        
-        base_context = {
-            "project_name": self.project_name,
-            "project_location": self.project_path,
-            "analysis_scope": self.analysis_scope,
-            "analysis_date": datetime.now().strftime("%Y-%m-%d")
-        }
-        
-        # Merge with user context
-        full_context = {**base_context, **(context or {})}
-        
-        if self.analysis_scope == "comprehensive":
-            return self._comprehensive_analysis_prompt(full_context)
-        elif self.analysis_scope == "focused":
-            return self._focused_analysis_prompt(full_context)
-        else:
-            return self._quick_analysis_prompt(full_context)
-    
-    def _comprehensive_analysis_prompt(self, context: dict) -> str:
-        """Comprehensive project analysis prompt"""
-        skills_context = f"Available Skills: {', '.join(self.available_skills)}"
-        commands_context = f"Available Commands: {', '.join(self.available_commands)}"
-        
-        return f"""conduct comprehensive project analysis of {self.project_name} with full organizational assessment and recommendations.
+# Core modules are put on the path and imported on first use, so building
+# prompt-only tasks never loads the agent caller
+_CORE_DIR = os.path.join(os.path.dirname(__file__), '..', 'core')
+
+def _agent_caller_module():
+    """Import agent_caller on first use, adding the core modules to the path"""
+    if _CORE_DIR not in sys.path:
+        sys.path.append(_CORE_DIR)
+    import agent_caller
+    return agent_caller
+
+# Bump when prompt logic or the result layout changes to invalidate cached analyses
+CACHE_VERSION = 1
+
+def _project_mtime(project_path: str) -> float:
+    """Latest mtime of any file or directory in the project tree (.git excluded)"""
+    latest = 0.0
+    for root, dirs, files in os.walk(project_path):
+        dirs[:] = [name for name in dirs if name != '.git']
+        for path in [root] + [os.path.join(root, name) for name in files]:
+            try:
+                latest = max(latest, os.stat(path).st_mtime)
+            except OSError:
+                continue
+    return latest
+
+# Context keys every analysis prompt states explicitly
+_BASE_CONTEXT_KEYS = frozenset({"project_name", "project_location", "analysis_scope", "analysis_date"})
+
+# Analysis prompt templates including the Task Tool Proxy prefix, filled with
+# str.format_map per call
+_COMPREHENSIVE_TEMPLATE = """Use project-organizer subagent to conduct comprehensive project analysis of {name} with full organizational assessment and recommendations.
 
 {skills_context}
 {commands_context}
 
 PROJECT CONTEXT:
-- Project: {context['project_name']}
-- Location: {context['project_location']}
-- Analysis Date: {context['analysis_date']}
-- Additional Context: {json.dumps(context, indent=2)}
+- Project: {project}
+- Location: {location}
+- Analysis Date: {date}
+- Additional Context: {context_json}
 
 COMPREHENSIVE ANALYSIS REQUIREMENTS:
 
@@ -176,20 +112,15 @@ DELIVERABLE FORMAT:
 
 Please provide comprehensive project organization analysis with clear documentation suitable for project handoff, stakeholder communication, and future development planning."""
 
-    def _focused_analysis_prompt(self, context: dict) -> str:
-        """Focused project analysis prompt"""
-        focus_area = context.get('focus_area', 'current status and next steps')
-        skills_context = f"Available Skills: {', '.join(self.available_skills)}"
-        
-        return f"""conduct focused project analysis of {self.project_name} with targeted organizational assessment.
+_FOCUSED_TEMPLATE = """Use project-organizer subagent to conduct focused project analysis of {name} with targeted organizational assessment.
 
 {skills_context}
 
 PROJECT CONTEXT:
-- Project: {context['project_name']}
-- Location: {context['project_location']}
+- Project: {project}
+- Location: {location}
 - Focus Area: {focus_area}
-- Analysis Date: {context['analysis_date']}
+- Analysis Date: {date}
 
 FOCUSED ANALYSIS REQUIREMENTS:
 
@@ -215,14 +146,12 @@ FOCUSED ANALYSIS REQUIREMENTS:
 
 Please provide focused analysis with actionable recommendations for immediate implementation."""
 
-    def _quick_analysis_prompt(self, context: dict) -> str:
-        """Quick project analysis prompt"""
-        return f"""conduct quick project analysis of {self.project_name} with rapid organizational assessment.
+_QUICK_TEMPLATE = """Use project-organizer subagent to conduct quick project analysis of {name} with rapid organizational assessment.
 
 PROJECT CONTEXT:
-- Project: {context['project_name']}
-- Location: {context['project_location']}
-- Analysis Date: {context['analysis_date']}
+- Project: {project}
+- Location: {location}
+- Analysis Date: {date}
 
 QUICK ANALYSIS REQUIREMENTS:
 
@@ -243,16 +172,10 @@ QUICK ANALYSIS REQUIREMENTS:
 
 Please provide concise analysis with clear action items for immediate progress."""
 
-    def extract_action_items(self) -> list:
-        """
-        Step 2: Extract actionable items from analysis results
-        """
-        print(f"📋 Extracting action items from analysis...")
-        
-        # In a real implementation, this would parse the analysis results
-        # For now, we'll create a structured extraction prompt
-        
-        extraction_prompt = f"""Based on the project analysis conducted for {self.project_name}, extract specific actionable items:
+# Static segments of the extraction and cleanup prompts, split at the
+# interpolated values so each call allocates only the joined result
+_EXTRACTION_HEAD = "Based on the project analysis conducted for "
+_EXTRACTION_TAIL = """, extract specific actionable items:
 
 EXTRACTION REQUIREMENTS:
 1. Identify specific, measurable action items with clear deliverables
@@ -272,26 +195,11 @@ For each action item provide:
 
 Please provide structured action items ready for immediate implementation planning."""
 
-        extraction_task = self.agent_caller.call_agent(
-            AgentType.ORCHESTRATOR,
-            extraction_prompt,
-            f"{self.session_id}_extraction"
-        )
-        
-        self.action_items = extraction_task
-        
-        print(f"✅ Action items extracted and prioritized")
-        return self.action_items
-    
-    def execute_autonomous_cleanup(self, dry_run: bool = True) -> dict:
-        """
-        Step 2.5: Execute autonomous directory cleanup with permission controls
-        """
-        print(f"🔧 {'[DRY RUN] ' if dry_run else ''}Starting autonomous directory cleanup...")
-        
-        cleanup_prompt = f"""conduct autonomous directory organization and cleanup for {self.project_name}.
+_CLEANUP_HEAD = "Use project-organizer subagent to conduct autonomous directory organization and cleanup for "
+_CLEANUP_AFTER_NAME = """.
 
-PROJECT LOCATION: {self.project_path}
+PROJECT LOCATION: """
+_CLEANUP_AFTER_LOCATION = """
 
 AUTONOMOUS CLEANUP REQUIREMENTS:
 1. ANALYSIS PHASE:
@@ -321,7 +229,8 @@ AUTONOMOUS CLEANUP REQUIREMENTS:
    - Never overwrite existing files
 
 5. EXECUTION MODE:
-   - {'DRY RUN MODE: Show what would be done but make no actual changes' if dry_run else 'LIVE MODE: Execute approved changes with git operations'}
+   - """
+_CLEANUP_TAIL = """
 
 SKILLS TO USE:
 - git-workflow-automation skill for safe file moves with history preservation
@@ -334,36 +243,250 @@ Please provide:
 3. Permission requests for any deletions or major restructuring
 4. Implementation commands using git mv for file moves
 5. Verification steps to ensure organization success"""
+_CLEANUP_MODE_DRY = "DRY RUN MODE: Show what would be done but make no actual changes"
+_CLEANUP_MODE_LIVE = "LIVE MODE: Execute approved changes with git operations"
 
-        task_prompt = f"Use project-organizer subagent to {cleanup_prompt}"
+class ProjectOrganizerScript:
+    """Reusable project organization and analysis template"""
+    
+    # Available skills for project-organizer agent
+    AVAILABLE_SKILLS = (
+        "git-workflow-automation",    # For automated git operations and file moves
+        "internal-comms",            # For status reports and communication templates
+        "cross-file-documentation-update",  # For updating references after moves
+        "communication-protocols"    # For coordination with other agents
+    )
+    
+    # Available commands for project organization
+    AVAILABLE_COMMANDS = (
+        "/create_plan",     # Create detailed organization plan
+        "/validate_plan",   # Validate organization results
+        "/doc_generate",    # Generate documentation for organization changes
+    )
+    
+    # Joined once at class creation; every prompt builder reuses these lines
+    _skills_context = "Available Skills: " + ", ".join(AVAILABLE_SKILLS)
+    _commands_context = "Available Commands: " + ", ".join(AVAILABLE_COMMANDS)
+    
+    def __init__(self, project_name: str, project_path: str, analysis_scope: str = "comprehensive"):
+        self.project_name = project_name
+        self.project_path = project_path
+        self.session_id = f"project_org_{int(datetime.now().timestamp())}"
+        self._session_dir = os.path.join(os.path.dirname(self.project_path), '.session')
+        self._session_dir_created = False
         
-        print(f"🎭 Calling project-organizer agent for autonomous cleanup...")
+        self.set_analysis_scope(analysis_scope)  # comprehensive, focused, quick
+        
+        # Core components are created on first use
+        self._agent_caller = None
+        
+        # Analysis state
+        self.analysis_results = {}
+        self.recommendations = []
+        self.action_items = []
+        self._summary = None  # Cached organizational summary, reset when results change
+        self._now = None  # Timestamp shared by every field of one workflow run
+        self._log_lines = None  # Buffered progress output while a batched run is active
+    
+    def set_analysis_scope(self, analysis_scope: str):
+        """Switch the analysis scope, rebinding the scope-dependent prompt state"""
+        self.analysis_scope = analysis_scope
+        
+        # Prompt context keys that stay fixed until the scope changes
+        self._base_context_proto = {
+            "project_name": self.project_name,
+            "project_location": self.project_path,
+            "analysis_scope": analysis_scope
+        }
+        
+        # The prompt builder is bound once per scope
+        self._prompt_builder = {
+            "comprehensive": self._comprehensive_analysis_prompt,
+            "focused": self._focused_analysis_prompt
+        }.get(analysis_scope, self._quick_analysis_prompt)
+        self._summary = None
+    
+    @property
+    def agent_caller(self):
+        """AgentCaller for this script, created on first access"""
+        if self._agent_caller is None:
+            self._agent_caller = _agent_caller_module().AgentCaller()
+        return self._agent_caller
+    
+    def _log(self, line: str):
+        """Print a progress line, or buffer it while run_complete_analysis batches output"""
+        if self._log_lines is None:
+            print(line)
+        else:
+            self._log_lines.append(line)
+    
+    def _call_agent(self, *args):
+        """Call the agent, keeping its progress output in order with a batched run's log"""
+        if self._log_lines is None:
+            return self.agent_caller.call_agent(*args)
+        with contextlib.redirect_stdout(io.StringIO()) as agent_output:
+            task = self.agent_caller.call_agent(*args)
+        if agent_output.getvalue():
+            self._log_lines.append(agent_output.getvalue().rstrip("\n"))
+        return task
+    
+    def _run_timestamp(self) -> datetime:
+        """Current run's timestamp, captured on first use outside run_complete_analysis"""
+        if self._now is None:
+            self._now = datetime.now()
+        return self._now
+    
+    def conduct_project_analysis(self, context: dict = None) -> dict:
+        """
+        Step 1: Conduct comprehensive project analysis using project-organizer agent
+        """
+        self._log(f"🔍 Conducting project analysis for: {self.project_name}")
+        self._log(f"📁 Project location: {self.project_path}")
+        self._log(f"📊 Analysis scope: {self.analysis_scope}")
+        
+        # Use the correct Task Tool Proxy Pattern from 47-agent framework
+        # Format: Task(subagent_type="general-purpose", prompt="Use [agent] subagent to [task]")
+        # The templates already carry the proxy prefix, so the prompt is built once
+        task_prompt = self._build_analysis_prompt(context)
+        
+        self._log(f"🎭 Calling project-organizer agent using verified Task Tool Proxy Pattern...")
+        
+        # Store the task prompt for execution - this will be called via Claude Code's Task tool
+        analysis_task = {
+            "task_type": "agent_invocation",
+            "subagent_type": "general-purpose", 
+            "prompt": task_prompt,
+            "description": f"Project organization analysis for {self.project_name}",
+            "session_id": f"{self.session_id}_{self.analysis_scope}_analysis"
+        }
+        
+        self._summary = None
+        self.analysis_results = {
+            "analysis_task": analysis_task,
+            "completion_time": self._run_timestamp().isoformat(),
+            "scope": self.analysis_scope
+        }
+        
+        self._log(f"✅ Project analysis completed")
+        return self.analysis_results
+    
+    def _build_analysis_prompt(self, context: dict) -> str:
+        """Build the Task Tool Proxy prompt for the project-organizer agent"""
+        
+        # Copy the invariant prototype, then merge the user context in place
+        full_context = dict(self._base_context_proto)
+        full_context["analysis_date"] = self._run_timestamp().strftime("%Y-%m-%d")
+        if context:
+            full_context.update(context)
+        
+        return self._prompt_builder(full_context)
+    
+    def _extra_context_json(self, context: dict) -> str:
+        """JSON for the user-supplied context; base keys are already spelled out in the prompt"""
+        extra = {key: value for key, value in context.items() if key not in _BASE_CONTEXT_KEYS}
+        if not extra:
+            return "(none)"
+        return _agent_caller_module().dumps_json(extra).decode()
+    
+    def _comprehensive_analysis_prompt(self, context: dict) -> str:
+        """Comprehensive project analysis prompt"""
+        return _COMPREHENSIVE_TEMPLATE.format_map({
+            "name": self.project_name,
+            "skills_context": self._skills_context,
+            "commands_context": self._commands_context,
+            "project": context['project_name'],
+            "location": context['project_location'],
+            "date": context['analysis_date'],
+            "context_json": self._extra_context_json(context)
+        })
+
+    def _focused_analysis_prompt(self, context: dict) -> str:
+        """Focused project analysis prompt"""
+        return _FOCUSED_TEMPLATE.format_map({
+            "name": self.project_name,
+            "skills_context": self._skills_context,
+            "project": context['project_name'],
+            "location": context['project_location'],
+            "focus_area": context.get('focus_area', 'current status and next steps'),
+            "date": context['analysis_date']
+        })
+
+    def _quick_analysis_prompt(self, context: dict) -> str:
+        """Quick project analysis prompt"""
+        return _QUICK_TEMPLATE.format_map({
+            "name": self.project_name,
+            "project": context['project_name'],
+            "location": context['project_location'],
+            "date": context['analysis_date']
+        })
+
+    def extract_action_items(self) -> list:
+        """
+        Step 2: Extract actionable items from analysis results
+        """
+        self._log(f"📋 Extracting action items from analysis...")
+        
+        # In a real implementation, this would parse the analysis results
+        # For now, we'll create a structured extraction prompt
+        
+        extraction_prompt = "".join((_EXTRACTION_HEAD, self.project_name, _EXTRACTION_TAIL))
+
+        extraction_task = self._call_agent(
+            _agent_caller_module().AgentType.ORCHESTRATOR,
+            extraction_prompt,
+            f"{self.session_id}_{self.analysis_scope}_extraction"
+        )
+        
+        self.action_items = extraction_task
+        self._summary = None
+        
+        self._log(f"✅ Action items extracted and prioritized")
+        return self.action_items
+    
+    def execute_autonomous_cleanup(self, dry_run: bool = True) -> dict:
+        """
+        Step 2.5: Execute autonomous directory cleanup with permission controls
+        """
+        self._log(f"🔧 {'[DRY RUN] ' if dry_run else ''}Starting autonomous directory cleanup...")
+        
+        task_prompt = "".join((
+            _CLEANUP_HEAD, self.project_name,
+            _CLEANUP_AFTER_NAME, self.project_path,
+            _CLEANUP_AFTER_LOCATION, _CLEANUP_MODE_DRY if dry_run else _CLEANUP_MODE_LIVE,
+            _CLEANUP_TAIL
+        ))
+        
+        self._log(f"🎭 Calling project-organizer agent for autonomous cleanup...")
         
         cleanup_task = {
             "task_type": "autonomous_cleanup",
             "subagent_type": "general-purpose",
             "prompt": task_prompt,
             "description": f"Autonomous directory cleanup for {self.project_name}",
-            "session_id": f"{self.session_id}_cleanup",
+            "session_id": f"{self.session_id}_{self.analysis_scope}_cleanup",
             "dry_run": dry_run,
             "permissions_required": True
         }
         
-        print(f"✅ Cleanup task prepared - {'dry run mode' if dry_run else 'live execution mode'}")
+        self._log(f"✅ Cleanup task prepared - {'dry run mode' if dry_run else 'live execution mode'}")
         return cleanup_task
     
     def generate_organizational_summary(self) -> dict:
         """
         Step 3: Generate structured organizational summary and recommendations
+        Built once per set of results; later calls return the cached summary
         """
-        print(f"📄 Generating organizational summary...")
+        if self._summary is not None:
+            return self._summary
+        
+        self._log(f"📄 Generating organizational summary...")
         
         summary = {
             "project_overview": {
                 "name": self.project_name,
                 "location": self.project_path,
                 "analysis_scope": self.analysis_scope,
-                "analysis_date": datetime.now().isoformat(),
+                "analysis_date": self._run_timestamp().isoformat(),
                 "session_id": self.session_id
             },
             "analysis_results": self.analysis_results,
@@ -376,7 +499,8 @@ Please provide:
             ]
         }
         
-        print(f"✅ Organizational summary generated")
+        self._log(f"✅ Organizational summary generated")
+        self._summary = summary
         return summary
     
     def save_analysis_results(self, filename: str = None) -> str:
@@ -384,34 +508,65 @@ Please provide:
         Step 4: Save analysis results for future reference
         """
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"project_analysis_{self.project_name.replace(' ', '_')}_{timestamp}.json"
+            timestamp = self._run_timestamp().strftime("%Y%m%d_%H%M%S")
+            filename = f"project_analysis_{self.project_name.replace(' ', '_')}_{self.analysis_scope}_{timestamp}.json"
         
-        # Ensure .session directory exists
-        session_dir = os.path.join(os.path.dirname(self.project_path), '.session')
-        os.makedirs(session_dir, exist_ok=True)
+        # Ensure .session directory exists (once per instance)
+        if not self._session_dir_created:
+            os.makedirs(self._session_dir, exist_ok=True)
+            self._session_dir_created = True
         
-        filepath = os.path.join(session_dir, filename)
+        filepath = os.path.join(self._session_dir, filename)
         
-        # Combine all results
+        # Combine all results; the summary's copies of the analysis results and
+        # action items are already top-level, so only its own sections are saved
+        summary = self.generate_organizational_summary()  # Cached from Step 3
         complete_analysis = {
             "project_analysis": self.analysis_results,
             "action_items": self.action_items,
-            "organizational_summary": self.generate_organizational_summary(),
+            "organizational_summary": {
+                "project_overview": summary["project_overview"],
+                "organizational_recommendations": summary["organizational_recommendations"]
+            },
             "metadata": {
                 "analysis_tool": "project-organizer subagent",
                 "framework_version": "Universal Agent Framework v2.0",
-                "analysis_timestamp": datetime.now().isoformat()
+                "analysis_timestamp": self._run_timestamp()
             }
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(complete_analysis, f, indent=2, default=str)
+        # orjson-backed when installed; dataclasses such as the TaskProgress in
+        # action_items are encoded as objects and datetimes as ISO strings
+        with open(filepath, 'wb', buffering=1 << 20) as f:
+            f.write(_agent_caller_module().dumps_json(complete_analysis))
         
-        print(f"💾 Analysis results saved to: {filepath}")
+        self._log(f"💾 Analysis results saved to: {filepath}")
         return filepath
     
-    def run_complete_analysis(self, context: dict = None, include_cleanup: bool = False, dry_run: bool = True) -> dict:
+    def _analysis_cache_path(self, context: dict, include_cleanup: bool, dry_run: bool) -> str:
+        """Cache file for this project state, scope and context"""
+        context_key = json.dumps(context or {}, sort_keys=True, default=str)
+        raw_key = (f"{CACHE_VERSION}|{self.project_path}|{self.analysis_scope}|{include_cleanup}|{dry_run}|"
+                   f"{context_key}|{_project_mtime(self.project_path)}")
+        key = hashlib.blake2b(raw_key.encode(), digest_size=16).hexdigest()
+        return os.path.join(self._session_dir, 'cache', f"{key}.json")
+    
+    def _load_cached_analysis(self, cache_path: str):
+        """Previously cached result whose saved analysis file still exists, or None"""
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict):
+            return None
+        saved_file = cached.get("saved_file")
+        if not isinstance(saved_file, str) or not os.path.exists(saved_file):
+            return None
+        return cached
+    
+    def run_complete_analysis(self, context: dict = None, include_cleanup: bool = False, dry_run: bool = True,
+                              verbose: bool = False, use_cache: bool = True) -> dict:
         """
         Execute complete project organization analysis workflow
         One-command execution for comprehensive project organization
@@ -420,15 +575,27 @@ Please provide:
             context: Additional context for analysis
             include_cleanup: Whether to include autonomous cleanup
             dry_run: If True, show what would be done without executing
+            verbose: Print progress as it happens instead of in one write at the end
+            use_cache: Return the previous result (as decoded JSON) when the project
+                tree, scope and context are unchanged since it was computed
         """
-        print(f"\n📊 Starting Complete Project Organization Analysis")
-        print(f"Project: {self.project_name}")
-        print(f"Scope: {self.analysis_scope}")
+        self._now = datetime.now()
+        self._log_lines = None if verbose else []
+        
+        self._log(f"\n📊 Starting Complete Project Organization Analysis")
+        self._log(f"Project: {self.project_name}")
+        self._log(f"Scope: {self.analysis_scope}")
         if include_cleanup:
-            print(f"Cleanup Mode: {'DRY RUN' if dry_run else 'LIVE EXECUTION'}")
-        print("=" * 60)
+            self._log(f"Cleanup Mode: {'DRY RUN' if dry_run else 'LIVE EXECUTION'}")
+        self._log("=" * 60)
         
         try:
+            cache_path = self._analysis_cache_path(context, include_cleanup, dry_run) if use_cache else None
+            cached = self._load_cached_analysis(cache_path) if cache_path else None
+            if cached is not None:
+                self._log(f"♻️ Project unchanged - reusing cached analysis: {os.path.basename(cached['saved_file'])}")
+                return cached
+            
             # Step 1: Conduct project analysis
             analysis_results = self.conduct_project_analysis(context)
             
@@ -446,13 +613,13 @@ Please provide:
             # Step 4: Save results
             saved_file = self.save_analysis_results()
             
-            print("\n" + "=" * 60)
-            print(f"🎉 PROJECT ANALYSIS COMPLETE: {self.project_name}")
-            print(f"✅ Comprehensive analysis conducted")
-            print(f"📋 Action items extracted and prioritized")
+            self._log("\n" + "=" * 60)
+            self._log(f"🎉 PROJECT ANALYSIS COMPLETE: {self.project_name}")
+            self._log(f"✅ Comprehensive analysis conducted")
+            self._log(f"📋 Action items extracted and prioritized")
             if cleanup_results:
-                print(f"🔧 Autonomous cleanup {'planned (dry run)' if dry_run else 'executed'}")
-            print(f"💾 Results saved to: {os.path.basename(saved_file)}")
+                self._log(f"🔧 Autonomous cleanup {'planned (dry run)' if dry_run else 'executed'}")
+            self._log(f"💾 Results saved to: {os.path.basename(saved_file)}")
             
             result = {
                 "analysis_results": analysis_results,
@@ -463,12 +630,24 @@ Please provide:
             
             if cleanup_results:
                 result["cleanup_results"] = cleanup_results
+            
+            if cache_path:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                with open(cache_path, 'wb') as f:
+                    f.write(_agent_caller_module().dumps_json(result))
                 
             return result
             
         except Exception as e:
-            print(f"\n❌ Analysis failed: {str(e)}")
+            self._log(f"\n❌ Analysis failed: {str(e)}")
             return {"error": str(e), "session_id": self.session_id}
+        
+        finally:
+            # One write for the whole run's progress output
+            if self._log_lines:
+                sys.stdout.write("\n".join(self._log_lines) + "\n")
+                sys.stdout.flush()
+            self._log_lines = None
 
 # Convenience functions for common usage patterns
 def analyze_current_project(analysis_scope: str = "comprehensive", context: dict = None) -> dict:
@@ -488,6 +667,18 @@ def analyze_project(project_path: str, analysis_scope: str = "comprehensive", co
     analyzer = ProjectOrganizerScript(project_name, project_path, analysis_scope)
     return analyzer.run_complete_analysis(context)
 
+def analyze_current_project_multi(scopes=("comprehensive",), context: dict = None) -> dict:
+    """Analyze the current working directory once per scope, sharing one organizer instance"""
+    current_dir = os.getcwd()
+    analyzer = ProjectOrganizerScript(os.path.basename(current_dir), current_dir, scopes[0])
+    
+    results = {}
+    for scope in scopes:
+        if scope != analyzer.analysis_scope:
+            analyzer.set_analysis_scope(scope)
+        results[scope] = analyzer.run_complete_analysis(context)
+    return results
+
 # Example usage patterns
 def example_comprehensive_analysis():
     """Example: Complete project analysis"""
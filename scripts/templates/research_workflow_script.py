@@ -4,45 +4,95 @@ Research Workflow Script Template - Intelligent Research Automation
 Reusable template for comprehensive research projects with multi-agent coordination.
 """
 
+import io
 import sys
 import os
-import json
+import contextlib
+import uuid
+import asyncio
 from datetime import datetime
+from typing import Iterable, Iterator, Optional, Tuple, Union
 
-# Add core modules to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core'))
+# Core modules are put on the path and imported on first use, so running the
+# script for usage output does not load the agent stack
+_CORE_DIR = os.path.join(os.path.dirname(__file__), '..', 'core')
 
-from agent_caller import AgentCaller, AgentType
-from workflow_analyzer import WorkflowAnalyzer
+def _agent_caller_module():
+    """Import agent_caller on first use, adding the core modules to the path"""
+    if _CORE_DIR not in sys.path:
+        sys.path.append(_CORE_DIR)
+    import agent_caller
+    return agent_caller
 
-class ResearchWorkflowScript:
-    """Reusable research workflow automation template"""
+# Agent responses persist here so re-running identical research is served from cache
+RESPONSE_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "research_workflow", "responses.sqlite3")
+
+# Synthesis report headings -> (deliverables section, field) they populate
+_SYNTHESIS_SECTIONS = {
+    "executive summary": ("executive_summary", "key_findings"),
+    "market landscape analysis": ("detailed_findings", "web_research_summary"),
+    "competitive intelligence summary": ("detailed_findings", "competitive_landscape"),
+    "technical assessment": ("detailed_findings", "technical_analysis"),
+    "strategic recommendations": ("executive_summary", "strategic_recommendations"),
+    "next steps and follow-up research areas": ("executive_summary", "next_steps"),
+}
+
+# Static deliverable sections; each run copies them before filling in report text
+_DELIVERABLE_SECTIONS = {
+    "executive_summary": {
+        "key_findings": "Generated from synthesis",
+        "market_opportunities": "Extracted from competitive analysis",
+        "strategic_recommendations": "Derived from comprehensive analysis",
+        "next_steps": "Based on research gaps identified"
+    },
+    "detailed_findings": {
+        "web_research_summary": "Comprehensive market intelligence",
+        "competitive_landscape": "Strategic competitive positioning",
+        "technical_analysis": "Technology and implementation insights",
+        "synthesis_report": "Integrated analysis and recommendations"
+    },
+    "supporting_materials": {
+        "source_inventory": "Complete list of research sources",
+        "data_validation": "Fact-checking and verification notes",
+        "methodology_notes": "Research process documentation",
+        "follow_up_areas": "Additional research opportunities"
+    }
+}
+
+def _iter_report_sections(chunks: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (heading, body) pairs from report text arriving in chunks
+    A section is emitted as soon as the next heading arrives
+    """
+    heading, body, pending = None, [], ""
+    for chunk in chunks:
+        *lines, pending = (pending + chunk).split("\n")
+        for line in lines:
+            # Headings may be bold and may copy the prompt's "(if applicable)" style notes
+            title = line.strip().strip("#-*: ").partition("(")[0].strip("*: ").lower()
+            if title in _SYNTHESIS_SECTIONS or line.startswith("#"):
+                if heading:
+                    yield heading, "\n".join(body).strip()
+                # Unknown markdown headings close the current section
+                heading = title if title in _SYNTHESIS_SECTIONS else None
+                body = []
+            elif heading:
+                body.append(line)
     
-    def __init__(self, research_topic: str, scope: str = "comprehensive"):
-        self.research_topic = research_topic
-        self.scope = scope  # comprehensive, focused, quick
-        self.session_id = f"research_{int(datetime.now().timestamp())}"
-        
-        # Initialize components
-        self.agent_caller = AgentCaller()
-        self.workflow_analyzer = WorkflowAnalyzer()
-        
-        # Research state
-        self.research_findings = {}
-        self.sources = []
-        self.analysis_results = {}
-        
-    def plan_research_strategy(self, requirements: dict) -> dict:
-        """
-        Step 1: Plan comprehensive research strategy
-        Uses orchestrator to coordinate research approach
-        """
-        print(f"🔍 Planning research strategy for: {self.research_topic}")
-        
-        planning_prompt = f"""plan a comprehensive research strategy for: {self.research_topic}
+    if heading:
+        body.append(pending)
+        yield heading, "\n".join(body).strip()
+
+# Shared context sent ahead of every step prompt as a cacheable prefix
+_RESEARCH_CONTEXT_TEMPLATE = """Research Topic: {topic}
+Scope: {scope}
+Requirements: {requirements_json}
+---"""
 
-Research Scope: {self.scope}
-Requirements: {json.dumps(requirements, indent=2)}
+_STRATEGY_PROMPT_TEMPLATE = """plan a comprehensive research strategy for: {topic}
+
+Research Scope: {scope}
+Requirements: {requirements_json}
 
 Create detailed research plan including:
 1. Research phases with specific objectives
@@ -53,32 +103,11 @@ Create detailed research plan including:
 6. Agent coordination for parallel research streams
 
 Provide structured plan with checkboxes for task tracking."""
-        
-        strategy_task = self.agent_caller.call_agent(
-            AgentType.ORCHESTRATOR,
-            planning_prompt,
-            f"{self.session_id}_strategy"
-        )
-        
-        print(f"✅ Research strategy planned")
-        return {"strategy": strategy_task}
-    
-    def execute_web_research(self, research_areas: list) -> dict:
-        """
-        Step 2: Execute web research across multiple areas
-        Uses web-search-researcher for intelligent information gathering
-        """
-        print(f"🌐 Executing web research for {len(research_areas)} areas...")
-        
-        research_results = {}
-        
-        for i, area in enumerate(research_areas):
-            print(f"   Researching: {area}")
-            
-            research_prompt = f"""conduct comprehensive web research on: {area}
 
-Context: This is part of broader research on "{self.research_topic}"
-Research Scope: {self.scope}
+_WEB_RESEARCH_PROMPT_TEMPLATE = """conduct comprehensive web research on: {area}
+
+Context: This is part of broader research on "{topic}"
+Research Scope: {scope}
 
 Research Requirements:
 1. Gather current information (2024-2025 timeframe preferred)
@@ -96,29 +125,11 @@ Focus Areas for {area}:
 - Challenges and opportunities
 
 Provide structured research summary with source citations."""
-            
-            research_task = self.agent_caller.call_agent(
-                AgentType.WEB_SEARCH_RESEARCHER,
-                research_prompt,
-                f"{self.session_id}_web_research_{i+1}"
-            )
-            
-            research_results[area] = research_task
-        
-        print(f"✅ Web research completed for all areas")
-        return research_results
-    
-    def execute_competitive_analysis(self, competitors: list) -> dict:
-        """
-        Step 3: Execute competitive analysis
-        Uses competitive-market-analyst for strategic intelligence
-        """
-        print(f"🏆 Executing competitive analysis for {len(competitors)} entities...")
-        
-        analysis_prompt = f"""conduct comprehensive competitive analysis for: {self.research_topic}
 
-Competitors to analyze: {json.dumps(competitors, indent=2)}
-Analysis Scope: {self.scope}
+_COMPETITIVE_PROMPT_TEMPLATE = """conduct comprehensive competitive analysis for: {topic}
+
+Competitors to analyze: {competitors_json}
+Analysis Scope: {scope}
 
 Competitive Analysis Framework:
 1. Market positioning and value propositions
@@ -139,36 +150,10 @@ Deliverables Required:
 - Market opportunity assessment
 
 Focus on actionable intelligence for strategic decision-making."""
-        
-        competitive_task = self.agent_caller.call_agent(
-            AgentType.COMPETITIVE_MARKET_ANALYST,
-            analysis_prompt,
-            f"{self.session_id}_competitive_analysis"
-        )
-        
-        print(f"✅ Competitive analysis completed")
-        return {"competitive_analysis": competitive_task}
-    
-    def execute_codebase_research(self, codebase_areas: list) -> dict:
-        """
-        Step 4: Execute codebase research (when applicable)
-        Uses codebase-locator and codebase-analyzer for technical research
-        """
-        if not codebase_areas:
-            print("📝 Skipping codebase research (not applicable)")
-            return {}
-            
-        print(f"💻 Executing codebase research for {len(codebase_areas)} areas...")
-        
-        codebase_results = {}
-        
-        # First, locate relevant code
-        for area in codebase_areas:
-            print(f"   Locating code for: {area}")
-            
-            location_prompt = f"""locate and catalog code related to: {area}
 
-Research Context: {self.research_topic}
+_LOCATE_PROMPT_TEMPLATE = """locate and catalog code related to: {area}
+
+Research Context: {topic}
 Search Strategy: Comprehensive discovery
 
 Location Tasks:
@@ -180,17 +165,10 @@ Location Tasks:
 6. Note testing and documentation coverage
 
 Provide organized file inventory with descriptions."""
-            
-            location_task = self.agent_caller.call_agent(
-                AgentType.CODEBASE_LOCATOR,
-                location_prompt,
-                f"{self.session_id}_locate_{area.replace(' ', '_')}"
-            )
-            
-            # Then analyze the found code
-            analysis_prompt = f"""analyze code implementation for: {area}
 
-Research Context: {self.research_topic}
+_CODE_ANALYSIS_PROMPT_TEMPLATE = """analyze code implementation for: {area}
+
+Research Context: {topic}
 Analysis Scope: Technical architecture and implementation patterns
 
 Analysis Requirements:
@@ -202,32 +180,11 @@ Analysis Requirements:
 6. Note testing coverage and documentation quality
 
 Provide comprehensive technical analysis with findings."""
-            
-            analysis_task = self.agent_caller.call_agent(
-                AgentType.CODEBASE_ANALYZER,
-                analysis_prompt,
-                f"{self.session_id}_analyze_{area.replace(' ', '_')}"
-            )
-            
-            codebase_results[area] = {
-                "location": location_task,
-                "analysis": analysis_task
-            }
-        
-        print(f"✅ Codebase research completed")
-        return codebase_results
-    
-    def synthesize_findings(self, all_research_data: dict) -> dict:
-        """
-        Step 5: Synthesize all research findings
-        Uses orchestrator to coordinate comprehensive analysis
-        """
-        print(f"🧠 Synthesizing research findings...")
-        
-        synthesis_prompt = f"""synthesize comprehensive research findings for: {self.research_topic}
+
+_SYNTHESIS_PROMPT_TEMPLATE = """synthesize comprehensive research findings for: {topic}
 
 Research Data Summary:
-{json.dumps(list(all_research_data.keys()), indent=2)}
+{data_keys_json}
 
 Synthesis Requirements:
 1. Integrate findings from all research streams
@@ -249,10 +206,270 @@ Deliverable Structure:
 - Next Steps and Follow-up Research Areas
 
 Focus on actionable intelligence for decision-making."""
+
+def _unique_areas(areas: list) -> list:
+    """Drop repeated areas (ignoring case and surrounding whitespace), keeping first-seen names"""
+    display_names = {}
+    for area in areas:
+        display_names.setdefault(area.strip().lower(), area.strip())
+    return list(display_names.values())
+
+class ResearchWorkflowScript:
+    """Reusable research workflow automation template"""
+    
+    def __init__(self,
+                 research_topic: str,
+                 scope: str = "comprehensive",
+                 cache_path: Optional[str] = RESPONSE_CACHE_PATH):
+        self.research_topic = research_topic
+        self.scope = scope  # comprehensive, focused, quick
+        # uuid4 keeps ids unique even for workflows started within the same second
+        self.session_id = f"research_{uuid.uuid4().hex[:12]}"
+        
+        # Initialize components
+        self.agent_caller = _agent_caller_module().AgentCaller(cache_path=cache_path)
+        self._workflow_analyzer = None  # Built on first access
+        
+        # Shared research context leading every step prompt (set per workflow run)
+        self._cached_prefix: Optional[str] = None
+        
+        # Research state
+        self.research_findings = {}
+        self.sources = []
+        self.analysis_results = {}
         
-        synthesis_task = self.agent_caller.call_agent(
-            AgentType.ORCHESTRATOR,
-            synthesis_prompt,
+    @property
+    def workflow_analyzer(self):
+        """WorkflowAnalyzer, imported and constructed on first access"""
+        if self._workflow_analyzer is None:
+            _agent_caller_module()  # Ensures the core modules are on the path
+            from workflow_analyzer import WorkflowAnalyzer
+            self._workflow_analyzer = WorkflowAnalyzer()
+        return self._workflow_analyzer
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def close(self):
+        """Release the shared AgentCaller's resources once the workflow is done"""
+        self.agent_caller.close()
+    
+    def _with_cached_prefix(self, prompt: str) -> Union[str, Tuple[str, str]]:
+        """Pair a step prompt with the shared research context for provider-side caching"""
+        if self._cached_prefix:
+            return self._cached_prefix, prompt
+        return prompt
+    
+    @contextlib.contextmanager
+    def _buffered_output(self):
+        """Collect a phase's progress output and write it in one call at the phase boundary"""
+        buffer = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buffer):
+                yield
+        finally:
+            sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
+    
+    def plan_research_strategy(self, requirements: dict) -> dict:
+        """
+        Step 1: Plan comprehensive research strategy
+        Uses orchestrator to coordinate research approach
+        """
+        return asyncio.run(self.plan_research_strategy_async(requirements))
+    
+    async def plan_research_strategy_async(self, requirements: dict) -> dict:
+        """Awaitable strategy planning; retries back off without blocking the event loop"""
+        print(f"🔍 Planning research strategy for: {self.research_topic}")
+        
+        planning_prompt = _STRATEGY_PROMPT_TEMPLATE.format(
+            topic=self.research_topic,
+            scope=self.scope,
+            requirements_json=_agent_caller_module().dumps_json(requirements).decode()
+        )
+        
+        strategy_task = await self.agent_caller.call_agent_async(
+            _agent_caller_module().AgentType.ORCHESTRATOR,
+            self._with_cached_prefix(planning_prompt),
+            f"{self.session_id}_strategy"
+        )
+        
+        print(f"✅ Research strategy planned")
+        return {"strategy": strategy_task}
+    
+    def execute_web_research(self, research_areas: list, batch: bool = False) -> dict:
+        """
+        Step 2: Execute web research across multiple areas
+        Uses web-search-researcher for intelligent information gathering
+        """
+        return asyncio.run(self.execute_web_research_async(research_areas, batch))
+    
+    def _web_research_prompt(self, area: str) -> str:
+        """Build the web-search-researcher prompt for one research area"""
+        return _WEB_RESEARCH_PROMPT_TEMPLATE.format(
+            area=area, topic=self.research_topic, scope=self.scope
+        )
+    
+    async def execute_web_research_async(self, research_areas: list, batch: bool = False) -> dict:
+        """
+        Awaitable Step 2: dispatch every research area concurrently
+        A failed area is recorded as an error entry instead of aborting the others;
+        batch=True packs all areas into one agent call instead
+        """
+        research_areas = _unique_areas(research_areas)
+        print(f"🌐 Executing web research for {len(research_areas)} areas...")
+        
+        if batch:
+            for area in research_areas:
+                print(f"   Researching: {area}")
+            
+            # Each area's findings come back under its area_N key of the batch results
+            batch_task = self.agent_caller.call_agent_batch(
+                _agent_caller_module().AgentType.WEB_SEARCH_RESEARCHER,
+                {f"area_{i+1}": self._web_research_prompt(area)
+                 for i, area in enumerate(research_areas)},
+                f"{self.session_id}_web_research_batch",
+                static_prefix=self._cached_prefix
+            )
+            
+            print(f"✅ Web research completed for all areas")
+            return dict.fromkeys(research_areas, batch_task)
+        
+        async def research_area(area: str, task_id: str):
+            print(f"   Researching: {area}")
+            
+            return await self.agent_caller.call_agent_async(
+                _agent_caller_module().AgentType.WEB_SEARCH_RESEARCHER,
+                self._with_cached_prefix(self._web_research_prompt(area)),
+                task_id
+            )
+        
+        task_prefix = f"{self.session_id}_web_research_"
+        task_ids = [f"{task_prefix}{i}" for i in range(1, len(research_areas) + 1)]
+        
+        results = await asyncio.gather(
+            *map(research_area, research_areas, task_ids),
+            return_exceptions=True
+        )
+        
+        research_results = {
+            area: {"error": str(result)} if isinstance(result, Exception) else result
+            for area, result in zip(research_areas, results)
+        }
+        
+        print(f"✅ Web research completed for all areas")
+        return research_results
+    
+    def execute_competitive_analysis(self, competitors: list) -> dict:
+        """
+        Step 3: Execute competitive analysis
+        Uses competitive-market-analyst for strategic intelligence
+        """
+        return asyncio.run(self.execute_competitive_analysis_async(competitors))
+    
+    async def execute_competitive_analysis_async(self, competitors: list) -> dict:
+        """Awaitable Step 3: competitive analysis as a single agent call"""
+        if not competitors:
+            print("🏆 Skipping competitive analysis (no competitors)")
+            return {}
+            
+        print(f"🏆 Executing competitive analysis for {len(competitors)} entities...")
+        
+        analysis_prompt = _COMPETITIVE_PROMPT_TEMPLATE.format(
+            topic=self.research_topic,
+            scope=self.scope,
+            competitors_json=_agent_caller_module().dumps_json(competitors).decode()
+        )
+        
+        competitive_task = await self.agent_caller.call_agent_async(
+            _agent_caller_module().AgentType.COMPETITIVE_MARKET_ANALYST,
+            self._with_cached_prefix(analysis_prompt),
+            f"{self.session_id}_competitive_analysis"
+        )
+        
+        print(f"✅ Competitive analysis completed")
+        return {"competitive_analysis": competitive_task}
+    
+    def execute_codebase_research(self, codebase_areas: list) -> dict:
+        """
+        Step 4: Execute codebase research (when applicable)
+        Uses codebase-locator and codebase-analyzer for technical research
+        """
+        return asyncio.run(self.execute_codebase_research_async(codebase_areas))
+    
+    async def execute_codebase_research_async(self, codebase_areas: list) -> dict:
+        """
+        Awaitable Step 4: locate and analyze every area concurrently
+        The analysis prompt does not consume location output, so both stages run together
+        """
+        codebase_areas = _unique_areas(codebase_areas or [])
+        if not codebase_areas:
+            print("📝 Skipping codebase research (not applicable)")
+            return {}
+            
+        print(f"💻 Executing codebase research for {len(codebase_areas)} areas...")
+        
+        async def locate(area: str):
+            print(f"   Locating code for: {area}")
+            
+            location_prompt = _LOCATE_PROMPT_TEMPLATE.format(area=area, topic=self.research_topic)
+            
+            return await self.agent_caller.call_agent_async(
+                _agent_caller_module().AgentType.CODEBASE_LOCATOR,
+                self._with_cached_prefix(location_prompt),
+                f"{self.session_id}_locate_{area.replace(' ', '_')}"
+            )
+        
+        async def analyze(area: str):
+            analysis_prompt = _CODE_ANALYSIS_PROMPT_TEMPLATE.format(area=area, topic=self.research_topic)
+            
+            return await self.agent_caller.call_agent_async(
+                _agent_caller_module().AgentType.CODEBASE_ANALYZER,
+                self._with_cached_prefix(analysis_prompt),
+                f"{self.session_id}_analyze_{area.replace(' ', '_')}"
+            )
+        
+        stages = []
+        for area in codebase_areas:
+            stages.append((area, "location", locate(area)))
+            stages.append((area, "analysis", analyze(area)))
+        
+        results = await asyncio.gather(
+            *(coro for _, _, coro in stages),
+            return_exceptions=True
+        )
+        
+        codebase_results = {}
+        for (area, stage, _), result in zip(stages, results):
+            if isinstance(result, Exception):
+                result = {"error": str(result)}
+            codebase_results.setdefault(area, {})[stage] = result
+        
+        print(f"✅ Codebase research completed")
+        return codebase_results
+    
+    def synthesize_findings(self, all_research_data: dict) -> dict:
+        """
+        Step 5: Synthesize all research findings
+        Uses orchestrator to coordinate comprehensive analysis
+        """
+        return asyncio.run(self.synthesize_findings_async(all_research_data))
+    
+    async def synthesize_findings_async(self, all_research_data: dict) -> dict:
+        """Awaitable synthesis; retries back off without blocking the event loop"""
+        print(f"🧠 Synthesizing research findings...")
+        
+        synthesis_prompt = _SYNTHESIS_PROMPT_TEMPLATE.format(
+            topic=self.research_topic,
+            data_keys_json=_agent_caller_module().dumps_json(list(all_research_data)).decode()
+        )
+        
+        synthesis_task = await self.agent_caller.call_agent_async(
+            _agent_caller_module().AgentType.ORCHESTRATOR,
+            self._with_cached_prefix(synthesis_prompt),
             f"{self.session_id}_synthesis"
         )
         
@@ -273,32 +490,29 @@ Focus on actionable intelligence for decision-making."""
                 "session_id": self.session_id,
                 "completion_date": datetime.now().isoformat(),
                 "research_methodology": "Multi-agent coordinated research"
-            },
-            "executive_summary": {
-                "key_findings": "Generated from synthesis",
-                "market_opportunities": "Extracted from competitive analysis",
-                "strategic_recommendations": "Derived from comprehensive analysis",
-                "next_steps": "Based on research gaps identified"
-            },
-            "detailed_findings": {
-                "web_research_summary": "Comprehensive market intelligence",
-                "competitive_landscape": "Strategic competitive positioning",
-                "technical_analysis": "Technology and implementation insights",
-                "synthesis_report": "Integrated analysis and recommendations"
-            },
-            "supporting_materials": {
-                "source_inventory": "Complete list of research sources",
-                "data_validation": "Fact-checking and verification notes",
-                "methodology_notes": "Research process documentation",
-                "follow_up_areas": "Additional research opportunities"
             }
         }
+        deliverables.update(
+            (section, dict(fields)) for section, fields in _DELIVERABLE_SECTIONS.items()
+        )
         
-        print(f"✅ Research deliverables generated")
-        print(f"   - Executive summary with key findings")
-        print(f"   - Detailed analysis report")
-        print(f"   - Strategic recommendations")
-        print(f"   - Supporting research materials")
+        # Fill sections from the synthesis report; a streamed report (iterable of
+        # chunks) is consumed section by section as it arrives
+        synthesis_results = getattr(synthesis.get("synthesis"), "results", None) or {}
+        report = synthesis_results.get("report", ())
+        if isinstance(report, str):
+            report = (report,)
+        for heading, body in _iter_report_sections(report):
+            section, field = _SYNTHESIS_SECTIONS[heading]
+            deliverables[section][field] = body
+        
+        print(
+            f"✅ Research deliverables generated\n"
+            f"   - Executive summary with key findings\n"
+            f"   - Detailed analysis report\n"
+            f"   - Strategic recommendations\n"
+            f"   - Supporting research materials"
+        )
         
         return deliverables
     
@@ -311,161 +525,227 @@ Focus on actionable intelligence for decision-making."""
         Execute complete research workflow
         One-command execution of entire research process
         """
-        print(f"\n🔬 Starting Complete Research Workflow")
-        print(f"Topic: {self.research_topic}")
-        print(f"Scope: {self.scope}")
-        print(f"Session: {self.session_id}")
-        print("=" * 60)
+        return asyncio.run(self.run_complete_research_workflow_async(
+            requirements, research_areas, competitors, codebase_areas
+        ))
+    
+    async def run_complete_research_workflow_async(self,
+                                                   requirements: dict,
+                                                   research_areas: list = None,
+                                                   competitors: list = None,
+                                                   codebase_areas: list = None) -> dict:
+        """
+        Awaitable complete research workflow
+        Web, competitive and codebase research are independent and run concurrently
+        """
+        print(
+            f"\n🔬 Starting Complete Research Workflow\n"
+            f"Topic: {self.research_topic}\n"
+            f"Scope: {self.scope}\n"
+            f"Session: {self.session_id}\n"
+            + "=" * 60
+        )
+        
+        # Identical across Steps 1-5, so the provider processes it once per workflow
+        self._cached_prefix = _RESEARCH_CONTEXT_TEMPLATE.format(
+            topic=self.research_topic,
+            scope=self.scope,
+            requirements_json=_agent_caller_module().dumps_json(requirements).decode()
+        )
+        
+        # Each step records its failure and the workflow continues, so synthesis
+        # still runs over whatever research succeeded
+        all_research_data = {}
+        failed_steps = {}
+        self.research_findings = all_research_data
         
+        # Step 1: Research Strategy Planning
         try:
-            all_research_data = {}
-            
-            # Step 1: Research Strategy Planning
-            strategy = self.plan_research_strategy(requirements)
-            all_research_data["strategy"] = strategy
-            
-            # Step 2: Web Research
-            if research_areas:
-                web_research = self.execute_web_research(research_areas)
-                all_research_data["web_research"] = web_research
-            
-            # Step 3: Competitive Analysis
-            if competitors:
-                competitive_analysis = self.execute_competitive_analysis(competitors)
-                all_research_data["competitive_analysis"] = competitive_analysis
-            
-            # Step 4: Codebase Research  
-            if codebase_areas:
-                codebase_research = self.execute_codebase_research(codebase_areas)
-                all_research_data["codebase_research"] = codebase_research
-            
-            # Step 5: Synthesis
-            synthesis = self.synthesize_findings(all_research_data)
-            all_research_data["synthesis"] = synthesis
-            
-            # Step 6: Generate Deliverables
-            deliverables = self.generate_research_deliverables(synthesis)
-            
-            print("\n" + "=" * 60)
-            print(f"🎉 RESEARCH COMPLETE: {self.research_topic}")
-            print(f"✅ All research streams completed successfully")
-            print(f"📊 Comprehensive deliverables ready for review")
-            
-            return deliverables
+            with self._buffered_output():
+                all_research_data["strategy"] = await self.plan_research_strategy_async(requirements)
+        except Exception as e:
+            self._record_step_failure(failed_steps, "strategy", e)
+        
+        # Steps 2-4: Web, Competitive and Codebase Research (independent)
+        phases = []
+        if research_areas:
+            phases.append(("web_research", self.execute_web_research_async(research_areas)))
+        if competitors:
+            phases.append(("competitive_analysis", self.execute_competitive_analysis_async(competitors)))
+        if codebase_areas:
+            phases.append(("codebase_research", self.execute_codebase_research_async(codebase_areas)))
+        
+        with self._buffered_output():
+            phase_results = await asyncio.gather(
+                *(coro for _, coro in phases),
+                return_exceptions=True
+            )
+        for (key, _), result in zip(phases, phase_results):
+            if isinstance(result, Exception):
+                self._record_step_failure(failed_steps, key, result)
+            else:
+                all_research_data[key] = result
+        
+        try:
+            # Steps 5-6: Synthesis and Deliverables
+            with self._buffered_output():
+                synthesis = await self.synthesize_findings_async(all_research_data)
+                all_research_data["synthesis"] = synthesis
+                deliverables = self.generate_research_deliverables(synthesis)
             
         except Exception as e:
             print(f"\n❌ Research workflow failed: {str(e)}")
-            return {"error": str(e), "session_id": self.session_id}
+            return {
+                "error": str(e),
+                "session_id": self.session_id,
+                "completed_steps": list(all_research_data),
+                "failed_steps": failed_steps
+            }
+        
+        if failed_steps:
+            deliverables["research_overview"]["failed_steps"] = failed_steps
+            status = f"⚠️ Completed with failed steps: {', '.join(failed_steps)}"
+        else:
+            status = "✅ All research streams completed successfully"
+        
+        print(
+            "\n" + "=" * 60 + "\n"
+            f"🎉 RESEARCH COMPLETE: {self.research_topic}\n"
+            f"{status}\n"
+            f"📊 Comprehensive deliverables ready for review"
+        )
+        
+        return deliverables
+    
+    def _record_step_failure(self, failed_steps: dict, step: str, error: Exception):
+        """Note a failed workflow step so the remaining steps can continue"""
+        failed_steps[step] = str(error)
+        print(f"⚠️ {step} failed: {error} - continuing with remaining research")
 
 # Example usage patterns
+_MARKET_REQUIREMENTS = {
+    "target_market": "Professional developers and enterprises",
+    "geographic_scope": "Global, focus on US/EU markets", 
+    "time_horizon": "2025-2026 planning horizon",
+    "decision_context": "Product positioning and pricing strategy"
+}
+
+_MARKET_AREAS = (
+    "AI coding assistant market size and growth",
+    "Developer productivity tools adoption trends",
+    "Enterprise software procurement patterns",
+    "AI technology integration preferences"
+)
+
+_MARKET_COMPETITORS = (
+    "GitHub Copilot",
+    "Cursor AI IDE", 
+    "JetBrains AI Assistant",
+    "Amazon CodeWhisperer",
+    "Tabnine"
+)
+
+_TECHNOLOGY_REQUIREMENTS = {
+    "project_context": "Large-scale enterprise application",
+    "performance_requirements": "High scalability and maintainability",
+    "team_context": "Mixed experience levels",
+    "timeline": "6-month development cycle"
+}
+
+_TECHNOLOGY_AREAS = (
+    "React ecosystem maturity and trends",
+    "Vue.js enterprise adoption",
+    "Angular framework evolution", 
+    "Performance benchmarking studies"
+)
+
+_TECHNOLOGY_CODEBASE_AREAS = (
+    "Frontend component libraries",
+    "State management patterns",
+    "Build and deployment configurations"
+)
+
+_COMPETITIVE_REQUIREMENTS = {
+    "analysis_focus": "Multi-cloud strategy implications",
+    "business_context": "Enterprise migration planning",
+    "cost_considerations": "TCO optimization priorities",
+    "compliance_needs": "SOC2, GDPR, HIPAA requirements"
+}
+
+_COMPETITIVE_AREAS = (
+    "Multi-cloud adoption trends",
+    "Hybrid cloud market evolution",
+    "Cloud cost optimization strategies"
+)
+
+_COMPETITIVE_COMPETITORS = (
+    "Amazon Web Services",
+    "Microsoft Azure",
+    "Google Cloud Platform", 
+    "Digital Ocean",
+    "Linode"
+)
+
 def market_research_example():
     """Example: AI IDE market research"""
-    research = ResearchWorkflowScript(
+    with ResearchWorkflowScript(
         research_topic="AI-powered IDE market positioning and pricing strategy",
         scope="comprehensive"
-    )
-    
-    return research.run_complete_research_workflow(
-        requirements={
-            "target_market": "Professional developers and enterprises",
-            "geographic_scope": "Global, focus on US/EU markets", 
-            "time_horizon": "2025-2026 planning horizon",
-            "decision_context": "Product positioning and pricing strategy"
-        },
-        research_areas=[
-            "AI coding assistant market size and growth",
-            "Developer productivity tools adoption trends",
-            "Enterprise software procurement patterns",
-            "AI technology integration preferences"
-        ],
-        competitors=[
-            "GitHub Copilot",
-            "Cursor AI IDE", 
-            "JetBrains AI Assistant",
-            "Amazon CodeWhisperer",
-            "Tabnine"
-        ]
-    )
+    ) as research:
+        return research.run_complete_research_workflow(
+            requirements=_MARKET_REQUIREMENTS,
+            research_areas=_MARKET_AREAS,
+            competitors=_MARKET_COMPETITORS
+        )
 
 def technology_research_example():
     """Example: Technology stack research"""
-    research = ResearchWorkflowScript(
+    with ResearchWorkflowScript(
         research_topic="Modern web development framework comparison",
         scope="focused"
-    )
-    
-    return research.run_complete_research_workflow(
-        requirements={
-            "project_context": "Large-scale enterprise application",
-            "performance_requirements": "High scalability and maintainability",
-            "team_context": "Mixed experience levels",
-            "timeline": "6-month development cycle"
-        },
-        research_areas=[
-            "React ecosystem maturity and trends",
-            "Vue.js enterprise adoption",
-            "Angular framework evolution", 
-            "Performance benchmarking studies"
-        ],
-        codebase_areas=[
-            "Frontend component libraries",
-            "State management patterns",
-            "Build and deployment configurations"
-        ]
-    )
+    ) as research:
+        return research.run_complete_research_workflow(
+            requirements=_TECHNOLOGY_REQUIREMENTS,
+            research_areas=_TECHNOLOGY_AREAS,
+            codebase_areas=_TECHNOLOGY_CODEBASE_AREAS
+        )
 
 def competitive_intelligence_example():
     """Example: Pure competitive intelligence"""
-    research = ResearchWorkflowScript(
+    with ResearchWorkflowScript(
         research_topic="Cloud infrastructure competitive landscape",
         scope="comprehensive"
-    )
-    
-    return research.run_complete_research_workflow(
-        requirements={
-            "analysis_focus": "Multi-cloud strategy implications",
-            "business_context": "Enterprise migration planning",
-            "cost_considerations": "TCO optimization priorities",
-            "compliance_needs": "SOC2, GDPR, HIPAA requirements"
-        },
-        research_areas=[
-            "Multi-cloud adoption trends",
-            "Hybrid cloud market evolution",
-            "Cloud cost optimization strategies"
-        ],
-        competitors=[
-            "Amazon Web Services",
-            "Microsoft Azure",
-            "Google Cloud Platform", 
-            "Digital Ocean",
-            "Linode"
-        ]
-    )
+    ) as research:
+        return research.run_complete_research_workflow(
+            requirements=_COMPETITIVE_REQUIREMENTS,
+            research_areas=_COMPETITIVE_AREAS,
+            competitors=_COMPETITIVE_COMPETITORS
+        )
+
+_EXAMPLES = {
+    "market": market_research_example,
+    "technology": technology_research_example,
+    "competitive": competitive_intelligence_example,
+}
 
 if __name__ == "__main__":
     # Run example research
     if len(sys.argv) > 1:
-        research_type = sys.argv[1]
-        
-        if research_type == "market":
-            result = market_research_example()
-        elif research_type == "technology":
-            result = technology_research_example() 
-        elif research_type == "competitive":
-            result = competitive_intelligence_example()
-        else:
-            print("Usage: python research_workflow_script.py [market|technology|competitive]")
+        example = _EXAMPLES.get(sys.argv[1])
+        if example is None:
+            print(f"Usage: python research_workflow_script.py [{'|'.join(_EXAMPLES)}]")
             sys.exit(1)
+        result = example()
     else:
         # Custom research
-        research = ResearchWorkflowScript(
+        with ResearchWorkflowScript(
             research_topic="Your research topic here",
             scope="comprehensive"
-        )
-        result = research.run_complete_research_workflow(
-            requirements={"context": "Your requirements here"},
-            research_areas=["Area 1", "Area 2"],
-            competitors=["Competitor 1", "Competitor 2"]
-        )
+        ) as research:
+            result = research.run_complete_research_workflow(
+                requirements={"context": "Your requirements here"},
+                research_areas=["Area 1", "Area 2"],
+                competitors=["Competitor 1", "Competitor 2"]
+            )
     
     print(f"\nResearch deliverables: {list(result.keys())}")
\ No newline at end of file
@@ -4,22 +4,186 @@ Performance Monitor - Token Optimization and Execution Tracking
 Provides comprehensive performance monitoring with token cost optimization.
 """
 
+import re
+import sys
 import time
 import json
 import os
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate, chain, count
+from functools import cache, lru_cache
+from operator import attrgetter
+from types import MappingProxyType
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, List, Optional, Tuple, Any
+from dataclasses import dataclass, asdict, field, is_dataclass
 from contextlib import contextmanager
 
-@dataclass 
+try:
+    import orjson  # Optional C-accelerated JSON encoder
+except ImportError:
+    orjson = None
+
+# Task complexity keywords -> token multiplier, checked in priority order
+_COMPLEXITY_MULTIPLIERS = (
+    (frozenset(('comprehensive', 'complete', 'detailed')), 1.5),
+    (frozenset(('quick', 'simple', 'basic')), 0.7),
+    (frozenset(('autonomous', 'coordinate', 'multi-agent')), 2.0),
+)
+
+# Task type keyword -> (budget key, fallback) raising the base estimate, in priority order
+_TASK_TYPE_BUDGETS = (
+    ('analysis', ('comprehensive_analysis', 15000)),
+    ('research', ('research-agent', 6000)),
+)
+
+# One pass finds every keyword; the lookahead also reports overlapping matches
+_ESTIMATE_KEYWORDS = [keyword for keywords, _ in _COMPLEXITY_MULTIPLIERS for keyword in sorted(keywords)]
+_ESTIMATE_KEYWORDS += [keyword for keyword, _ in _TASK_TYPE_BUDGETS]
+_ESTIMATE_KEYWORD_PATTERN = re.compile("(?=({}))".format("|".join(map(re.escape, _ESTIMATE_KEYWORDS))))
+
+# Agent role bits used by the agent-specific optimization checks
+_AGENT_ORCHESTRATOR = 1
+_AGENT_ANALYZER = 2
+_AGENT_FLAGS = MappingProxyType({
+    "orchestrator": _AGENT_ORCHESTRATOR,
+    "codebase-analyzer": _AGENT_ANALYZER,
+})
+
+@lru_cache(maxsize=256)
+def _agent_flags(agent_type: str) -> int:
+    """Role bits for an agent type; unknown types fall back to name matching"""
+    flags = _AGENT_FLAGS.get(agent_type)
+    if flags is None:
+        name = agent_type.lower()
+        flags = (_AGENT_ORCHESTRATOR if "orchestrator" in name else 0) | (_AGENT_ANALYZER if "analyzer" in name else 0)
+    return flags
+
+# Optimization opportunity messages, shared (and interned) across every task
+# that reports them so counting them hashes one object per message
+_OPP_HIGH_TOKEN_USAGE = sys.intern("High token usage detected - consider prompt optimization")
+_OPP_MODERATE_TOKEN_USAGE = sys.intern("Moderate token inefficiency - review context management")
+_OPP_LONG_EXECUTION = sys.intern("Long execution time - consider task decomposition")
+_OPP_COMPLEX_TASK = sys.intern("Complex task detected - validate agent selection")
+_OPP_TIMEOUT = sys.intern("Timeout detected - increase limits or optimize complexity")
+_OPP_TOKEN_LIMIT = sys.intern("Token limit issue - implement context compression")
+_OPP_ERROR_HANDLING = sys.intern("Error handling - review input validation and retry logic")
+_OPP_LONG_ORCHESTRATION = sys.intern("Long orchestration - consider parallel agent execution")
+_OPP_ANALYSIS_INEFFICIENCY = sys.intern("Analysis inefficiency - optimize search patterns and context")
+
+# Static optimization recommendations
+_REC_CONTEXT_COMPRESSION = sys.intern("Implement context compression and prompt optimization strategies")
+_REC_PROMPT_ENGINEERING = sys.intern("Review prompt engineering for better token efficiency")
+_REC_TASK_DECOMPOSITION = sys.intern("Consider task decomposition and parallel execution")
+_REC_AGENT_SELECTION = sys.intern("Optimize agent selection and task complexity")
+_REC_ERROR_HANDLING = sys.intern("Improve error handling and input validation")
+_REC_NO_DATA = sys.intern("No data available for optimization analysis")
+
+# Grade score ladders: a value at or above cuts[i] earns scores[i + 1]
+_EFFICIENCY_CUTS, _EFFICIENCY_SCORES = (0.6, 0.75, 0.9), (10, 20, 30, 40)
+_SUCCESS_CUTS, _SUCCESS_SCORES = (0.7, 0.85, 0.95), (10, 20, 30, 40)
+_COMPLETION_CUTS, _COMPLETION_SCORES = (3, 5, 10), (5, 10, 15, 20)
+_GRADE_CUTS = (50, 60, 70, 80, 90)
+_GRADE_LABELS = (
+    "C (Requires Optimization)",
+    "C+ (Needs Improvement)",
+    "B (Satisfactory)",
+    "B+ (Good)",
+    "A (Very Good)",
+    "A+ (Excellent)"
+)
+
+# Token efficiency distribution bins [lo, hi); efficiencies of 1.0 fall outside them
+_EFFICIENCY_BIN_EDGES = (0, 0.4, 0.6, 0.8, 1.0)
+_EFFICIENCY_BIN_LABELS = tuple(f"{lo}-{hi}" for lo, hi in zip(_EFFICIENCY_BIN_EDGES, _EFFICIENCY_BIN_EDGES[1:]))
+
+# Immutable configuration shared by every PerformanceMonitor instance
+_OPTIMIZATION_RULES = MappingProxyType({
+    "token_efficiency": MappingProxyType({
+        "excellent": 0.9,
+        "good": 0.75,
+        "acceptable": 0.6,
+        "needs_optimization": 0.4
+    }),
+    "duration_thresholds": MappingProxyType({
+        "quick_task": 30,      # seconds
+        "normal_task": 120,    # seconds  
+        "complex_task": 300,   # seconds
+        "long_task": 600       # seconds
+    }),
+    "optimization_patterns": MappingProxyType({
+        "high_token_usage": "Consider context compression or prompt optimization",
+        "slow_execution": "Review agent selection and task complexity",
+        "low_efficiency": "Optimize prompt structure and context management",
+        "frequent_retries": "Improve error handling and validation",
+        "context_overflow": "Implement progressive disclosure patterns"
+    })
+})
+
+# Token budgets for different agent types and tasks
+_TOKEN_BUDGETS = MappingProxyType({
+    # Agent-specific budgets
+    "orchestrator": 15000,
+    "project-organizer": 8000,
+    "codebase-analyzer": 12000,
+    "security-specialist": 10000,
+    "research-agent": 6000,
+    
+    # Task-specific budgets  
+    "quick_analysis": 3000,
+    "comprehensive_analysis": 15000,
+    "autonomous_execution": 20000,
+    "multi_agent_coordination": 25000,
+    
+    # Default budgets
+    "default_agent": 5000,
+    "default_task": 8000
+})
+
+def _compute_token_estimate(budgets: Dict[str, int], agent_type: str, task_description: str) -> int:
+    """Estimate token usage based on agent type and task complexity"""
+    
+    # Base estimate from agent type
+    base_tokens = budgets.get(agent_type, budgets["default_agent"])
+    
+    hits = set(_ESTIMATE_KEYWORD_PATTERN.findall(task_description.lower()))
+    
+    # Adjust based on task complexity
+    complexity_multiplier = next(
+        (multiplier for keywords, multiplier in _COMPLEXITY_MULTIPLIERS if not keywords.isdisjoint(hits)),
+        1.0
+    )
+    
+    # Task type adjustments
+    for keyword, (budget_key, fallback) in _TASK_TYPE_BUDGETS:
+        if keyword in hits:
+            base_tokens = max(base_tokens, budgets.get(budget_key, fallback))
+            break
+    
+    return int(base_tokens * complexity_multiplier)
+
+@lru_cache(maxsize=512)
+def _estimate_default_tokens(agent_type: str, task_description: str) -> int:
+    """Memoized estimate against the shared default budgets"""
+    return _compute_token_estimate(_TOKEN_BUDGETS, agent_type, task_description)
+
+def _ns_to_iso(timestamp_ns: Optional[int]) -> Optional[str]:
+    """Format a time.time_ns() reading as a local ISO-8601 timestamp"""
+    if timestamp_ns is None:
+        return None
+    return datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Performance metrics for agent execution"""
     session_id: str
     agent_type: str
     task_description: str
-    start_time: str
-    end_time: Optional[str] = None
+    # Wall-clock time.time_ns() readings; formatted only when exported
+    start_time: int
+    end_time: Optional[int] = None
     duration_seconds: Optional[float] = None
     estimated_tokens: Optional[int] = None
     actual_tokens: Optional[int] = None
@@ -27,12 +191,43 @@ class PerformanceMetrics:
     success: bool = True
     error_message: Optional[str] = None
     optimization_opportunities: List[str] = None
+    # time.monotonic() readings used for duration; not part of exported reports
+    _start_mono: Optional[float] = field(default=None, repr=False)
+    _end_mono: Optional[float] = field(default=None, repr=False)
+    _agent_flags: int = field(default=0, repr=False)
     
     def __post_init__(self):
         if self.optimization_opportunities is None:
             self.optimization_opportunities = []
+    
+    @property
+    def start_time_iso(self) -> str:
+        return _ns_to_iso(self.start_time)
+    
+    @property
+    def end_time_iso(self) -> Optional[str]:
+        return _ns_to_iso(self.end_time)
+
+def _export_metrics(metrics: PerformanceMetrics) -> Dict[str, Any]:
+    """Serialize metrics for reports, leaving out private bookkeeping fields"""
+    exported = {key: value for key, value in asdict(metrics).items() if not key.startswith("_")}
+    exported["start_time"] = metrics.start_time_iso
+    exported["end_time"] = metrics.end_time_iso
+    return exported
 
-@dataclass
+def _json_default(obj: Any) -> Any:
+    """Encode dataclasses as objects and anything else by its string form"""
+    if is_dataclass(obj):
+        return asdict(obj)
+    return str(obj)
+
+def _dumps_report(report: Dict[str, Any]) -> bytes:
+    """Serialize a report to indented JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(report, default=_json_default, option=orjson.OPT_INDENT_2)
+    return json.dumps(report, indent=2, default=_json_default).encode()
+
+@dataclass(slots=True)
 class SessionSummary:
     """Summary statistics for a performance monitoring session"""
     session_id: str
@@ -46,6 +241,56 @@ class SessionSummary:
     top_optimizations: List[str]
     performance_grade: str
 
+def _rolling_nonzero_means(values: List[float], window: int) -> List[float]:
+    """
+    Mean of the non-zero values in each sliding window, skipping windows with none
+    Prefix sums make this O(N) instead of re-summing every window
+    """
+    sums = [0.0, *accumulate(values)]
+    counts = [0, *accumulate(value != 0 for value in values)]
+    
+    means = []
+    for end in range(window, len(values) + 1):
+        count = counts[end] - counts[end - window]
+        if count:
+            means.append((sums[end] - sums[end - window]) / count)
+    return means
+
+def _efficiency_histogram(efficiencies: Iterable[float]) -> List[int]:
+    """
+    Counts per _EFFICIENCY_BIN_LABELS bin (lo <= e < hi) in a single pass
+    Zero (unrecorded) efficiencies and values at or above the top edge are not counted
+    """
+    bin_counts = Counter(bisect_right(_EFFICIENCY_BIN_EDGES, e) - 1 for e in efficiencies if e)
+    return [bin_counts[index] for index in range(len(_EFFICIENCY_BIN_LABELS))]
+
+class _MetricColumns:
+    """
+    Struct-of-arrays copy of finalized metrics for report reductions
+    None and zero are both stored as 0, so sums and nonzero counts match the
+    truthiness filters the report applies to each field
+    """
+    
+    def __init__(self):
+        self.duration = array('d')
+        self.estimated = array('q')
+        self.actual = array('q')
+        self.efficiency = array('d')
+        self.success = bytearray()
+    
+    def append(self, metrics: PerformanceMetrics):
+        """Add one finalized task's values to every column"""
+        self.duration.append(metrics.duration_seconds or 0.0)
+        self.estimated.append(int(metrics.estimated_tokens or 0))
+        self.actual.append(int(metrics.actual_tokens or 0))
+        self.efficiency.append(metrics.token_efficiency or 0.0)
+        self.success.append(bool(metrics.success))
+    
+    @staticmethod
+    def nonzero_count(column) -> int:
+        """Number of entries that were set (non-zero) in a column"""
+        return len(column) - column.count(0)
+
 class PerformanceMonitor:
     """
     Comprehensive performance monitoring with token optimization
@@ -54,55 +299,25 @@ class PerformanceMonitor:
     
     def __init__(self, session_id: str = None):
         self.session_id = session_id or f"perf_{int(time.time())}"
-        self.metrics: List[PerformanceMetrics] = []
+        self._metrics: List[PerformanceMetrics] = []  # Read through the metrics property
         self.active_tasks: Dict[str, PerformanceMetrics] = {}
-        self.optimization_rules = self._load_optimization_rules()
-        self.token_budgets = self._load_token_budgets()
-        
-    def _load_optimization_rules(self) -> Dict[str, Dict]:
-        """Load performance optimization rules"""
-        return {
-            "token_efficiency": {
-                "excellent": 0.9,
-                "good": 0.75,
-                "acceptable": 0.6,
-                "needs_optimization": 0.4
-            },
-            "duration_thresholds": {
-                "quick_task": 30,      # seconds
-                "normal_task": 120,    # seconds  
-                "complex_task": 300,   # seconds
-                "long_task": 600       # seconds
-            },
-            "optimization_patterns": {
-                "high_token_usage": "Consider context compression or prompt optimization",
-                "slow_execution": "Review agent selection and task complexity",
-                "low_efficiency": "Optimize prompt structure and context management",
-                "frequent_retries": "Improve error handling and validation",
-                "context_overflow": "Implement progressive disclosure patterns"
-            }
-        }
+        self._columns = _MetricColumns()  # Appended alongside self._metrics
+        self._task_sequence = count(1)  # Keeps task ids unique within the same second
+        self.optimization_rules = _OPTIMIZATION_RULES
+        self.token_budgets = _TOKEN_BUDGETS
+        
+    @property
+    def metrics(self) -> Tuple[PerformanceMetrics, ...]:
+        """
+        Finalized task metrics, oldest first
+        Read-only so the report columns kept alongside cannot fall out of step
+        """
+        return tuple(self._metrics)
     
-    def _load_token_budgets(self) -> Dict[str, int]:
-        """Load token budgets for different agent types and tasks"""
-        return {
-            # Agent-specific budgets
-            "orchestrator": 15000,
-            "project-organizer": 8000,
-            "codebase-analyzer": 12000,
-            "security-specialist": 10000,
-            "research-agent": 6000,
-            
-            # Task-specific budgets  
-            "quick_analysis": 3000,
-            "comprehensive_analysis": 15000,
-            "autonomous_execution": 20000,
-            "multi_agent_coordination": 25000,
-            
-            # Default budgets
-            "default_agent": 5000,
-            "default_task": 8000
-        }
+    def clear_metrics(self):
+        """Drop all finalized metrics together with their report columns"""
+        self._metrics.clear()
+        self._columns = _MetricColumns()
     
     @contextmanager
     def track_performance(self, agent_type: str, task_description: str, estimated_tokens: int = None):
@@ -117,15 +332,17 @@ class PerformanceMonitor:
         """
         
         # Generate unique task ID
-        task_id = f"{agent_type}_{int(time.time())}"
+        task_id = f"{agent_type}_{int(time.time())}_{next(self._task_sequence)}"
         
         # Create performance metrics
         metrics = PerformanceMetrics(
             session_id=self.session_id,
             agent_type=agent_type,
             task_description=task_description,
-            start_time=datetime.now().isoformat(),
-            estimated_tokens=estimated_tokens or self._estimate_tokens(agent_type, task_description)
+            start_time=time.time_ns(),
+            estimated_tokens=estimated_tokens or self._estimate_tokens(agent_type, task_description),
+            _start_mono=time.monotonic(),
+            _agent_flags=_agent_flags(agent_type)
         )
         
         # Add to active tasks
@@ -146,28 +363,9 @@ class PerformanceMonitor:
     
     def _estimate_tokens(self, agent_type: str, task_description: str) -> int:
         """Estimate token usage based on agent type and task complexity"""
-        
-        # Base estimate from agent type
-        base_tokens = self.token_budgets.get(agent_type, self.token_budgets["default_agent"])
-        
-        # Adjust based on task complexity
-        complexity_multiplier = 1.0
-        
-        # Task complexity indicators
-        if any(keyword in task_description.lower() for keyword in ['comprehensive', 'complete', 'detailed']):
-            complexity_multiplier = 1.5
-        elif any(keyword in task_description.lower() for keyword in ['quick', 'simple', 'basic']):
-            complexity_multiplier = 0.7
-        elif any(keyword in task_description.lower() for keyword in ['autonomous', 'coordinate', 'multi-agent']):
-            complexity_multiplier = 2.0
-        
-        # Task type adjustments
-        if 'analysis' in task_description.lower():
-            base_tokens = max(base_tokens, self.token_budgets.get("comprehensive_analysis", 15000))
-        elif 'research' in task_description.lower():
-            base_tokens = max(base_tokens, self.token_budgets.get("research-agent", 6000))
-        
-        return int(base_tokens * complexity_multiplier)
+        if self.token_budgets is _TOKEN_BUDGETS:
+            return _estimate_default_tokens(agent_type, task_description)
+        return _compute_token_estimate(self.token_budgets, agent_type, task_description)
     
     def _finalize_task_metrics(self, task_id: str):
         """Finalize metrics for completed task"""
@@ -175,10 +373,8 @@ class PerformanceMonitor:
             metrics = self.active_tasks[task_id]
             
             # Calculate duration
-            if metrics.end_time:
-                start = datetime.fromisoformat(metrics.start_time)
-                end = datetime.fromisoformat(metrics.end_time)
-                metrics.duration_seconds = (end - start).total_seconds()
+            if metrics._end_mono is not None:
+                metrics.duration_seconds = metrics._end_mono - metrics._start_mono
             
             # Calculate efficiency
             if metrics.estimated_tokens and metrics.actual_tokens:
@@ -188,7 +384,8 @@ class PerformanceMonitor:
             metrics.optimization_opportunities = self._analyze_optimization_opportunities(metrics)
             
             # Move to completed metrics
-            self.metrics.append(metrics)
+            self._metrics.append(metrics)
+            self._columns.append(metrics)
             del self.active_tasks[task_id]
     
     def _analyze_optimization_opportunities(self, metrics: PerformanceMetrics) -> List[str]:
@@ -198,177 +395,145 @@ class PerformanceMonitor:
         # Token efficiency analysis
         if metrics.token_efficiency is not None:
             if metrics.token_efficiency < self.optimization_rules["token_efficiency"]["needs_optimization"]:
-                opportunities.append("High token usage detected - consider prompt optimization")
+                opportunities.append(_OPP_HIGH_TOKEN_USAGE)
             elif metrics.token_efficiency < self.optimization_rules["token_efficiency"]["acceptable"]:
-                opportunities.append("Moderate token inefficiency - review context management")
+                opportunities.append(_OPP_MODERATE_TOKEN_USAGE)
         
         # Duration analysis
         if metrics.duration_seconds is not None:
             thresholds = self.optimization_rules["duration_thresholds"]
             if metrics.duration_seconds > thresholds["long_task"]:
-                opportunities.append("Long execution time - consider task decomposition")
+                opportunities.append(_OPP_LONG_EXECUTION)
             elif metrics.duration_seconds > thresholds["complex_task"]:
-                opportunities.append("Complex task detected - validate agent selection")
+                opportunities.append(_OPP_COMPLEX_TASK)
         
         # Error analysis
         if not metrics.success and metrics.error_message:
             if "timeout" in metrics.error_message.lower():
-                opportunities.append("Timeout detected - increase limits or optimize complexity")
+                opportunities.append(_OPP_TIMEOUT)
             elif "token" in metrics.error_message.lower():
-                opportunities.append("Token limit issue - implement context compression")
+                opportunities.append(_OPP_TOKEN_LIMIT)
             else:
-                opportunities.append("Error handling - review input validation and retry logic")
+                opportunities.append(_OPP_ERROR_HANDLING)
         
         # Agent-specific optimizations
-        agent_type = metrics.agent_type.lower()
-        if "orchestrator" in agent_type and metrics.duration_seconds and metrics.duration_seconds > 180:
-            opportunities.append("Long orchestration - consider parallel agent execution")
-        elif "analyzer" in agent_type and metrics.token_efficiency and metrics.token_efficiency < 0.6:
-            opportunities.append("Analysis inefficiency - optimize search patterns and context")
+        if metrics._agent_flags & _AGENT_ORCHESTRATOR and metrics.duration_seconds and metrics.duration_seconds > 180:
+            opportunities.append(_OPP_LONG_ORCHESTRATION)
+        elif metrics._agent_flags & _AGENT_ANALYZER and metrics.token_efficiency and metrics.token_efficiency < 0.6:
+            opportunities.append(_OPP_ANALYSIS_INEFFICIENCY)
         
         return opportunities
     
-    def generate_performance_report(self) -> Dict[str, Any]:
-        """Generate comprehensive performance report"""
+    def generate_performance_report(self, detailed: bool = False) -> Dict[str, Any]:
+        """Generate performance report; per-task metrics are included only when detailed"""
         
-        if not self.metrics:
+        if not self._metrics:
             return {
                 "session_id": self.session_id,
                 "status": "no_data",
                 "message": "No performance data available"
             }
         
-        # Calculate summary statistics
-        total_tasks = len(self.metrics)
-        successful_tasks = len([m for m in self.metrics if m.success])
+        report: Dict[str, Any] = {"session_summary": self._compute_summary()}
+        if detailed:
+            report["detailed_metrics"] = [_export_metrics(m) for m in self._metrics]
+        report["optimization_recommendations"] = self._generate_optimization_recommendations()
+        report["token_usage_analysis"] = self._analyze_token_usage()
+        report["performance_trends"] = self._analyze_performance_trends()
+        return report
+    
+    def _compute_summary(self) -> SessionSummary:
+        """Aggregate session statistics from the column arrays"""
+        
+        # Calculate summary statistics from the column arrays
+        columns = self._columns
+        total_tasks = len(self._metrics)
+        successful_tasks = sum(columns.success)
         failed_tasks = total_tasks - successful_tasks
         
-        total_duration = sum(m.duration_seconds for m in self.metrics if m.duration_seconds)
+        total_duration = sum(columns.duration)
         
-        total_estimated = sum(m.estimated_tokens for m in self.metrics if m.estimated_tokens)
-        total_actual = sum(m.actual_tokens for m in self.metrics if m.actual_tokens)
+        total_estimated = sum(columns.estimated)
+        total_actual = sum(columns.actual)
         
         # Calculate average efficiency
-        efficiencies = [m.token_efficiency for m in self.metrics if m.token_efficiency]
-        average_efficiency = sum(efficiencies) / len(efficiencies) if efficiencies else 0.0
-        
-        # Collect top optimization opportunities
-        all_opportunities = []
-        for m in self.metrics:
-            all_opportunities.extend(m.optimization_opportunities)
+        efficiency_count = columns.nonzero_count(columns.efficiency)
+        average_efficiency = sum(columns.efficiency) / efficiency_count if efficiency_count else 0.0
         
-        # Count and rank opportunities
-        opportunity_counts = {}
-        for opp in all_opportunities:
-            opportunity_counts[opp] = opportunity_counts.get(opp, 0) + 1
-        
-        top_optimizations = sorted(opportunity_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-        top_optimizations = [f"{opp} ({count} occurrences)" for opp, count in top_optimizations]
+        # Count and rank optimization opportunities (ties keep first-seen order)
+        opportunity_counts = Counter(chain.from_iterable(m.optimization_opportunities for m in self._metrics))
+        top_optimizations = [
+            f"{opp} ({count} occurrences)"
+            for opp, count in opportunity_counts.most_common(5)
+        ]
         
         # Determine performance grade
         performance_grade = self._calculate_performance_grade(average_efficiency, failed_tasks, total_tasks)
         
-        return {
-            "session_summary": SessionSummary(
-                session_id=self.session_id,
-                total_tasks=total_tasks,
-                successful_tasks=successful_tasks,
-                failed_tasks=failed_tasks,
-                total_duration=total_duration,
-                total_estimated_tokens=total_estimated,
-                total_actual_tokens=total_actual,
-                average_efficiency=average_efficiency,
-                top_optimizations=top_optimizations,
-                performance_grade=performance_grade
-            ),
-            "detailed_metrics": [asdict(m) for m in self.metrics],
-            "optimization_recommendations": self._generate_optimization_recommendations(),
-            "token_usage_analysis": self._analyze_token_usage(),
-            "performance_trends": self._analyze_performance_trends()
-        }
+        return SessionSummary(
+            session_id=self.session_id,
+            total_tasks=total_tasks,
+            successful_tasks=successful_tasks,
+            failed_tasks=failed_tasks,
+            total_duration=total_duration,
+            total_estimated_tokens=total_estimated,
+            total_actual_tokens=total_actual,
+            average_efficiency=average_efficiency,
+            top_optimizations=top_optimizations,
+            performance_grade=performance_grade
+        )
     
     def _calculate_performance_grade(self, efficiency: float, failed_tasks: int, total_tasks: int) -> str:
         """Calculate overall performance grade"""
         
         # Efficiency score (0-40 points)
-        if efficiency >= 0.9:
-            efficiency_score = 40
-        elif efficiency >= 0.75:
-            efficiency_score = 30
-        elif efficiency >= 0.6:
-            efficiency_score = 20
-        else:
-            efficiency_score = 10
+        efficiency_score = _EFFICIENCY_SCORES[bisect_right(_EFFICIENCY_CUTS, efficiency)]
         
         # Success rate score (0-40 points)
         success_rate = (total_tasks - failed_tasks) / total_tasks if total_tasks > 0 else 0
-        if success_rate >= 0.95:
-            success_score = 40
-        elif success_rate >= 0.85:
-            success_score = 30
-        elif success_rate >= 0.7:
-            success_score = 20
-        else:
-            success_score = 10
+        success_score = _SUCCESS_SCORES[bisect_right(_SUCCESS_CUTS, success_rate)]
         
         # Task completion score (0-20 points)
-        if total_tasks >= 10:
-            completion_score = 20
-        elif total_tasks >= 5:
-            completion_score = 15
-        elif total_tasks >= 3:
-            completion_score = 10
-        else:
-            completion_score = 5
+        completion_score = _COMPLETION_SCORES[bisect_right(_COMPLETION_CUTS, total_tasks)]
         
         total_score = efficiency_score + success_score + completion_score
         
-        if total_score >= 90:
-            return "A+ (Excellent)"
-        elif total_score >= 80:
-            return "A (Very Good)" 
-        elif total_score >= 70:
-            return "B+ (Good)"
-        elif total_score >= 60:
-            return "B (Satisfactory)"
-        elif total_score >= 50:
-            return "C+ (Needs Improvement)"
-        else:
-            return "C (Requires Optimization)"
+        return _GRADE_LABELS[bisect_right(_GRADE_CUTS, total_score)]
     
     def _generate_optimization_recommendations(self) -> List[str]:
         """Generate specific optimization recommendations"""
         recommendations = []
         
-        if not self.metrics:
-            return ["No data available for optimization analysis"]
+        if not self._metrics:
+            return [_REC_NO_DATA]
+        
+        columns = self._columns
         
         # Analyze token efficiency
-        efficiencies = [m.token_efficiency for m in self.metrics if m.token_efficiency]
-        if efficiencies:
-            avg_efficiency = sum(efficiencies) / len(efficiencies)
+        efficiency_count = columns.nonzero_count(columns.efficiency)
+        if efficiency_count:
+            avg_efficiency = sum(columns.efficiency) / efficiency_count
             if avg_efficiency < 0.6:
-                recommendations.append("Implement context compression and prompt optimization strategies")
+                recommendations.append(_REC_CONTEXT_COMPRESSION)
             elif avg_efficiency < 0.8:
-                recommendations.append("Review prompt engineering for better token efficiency")
+                recommendations.append(_REC_PROMPT_ENGINEERING)
         
         # Analyze execution times
-        durations = [m.duration_seconds for m in self.metrics if m.duration_seconds]
-        if durations:
-            avg_duration = sum(durations) / len(durations)
+        duration_count = columns.nonzero_count(columns.duration)
+        if duration_count:
+            avg_duration = sum(columns.duration) / duration_count
             if avg_duration > 300:  # 5 minutes
-                recommendations.append("Consider task decomposition and parallel execution")
+                recommendations.append(_REC_TASK_DECOMPOSITION)
             elif avg_duration > 120:  # 2 minutes
-                recommendations.append("Optimize agent selection and task complexity")
+                recommendations.append(_REC_AGENT_SELECTION)
         
         # Analyze failure patterns
-        failed_metrics = [m for m in self.metrics if not m.success]
-        if len(failed_metrics) > len(self.metrics) * 0.1:  # >10% failure rate
-            recommendations.append("Improve error handling and input validation")
+        if columns.success.count(0) > len(self._metrics) * 0.1:  # >10% failure rate
+            recommendations.append(_REC_ERROR_HANDLING)
         
         # Agent-specific recommendations
         agent_performance = {}
-        for m in self.metrics:
+        for m in self._metrics:
             if m.agent_type not in agent_performance:
                 agent_performance[m.agent_type] = []
             agent_performance[m.agent_type].append(m)
@@ -383,18 +548,28 @@ class PerformanceMonitor:
     def _analyze_token_usage(self) -> Dict[str, Any]:
         """Analyze token usage patterns"""
         
-        if not self.metrics:
+        if not self._metrics:
             return {"status": "no_data"}
         
-        # Calculate token statistics
-        estimated_tokens = [m.estimated_tokens for m in self.metrics if m.estimated_tokens]
-        actual_tokens = [m.actual_tokens for m in self.metrics if m.actual_tokens]
+        # Gather token statistics in one pass over the metrics
+        estimated_tokens = []
+        actual_tokens = []
+        token_users = []  # (metrics, actual tokens) for the high-usage check
+        for m in self._metrics:
+            if m.estimated_tokens:
+                estimated_tokens.append(m.estimated_tokens)
+            if m.actual_tokens:
+                actual_tokens.append(m.actual_tokens)
+                token_users.append((m, m.actual_tokens))
+        
+        total_estimated = sum(estimated_tokens)
+        total_actual = sum(actual_tokens)
         
         analysis = {
-            "total_estimated": sum(estimated_tokens) if estimated_tokens else 0,
-            "total_actual": sum(actual_tokens) if actual_tokens else 0,
-            "average_estimated": sum(estimated_tokens) / len(estimated_tokens) if estimated_tokens else 0,
-            "average_actual": sum(actual_tokens) / len(actual_tokens) if actual_tokens else 0,
+            "total_estimated": total_estimated,
+            "total_actual": total_actual,
+            "average_estimated": total_estimated / len(estimated_tokens) if estimated_tokens else 0,
+            "average_actual": total_actual / len(actual_tokens) if actual_tokens else 0,
             "estimation_accuracy": 0.0,
             "token_efficiency_distribution": {},
             "high_usage_tasks": []
@@ -406,22 +581,19 @@ class PerformanceMonitor:
             analysis["estimation_accuracy"] = sum(accuracy_scores) / len(accuracy_scores) if accuracy_scores else 0.0
         
         # Efficiency distribution
-        efficiencies = [m.token_efficiency for m in self.metrics if m.token_efficiency]
-        if efficiencies:
-            ranges = [(0, 0.4), (0.4, 0.6), (0.6, 0.8), (0.8, 1.0)]
-            for min_eff, max_eff in ranges:
-                count = len([e for e in efficiencies if min_eff <= e < max_eff])
-                analysis["token_efficiency_distribution"][f"{min_eff}-{max_eff}"] = count
+        efficiencies = self._columns.efficiency
+        if self._columns.nonzero_count(efficiencies):
+            analysis["token_efficiency_distribution"] = dict(zip(_EFFICIENCY_BIN_LABELS, _efficiency_histogram(efficiencies)))
         
         # High usage tasks
         if actual_tokens:
-            high_threshold = sum(actual_tokens) / len(actual_tokens) * 1.5  # 150% of average
-            for m in self.metrics:
-                if m.actual_tokens and m.actual_tokens > high_threshold:
+            high_threshold = total_actual / len(actual_tokens) * 1.5  # 150% of average
+            for m, tokens in token_users:
+                if tokens > high_threshold:
                     analysis["high_usage_tasks"].append({
                         "agent": m.agent_type,
                         "task": m.task_description[:50] + "..." if len(m.task_description) > 50 else m.task_description,
-                        "tokens": m.actual_tokens
+                        "tokens": tokens
                     })
         
         return analysis
@@ -429,29 +601,17 @@ class PerformanceMonitor:
     def _analyze_performance_trends(self) -> Dict[str, Any]:
         """Analyze performance trends over time"""
         
-        if len(self.metrics) < 3:
+        if len(self._metrics) < 3:
             return {"status": "insufficient_data", "message": "Need at least 3 tasks for trend analysis"}
         
-        # Sort by start time
-        sorted_metrics = sorted(self.metrics, key=lambda m: m.start_time)
+        # Sort by monotonic start reading
+        start_readings = list(map(attrgetter("_start_mono"), self._metrics))
+        order = sorted(range(len(start_readings)), key=start_readings.__getitem__)
         
         # Calculate rolling averages
-        window_size = min(3, len(sorted_metrics))
-        rolling_efficiency = []
-        rolling_duration = []
-        
-        for i in range(window_size - 1, len(sorted_metrics)):
-            window = sorted_metrics[i-window_size+1:i+1]
-            
-            # Efficiency trend
-            effs = [m.token_efficiency for m in window if m.token_efficiency]
-            if effs:
-                rolling_efficiency.append(sum(effs) / len(effs))
-            
-            # Duration trend
-            durs = [m.duration_seconds for m in window if m.duration_seconds]
-            if durs:
-                rolling_duration.append(sum(durs) / len(durs))
+        window_size = min(3, len(order))
+        rolling_efficiency = _rolling_nonzero_means([self._columns.efficiency[i] for i in order], window_size)
+        rolling_duration = _rolling_nonzero_means([self._columns.duration[i] for i in order], window_size)
         
         trends = {
             "efficiency_trend": "stable",
@@ -494,10 +654,10 @@ class PerformanceMonitor:
         os.makedirs(os.path.dirname(report_path), exist_ok=True)
         
         # Generate and save report
-        report = self.generate_performance_report()
+        report = self.generate_performance_report(detailed=True)
         
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        with open(report_path, 'wb') as f:
+            f.write(_dumps_report(report))
         
         print(f"📊 Performance report saved: {report_path}")
         return report_path
@@ -513,7 +673,8 @@ class PerformanceTracker:
     
     def log_success(self, actual_tokens: int = None, additional_data: Dict = None):
         """Log successful task completion"""
-        self.metrics.end_time = datetime.now().isoformat()
+        self.metrics._end_mono = time.monotonic()
+        self.metrics.end_time = time.time_ns()
         self.metrics.actual_tokens = actual_tokens
         self.metrics.success = True
         
@@ -523,7 +684,8 @@ class PerformanceTracker:
     
     def log_failure(self, error_message: str):
         """Log task failure"""
-        self.metrics.end_time = datetime.now().isoformat()
+        self.metrics._end_mono = time.monotonic()
+        self.metrics.end_time = time.time_ns()
         self.metrics.success = False
         self.metrics.error_message = error_message
     
@@ -533,11 +695,16 @@ class PerformanceTracker:
 
 
 # Convenience functions for easy integration
+@cache
+def _default_monitor() -> PerformanceMonitor:
+    """Process-wide monitor shared by decorated calls that don't pass their own"""
+    return PerformanceMonitor("default")
+
 def track_agent_performance(agent_type: str, task_description: str, monitor: PerformanceMonitor = None):
     """Decorator for tracking agent performance"""
     def decorator(func):
         def wrapper(*args, **kwargs):
-            perf_monitor = monitor or PerformanceMonitor()
+            perf_monitor = monitor or _default_monitor()
             
             with perf_monitor.track_performance(agent_type, task_description) as tracker:
                 try:
@@ -562,7 +729,7 @@ if __name__ == "__main__":
         time.sleep(2)  # Simulate work
         tracker.log_success(actual_tokens=4200)
     
-    # Generate report
+    # Generate summary report
     report = monitor.generate_performance_report()
     print("Performance Report Generated!")
     print(f"Grade: {report['session_summary'].performance_grade}")
@@ -27,6 +27,8 @@ class TemplateValidator:
             'invocation_pattern', 'skills', 'automation_features'
         ]
         
+        self._required_set = frozenset(self.required_fields)
+        
         self.platform_targets = ['claude', 'gpt', 'gemini', 'enterprise']
     
     def validate_template(self, template_data: Dict) -> ValidationResult:
@@ -36,11 +38,13 @@ class TemplateValidator:
         recommendations = []
         score = 100
         
-        # Check required fields
-        for field in self.required_fields:
-            if field not in template_data:
-                errors.append(f"Missing required field: {field}")
-                score -= 20
+        # Check required fields (one set difference; errors keep declaration order)
+        missing = self._required_set - template_data.keys()
+        if missing:
+            for field in self.required_fields:
+                if field in missing:
+                    errors.append(f"Missing required field: {field}")
+                    score -= 20
         
         # Validate platform compatibility
         if 'platform_compatibility' in template_data:
@@ -59,7 +63,7 @@ class TemplateValidator:
         # Validate invocation pattern
         if 'invocation_pattern' in template_data:
             pattern = template_data['invocation_pattern']
-            if 'Task(' not in str(pattern):
+            if 'Task(' not in (pattern if isinstance(pattern, str) else str(pattern)):
                 errors.append("Invocation pattern must use Task tool proxy format")
                 score -= 15
         
@@ -71,6 +75,10 @@ class TemplateValidator:
             recommendations=recommendations
         )
     
+    def validate_many(self, templates: List[Dict]) -> List[ValidationResult]:
+        """Validate a batch of templates (e.g. a CI lint run) with this validator"""
+        return [self.validate_template(template) for template in templates]
+    
     def generate_template_from_47agent(self, agent_path: str) -> Dict:
         """Generate universal template from 47-agent format"""
         return {
@@ -92,6 +100,10 @@ def validate_agent_template(template: Dict) -> ValidationResult:
     validator = TemplateValidator()
     return validator.validate_template(template)
 
+def validate_agent_templates(templates: List[Dict]) -> List[ValidationResult]:
+    """Batch template validation sharing one validator"""
+    return TemplateValidator().validate_many(templates)
+
 if __name__ == "__main__":
     # Test validation
     test_template = {
@@ -4,20 +4,100 @@ Orchestrator Dispatcher - Intelligent Script Template Selection and Generation
 Analyzes workflows and dispatches to appropriate script templates or generates new scripts.
 """
 
+import re
+import logging
+import argparse
 import sys
-import os
 import json
-import subprocess
-from typing import Dict, List, Optional, Union
+import time
+import zlib
+import string
+import threading
+import asyncio
+import hashlib
+import importlib
+from collections import Counter, deque
+from functools import cached_property, lru_cache
+from itertools import count
+from operator import mul
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
 from datetime import datetime
+from pathlib import Path
 from enum import Enum
+from types import MappingProxyType
 
-# Add core modules to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core'))
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'templates'))
+try:
+    import orjson  # Optional C-accelerated JSON encoder
+except ImportError:
+    orjson = None
 
-from agent_caller import AgentCaller, AgentType
-from workflow_analyzer import WorkflowAnalyzer
+try:
+    import ahocorasick  # Optional C multi-pattern matcher (pyahocorasick)
+except ImportError:
+    ahocorasick = None
+
+_log = logging.getLogger(__name__)
+
+# Core modules are put on the path and imported on first use, so building a
+# dispatcher or inspecting its templates does not load the agent stack
+_HERE = Path(__file__).resolve().parent
+_CORE_DIR = _HERE.parent / "core"
+_TEMPLATES_DIR = _HERE.parent / "templates"
+
+# Generated custom scripts are written to a per-user cache, never into the package
+GENERATED_SCRIPTS_DIR = Path.home() / ".cache" / "orchestrator_dispatcher" / "custom_workflows"
+
+def _core_module(name: str):
+    """Import a core module on first use, adding the core and template dirs to the path"""
+    for path in (str(_CORE_DIR), str(_TEMPLATES_DIR)):
+        if path not in sys.path:
+            sys.path.append(path)
+    return importlib.import_module(name)
+
+def _dumps_context(context: Optional[Dict]) -> str:
+    """Canonical indented JSON for a request context, serialized once per dispatch"""
+    if orjson is not None:
+        return orjson.dumps(context or {}, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
+    return json.dumps(context or {}, indent=2, sort_keys=True, default=str)
+
+# Disambiguates dispatchers created within the same nanosecond tick
+_SESSION_COUNTER = count()
+
+# Routing decisions for a repeated request are reused for this long
+ROUTE_CACHE_TTL_SECONDS = 3600
+
+# Abbreviations expanded when building route cache keys; none of the
+# expansions add or remove routing keywords, so aliases route identically
+_REQUEST_ABBREVIATIONS = {
+    "auth": "authentication",
+    "config": "configuration",
+    "docs": "documentation",
+    "env": "environment",
+    "infra": "infrastructure",
+    "k8s": "kubernetes",
+    "repo": "repository",
+}
+_ABBREVIATION_PATTERN = re.compile(r"\b({})\b".format("|".join(_REQUEST_ABBREVIATIONS)))
+
+def _normalize_request(request: str) -> str:
+    """Canonical form of a request: lowercased, single-spaced, abbreviations expanded"""
+    normalized = " ".join(request.lower().split())
+    return _ABBREVIATION_PATTERN.sub(lambda match: _REQUEST_ABBREVIATIONS[match.group(1)], normalized)
+
+# Near-duplicate requests (cosine similarity at or above the threshold, same
+# routing signature) reuse an earlier workflow analysis instead of a new agent call
+SIMILAR_ROUTE_THRESHOLD = 0.92
+_SIMILAR_ROUTE_LIMIT = 512
+_EMBEDDING_DIMENSIONS = 256
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+def _embed_request(normalized_request: str) -> List[float]:
+    """Unit-length hashed bag-of-words vector; the default request embedder"""
+    vector = [0.0] * _EMBEDDING_DIMENSIONS
+    for token in _TOKEN_PATTERN.findall(normalized_request):
+        vector[zlib.crc32(token.encode()) % _EMBEDDING_DIMENSIONS] += 1.0
+    norm = sum(value * value for value in vector) ** 0.5
+    return [value / norm for value in vector] if norm else vector
 
 class WorkflowType(Enum):
     """Detected workflow types"""
@@ -29,83 +109,200 @@ class WorkflowType(Enum):
     DEPLOYMENT = "deployment"
     CUSTOM = "custom"
 
-class OrchestratorDispatcher:
-    """Intelligent orchestrator for script template selection and generation"""
+# Routing keywords, matched as substrings of the lowercased request.
+# Complexity tables are checked in order and the first matching entry wins;
+# workflow types are scored by keyword hits, with table order breaking ties.
+_WORKFLOW_TYPE_KEYWORDS = MappingProxyType({
+    WorkflowType.PROJECT_MANAGEMENT: frozenset({
+        "implement", "build", "create", "develop", "project", "feature",
+        "system", "application", "coordinate", "manage"
+    }),
+    WorkflowType.RESEARCH: frozenset({
+        "research", "analyze", "investigate", "study", "compare",
+        "competitive", "market", "evaluation", "assessment"
+    }),
+    WorkflowType.SECURITY_AUDIT: frozenset({
+        "security", "audit", "vulnerability", "compliance", "penetration",
+        "secure", "validate", "review"
+    }),
+    WorkflowType.DEVELOPMENT: frozenset({
+        "code", "api", "backend", "frontend", "database", "service",
+        "rust", "python", "javascript", "react"
+    }),
+})
+
+_KEYWORD_TO_WORKFLOW_TYPE = MappingProxyType({
+    keyword: workflow_type
+    for workflow_type, keywords in _WORKFLOW_TYPE_KEYWORDS.items()
+    for keyword in keywords
+})
+
+_COMPLEXITY_KEYWORDS = MappingProxyType({
+    "complex": frozenset({"enterprise", "production", "scalable", "comprehensive", "multi"}),
+    "moderate": frozenset({"secure", "robust", "complete", "full"}),
+    "simple": frozenset({"basic", "simple", "quick", "minimal"}),
+})
+
+# Every matching agent is required, in table order
+_AGENT_KEYWORDS = MappingProxyType({
+    "orchestrator": frozenset({"coordinate", "manage", "plan", "multiple", "complex"}),
+    "codebase-locator": frozenset({"find", "locate", "discover", "where", "which"}),
+    "codebase-analyzer": frozenset({"analyze", "review", "understand", "examine"}),
+    "security-specialist": frozenset({"security", "secure", "audit", "vulnerability"}),
+    "backend-architect": frozenset({"api", "backend", "service", "architecture"}),
+    "rust-expert-developer": frozenset({"rust", "implement", "develop", "performance"}),
+    "competitive-market-analyst": frozenset({"market", "competitive", "business", "strategy"}),
+    "web-search-researcher": frozenset({"research", "web", "information", "investigate"}),
+})
+
+_ROUTING_KEYWORDS = frozenset(
+    keyword
+    for table in (_WORKFLOW_TYPE_KEYWORDS, _COMPLEXITY_KEYWORDS, _AGENT_KEYWORDS)
+    for keywords in table.values()
+    for keyword in keywords
+)
+
+# Longest-first alternation finds the longest keyword starting at each
+# position; every shorter keyword matching there is one of its prefixes
+_KEYWORD_PREFIXES = MappingProxyType({
+    keyword: frozenset(other for other in _ROUTING_KEYWORDS if keyword.startswith(other))
+    for keyword in _ROUTING_KEYWORDS
+})
+_ROUTING_KEYWORD_PATTERN = re.compile("(?=({}))".format(
+    "|".join(map(re.escape, sorted(_ROUTING_KEYWORDS, key=len, reverse=True)))
+))
+
+# Baseline execution estimate per complexity level, before agent overhead
+_BASE_EXECUTION_MINUTES = MappingProxyType({
+    "simple": 15,
+    "moderate": 30,
+    "complex": 60
+})
+
+def _build_keyword_automaton():
+    """Aho-Corasick automaton over the routing keywords, when pyahocorasick is installed"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in _ROUTING_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+def _scan_keywords(request: str) -> Set[str]:
+    """Every routing keyword occurring in the request, found in a single pass"""
+    request_lower = request.lower()
+    if _KEYWORD_AUTOMATON is not None:
+        return {keyword for _, keyword in _KEYWORD_AUTOMATON.iter(request_lower)}
     
-    def __init__(self):
-        self.agent_caller = AgentCaller()
-        self.workflow_analyzer = WorkflowAnalyzer()
-        self.session_id = f"orchestrator_{int(datetime.now().timestamp())}"
-        
-        # Available script templates
-        self.available_templates = {
-            WorkflowType.PROJECT_MANAGEMENT: {
-                "script": "project_manager_script.py",
-                "description": "Complete project management with autonomous execution",
-                "use_cases": ["feature development", "system implementation", "multi-phase projects"],
-                "capabilities": ["workflow coordination", "progress tracking", "quality gates"]
-            },
-            WorkflowType.RESEARCH: {
-                "script": "research_workflow_script.py", 
-                "description": "Comprehensive research automation with multi-agent coordination",
-                "use_cases": ["market research", "competitive analysis", "technology evaluation"],
-                "capabilities": ["web research", "competitive intelligence", "synthesis"]
-            },
-            WorkflowType.SECURITY_AUDIT: {
-                "script": "security_audit_script.py",
-                "description": "Complete security assessment and compliance validation",
-                "use_cases": ["vulnerability assessment", "compliance audit", "security review"],
-                "capabilities": ["code scanning", "compliance checking", "risk assessment"]
-            },
-            WorkflowType.DEVELOPMENT: {
-                "script": "development_workflow_script.py",
-                "description": "End-to-end development workflow automation",
-                "use_cases": ["backend development", "frontend implementation", "API creation"],
-                "capabilities": ["scaffolding", "implementation", "testing", "deployment"]
-            }
-        }
-        
-    def analyze_and_dispatch(self, user_request: str, context: Dict = None) -> Dict:
-        """
-        Main orchestrator method: analyze request and dispatch to appropriate workflow
-        
-        Args:
-            user_request: Natural language description of what user wants to accomplish
-            context: Additional context (project type, constraints, preferences)
-            
-        Returns:
-            Dispatch decision with execution plan
-        """
-        print(f"🎭 ORCHESTRATOR: Analyzing request...")
-        print(f"Request: {user_request}")
-        
-        # Step 1: Analyze workflow requirements
-        analysis = self._analyze_workflow_type(user_request, context)
-        
-        # Step 2: Determine dispatch strategy
-        dispatch_decision = self._make_dispatch_decision(analysis, user_request)
-        
-        # Step 3: Execute dispatch
-        execution_result = self._execute_dispatch(dispatch_decision, user_request, context)
-        
-        return {
-            "orchestrator_session": self.session_id,
-            "workflow_analysis": analysis,
-            "dispatch_decision": dispatch_decision,
-            "execution_result": execution_result,
-            "timestamp": datetime.now().isoformat()
-        }
+    hits = set()
+    for keyword in _ROUTING_KEYWORD_PATTERN.findall(request_lower):
+        hits |= _KEYWORD_PREFIXES[keyword]
+    return hits
+
+# Keyword classification is a pure function of the normalized request, so
+# repeated and near-identical requests skip the scan entirely
+_CLASSIFICATION_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=_CLASSIFICATION_CACHE_SIZE)
+def _request_keywords(normalized_request: str) -> FrozenSet[str]:
+    """Routing keywords of a normalized request"""
+    return frozenset(_scan_keywords(normalized_request))
+
+@lru_cache(maxsize=_CLASSIFICATION_CACHE_SIZE)
+def _workflow_type_for(normalized_request: str) -> WorkflowType:
+    """
+    Primary workflow type: the one whose keywords the request hits most
+    Only types with an installed template script compete; a request that
+    matches none of them is CUSTOM and gets a generated script
+    """
+    type_hits = [
+        (keyword, _KEYWORD_TO_WORKFLOW_TYPE[keyword])
+        for keyword in _request_keywords(normalized_request)
+        if _KEYWORD_TO_WORKFLOW_TYPE.get(keyword) in _INSTALLED_TEMPLATE_TYPES
+    ]
+    if not type_hits:
+        return WorkflowType.CUSTOM
     
-    def _analyze_workflow_type(self, request: str, context: Dict) -> Dict:
-        """Analyze request to determine workflow type and requirements"""
-        
-        analysis_prompt = f"""analyze this user request to determine optimal workflow strategy:
+    scores = Counter(workflow_type for _, workflow_type in type_hits)
+    best_score = max(scores.values())
+    tied = [workflow_type for workflow_type in _WORKFLOW_TYPE_KEYWORDS if scores[workflow_type] == best_score]
+    if len(tied) == 1:
+        return tied[0]
+    
+    # Requests lead with their intent ("Research X ... and create Y"), so on a
+    # tie the type mentioned first wins; min() keeps table order after that
+    first_mention = {}
+    for keyword, workflow_type in type_hits:
+        position = normalized_request.find(keyword)
+        first_mention[workflow_type] = min(position, first_mention.get(workflow_type, position))
+    return min(tied, key=first_mention.__getitem__)
 
-USER REQUEST: {request}
+@lru_cache(maxsize=_CLASSIFICATION_CACHE_SIZE)
+def _complexity_for(normalized_request: str) -> str:
+    """Workflow complexity of a normalized request"""
+    keyword_hits = _request_keywords(normalized_request)
+    for complexity, keywords in _COMPLEXITY_KEYWORDS.items():
+        if not keywords.isdisjoint(keyword_hits):
+            return complexity
+    
+    # Default based on request length and specificity
+    return "moderate" if len(normalized_request.split()) > 10 else "simple"
+
+@lru_cache(maxsize=_CLASSIFICATION_CACHE_SIZE)
+def _agent_requirements_for(normalized_request: str) -> Tuple[str, ...]:
+    """Likely agent requirements of a normalized request"""
+    keyword_hits = _request_keywords(normalized_request)
+    return tuple(
+        agent for agent, keywords in _AGENT_KEYWORDS.items()
+        if not keywords.isdisjoint(keyword_hits)
+    )
+
+@lru_cache(maxsize=64)
+def _execution_time_for(complexity: str, agent_count: int) -> str:
+    """Estimated execution time range for a complexity and agent count"""
+    total_time = _BASE_EXECUTION_MINUTES[complexity] + agent_count * 5
+    return f"{total_time}-{total_time + 30} minutes"
+
+# Script templates available for dispatch, shared read-only by every dispatcher
+_TEMPLATES = MappingProxyType({
+    WorkflowType.PROJECT_MANAGEMENT: {
+        "script": "project_manager_script.py",
+        "description": "Complete project management with autonomous execution",
+        "use_cases": ["feature development", "system implementation", "multi-phase projects"],
+        "capabilities": ["workflow coordination", "progress tracking", "quality gates"]
+    },
+    WorkflowType.RESEARCH: {
+        "script": "research_workflow_script.py", 
+        "description": "Comprehensive research automation with multi-agent coordination",
+        "use_cases": ["market research", "competitive analysis", "technology evaluation"],
+        "capabilities": ["web research", "competitive intelligence", "synthesis"]
+    },
+    WorkflowType.SECURITY_AUDIT: {
+        "script": "security_audit_script.py",
+        "description": "Complete security assessment and compliance validation",
+        "use_cases": ["vulnerability assessment", "compliance audit", "security review"],
+        "capabilities": ["code scanning", "compliance checking", "risk assessment"]
+    },
+    WorkflowType.DEVELOPMENT: {
+        "script": "development_workflow_script.py",
+        "description": "End-to-end development workflow automation",
+        "use_cases": ["backend development", "frontend implementation", "API creation"],
+        "capabilities": ["scaffolding", "implementation", "testing", "deployment"]
+    }
+})
 
-CONTEXT: {json.dumps(context or {}, indent=2)}
+# Workflow types whose template script is actually present in the templates dir
+_INSTALLED_TEMPLATE_TYPES = frozenset(
+    workflow_type for workflow_type, template in _TEMPLATES.items()
+    if (_TEMPLATES_DIR / template["script"]).is_file()
+)
 
-Perform comprehensive workflow analysis:
+# Prompt instructions are sent as a static prefix ahead of the per-request
+# text, so they stay byte-identical across calls for provider-side caching
+_WORKFLOW_ANALYSIS_PROMPT_PREFIX = """Perform comprehensive workflow analysis:
 
 1. WORKFLOW TYPE CLASSIFICATION:
    - Primary workflow category (project management, research, security, development, analysis, deployment)
@@ -135,97 +332,297 @@ Perform comprehensive workflow analysis:
    - Success criteria and validation
 
 Provide structured analysis with clear recommendations for orchestration strategy."""
+
+_WORKFLOW_ANALYSIS_PROMPT_TEMPLATE = """analyze this user request to determine optimal workflow strategy:
+
+USER REQUEST: {request}
+
+CONTEXT: {context_json}"""
+
+# Base structure of a generated custom workflow script; rendered with the
+# workflow's title, request and core directory when the script is written,
+# and shown to the generator agent with placeholders
+_CUSTOM_SCRIPT_TEMPLATE = string.Template('''#!/usr/bin/env python3
+"""
+Custom Workflow Script - $workflow_title
+Generated for specific use case: $request
+"""
+
+import sys
+import os
+import time
+from itertools import count
+
+# Add core modules to path
+sys.path.append($core_path)
+
+from agent_caller import AgentCaller, AgentType
+from workflow_analyzer import WorkflowAnalyzer
+
+_SESSION_COUNTER = count()
+
+class CustomWorkflowScript:
+    def __init__(self, workflow_description: str):
+        self.workflow_description = workflow_description
+        self.session_id = f"custom_{time.time_ns()}_{next(_SESSION_COUNTER)}"
+        # ... initialization code ...
+    
+    # ... implement custom workflow methods ...
+''')
+
+_SCRIPT_GENERATION_PROMPT_PREFIX = """SCRIPT REQUIREMENTS:
+1. Use our standard agent protocol (Task Tool Proxy Pattern)
+2. Follow the template structure from project_manager_script.py
+3. Implement workflow-specific logic for this use case
+4. Include autonomous execution with progress tracking
+5. Provide orchestrator communication and reporting
+6. Generate comprehensive deliverables
+
+CUSTOM SCRIPT SPECIFICATIONS:
+- Main class: CustomWorkflowScript
+- Key methods: analyze_requirements(), create_execution_plan(), execute_workflow(), generate_deliverables()
+- Agent integration: Use AgentCaller and WorkflowAnalyzer from core modules
+- Progress tracking: Implement TodoWrite integration and checkpoint reporting
+- Error handling: Include retry logic and failure recovery
+
+BASE TEMPLATE STRUCTURE:
+```python
+{base_template}```""".format(
+    base_template=_CUSTOM_SCRIPT_TEMPLATE.substitute(
+        workflow_title="<Workflow Type>",
+        request="<user request>",
+        core_path="os.path.join(os.path.dirname(__file__), '..', 'core')"
+    )
+)
+
+_SCRIPT_GENERATION_PROMPT_TEMPLATE = """generate a custom workflow script for this specific use case:
+
+USER REQUEST: {request}
+CONTEXT: {context_json}
+
+WORKFLOW ANALYSIS:
+- Type: {workflow_type}
+- Complexity: {complexity}
+- Agent Coordination Required: {agent_coordination}
+
+Generate complete, production-ready Python script that implements this specific workflow with full autonomous execution capabilities."""
+
+# Generated custom scripts are reused when the same request comes back with
+# the same structure; the index of signature -> script filename lives next to
+# the scripts
+SCRIPT_CACHE_FILENAME = ".custom_script_index.json"
+
+def _script_signature(workflow_type: str, complexity: str, agent_requirements: Sequence[str],
+                      normalized_request: str) -> str:
+    """Key of a custom workflow script; agent order does not matter"""
+    request_digest = hashlib.blake2b(normalized_request.encode(), digest_size=8).hexdigest()
+    return "|".join((workflow_type, complexity, ",".join(sorted(agent_requirements)), request_digest))
+
+def _render_custom_script(workflow_type: str, request: str) -> str:
+    """Fill the custom script template; the request is kept on one docstring-safe line"""
+    return _CUSTOM_SCRIPT_TEMPLATE.substitute(
+        workflow_title=workflow_type.title(),
+        core_path=repr(str(_CORE_DIR)),
+        request=" ".join(request.split()).replace('"""', "'''")
+    )
+
+class OrchestratorDispatcher:
+    """Intelligent orchestrator for script template selection and generation"""
+    
+    # Available script templates
+    available_templates = _TEMPLATES
+    
+    def __init__(self, embedder: Optional[Callable[[str], Sequence[float]]] = None,
+                 use_script_cache: bool = True):
+        """
+        Args:
+            embedder: Maps a normalized request to a unit-length vector for
+                near-duplicate detection (e.g. a sentence-transformers model
+                with normalize_embeddings=True); defaults to hashed bag-of-words
+            use_script_cache: Reuse the custom script generated earlier for
+                the same request, workflow type, complexity and agents
+        """
+        self.session_id = f"orchestrator_{time.time_ns()}_{next(_SESSION_COUNTER)}"
+        self._embedder = embedder or _embed_request
+        # (stored_at, embedding, routing signature, analysis task) per analyzed request
+        self._analysis_index = deque(maxlen=_SIMILAR_ROUTE_LIMIT)
+        # Keeps task ids and script names unique when one dispatcher serves many requests
+        self._task_sequence = count(1)
+        self.use_script_cache = use_script_cache
+        self.script_cache_path = GENERATED_SCRIPTS_DIR / SCRIPT_CACHE_FILENAME
+        # Dispatch strategy -> coroutine handler taking (decision, request, context, context_json)
+        self._strategies = {
+            "use_template": self._execute_template_async,
+            "generate_custom_script": self._generate_and_execute_custom_script_async
+        }
+    
+    @cached_property
+    def agent_caller(self):
+        return _core_module("agent_caller").AgentCaller()
+    
+    @cached_property
+    def workflow_analyzer(self):
+        return _core_module("workflow_analyzer").WorkflowAnalyzer()
+    
+    @cached_property
+    def _route_cache(self):
+        return _core_module("agent_caller").ResponseCache(ttl_seconds=ROUTE_CACHE_TTL_SECONDS)
+    
+    def analyze_and_dispatch(self, user_request: str, context: Dict = None) -> Dict:
+        """
+        Main orchestrator method: analyze request and dispatch to appropriate workflow
         
-        analysis_task = self.agent_caller.call_agent(
-            AgentType.ORCHESTRATOR,
-            analysis_prompt,
-            f"{self.session_id}_workflow_analysis"
-        )
+        Args:
+            user_request: Natural language description of what user wants to accomplish
+            context: Additional context (project type, constraints, preferences)
+            
+        Returns:
+            Dispatch decision with execution plan
+        """
+        return asyncio.run(self.analyze_and_dispatch_async(user_request, context))
+    
+    async def analyze_and_dispatch_async(self, user_request: str, context: Dict = None) -> Dict:
+        """
+        Awaitable variant of analyze_and_dispatch
+        Routing only needs the request keywords, so the workflow analysis
+        agent call runs concurrently with the dispatch it informs
+        """
+        _log.info("🎭 ORCHESTRATOR: Analyzing request...")
+        _log.info("Request: %s", user_request)
+        
+        context_json = _dumps_context(context)
+        route_key = self._route_key(user_request, context_json)
+        cached_route = self._route_cache.get(route_key)
+        similarity_key = None
+        if cached_route is not None:
+            _log.info("♻️ ORCHESTRATOR: Reusing cached routing for this request")
+            analysis = dict(cached_route["workflow_analysis"])
+            dispatch_decision = dict(cached_route["dispatch_decision"])
+        else:
+            # Step 1: Analyze workflow requirements
+            analysis, similarity_key = self._classify_request(user_request, context_json)
+            
+            # Step 2: Determine dispatch strategy
+            dispatch_decision = self._make_dispatch_decision(analysis, user_request)
+        
+        # Step 3: Execute dispatch, alongside the workflow analysis when it is new
+        dispatch = self._execute_dispatch_async(dispatch_decision, user_request, context, context_json)
+        if analysis["analysis_task"] is None:
+            analysis["analysis_task"], execution_result = await asyncio.gather(
+                self._request_workflow_analysis_async(user_request, context_json),
+                dispatch
+            )
+            self._analysis_index.append((time.monotonic(), *similarity_key, analysis["analysis_task"]))
+        else:
+            execution_result = await dispatch
         
-        # Extract workflow type from analysis (simplified logic)
-        workflow_type = self._extract_workflow_type(request)
+        if cached_route is None:
+            self._route_cache.put(route_key, {
+                "workflow_analysis": dict(analysis),
+                "dispatch_decision": dict(dispatch_decision)
+            })
         
         return {
+            "orchestrator_session": self.session_id,
+            "workflow_analysis": analysis,
+            "dispatch_decision": dispatch_decision,
+            "execution_result": execution_result,
+            "timestamp": datetime.now().isoformat()
+        }
+    
+    def analyze_and_dispatch_batch(self, requests: List[Tuple[str, Optional[Dict]]]) -> List[Dict]:
+        """Analyze and dispatch several (user_request, context) pairs concurrently"""
+        return asyncio.run(self.analyze_and_dispatch_batch_async(requests))
+    
+    async def analyze_and_dispatch_batch_async(self, requests: List[Tuple[str, Optional[Dict]]]) -> List[Dict]:
+        """
+        Awaitable variant of analyze_and_dispatch_batch
+        Results keep request order; a failed request yields an error entry
+        instead of cancelling the others
+        """
+        results = await asyncio.gather(
+            *(self.analyze_and_dispatch_async(user_request, context) for user_request, context in requests),
+            return_exceptions=True
+        )
+        
+        return [
+            {"request": user_request, "error": str(result)} if isinstance(result, Exception) else result
+            for (user_request, _), result in zip(requests, results)
+        ]
+    
+    @staticmethod
+    def _route_key(request: str, context_json: str) -> str:
+        """Cache key for a request's routing: normalized text plus canonical context"""
+        payload = _normalize_request(request) + "|" + context_json
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+    
+    def _classify_request(self, request: str, context_json: str) -> Tuple[Dict, tuple]:
+        """
+        Determine workflow type and requirements from request keywords
+        analysis_task is the workflow analysis of a near-duplicate request
+        that routes identically, or None when a new analysis is needed; the
+        returned (embedding, signature) key indexes that new analysis
+        """
+        
+        # Extract workflow type from request keywords (simplified logic)
+        normalized_request = _normalize_request(request)
+        workflow_type = _workflow_type_for(normalized_request)
+        complexity = _complexity_for(normalized_request)
+        agent_requirements = _agent_requirements_for(normalized_request)
+        
+        # Reuse the analysis of a near-duplicate request that routes identically
+        signature = (workflow_type, complexity, agent_requirements, context_json)
+        embedding = self._embedder(normalized_request)
+        
+        analysis = {
             "workflow_type": workflow_type,
-            "analysis_task": analysis_task,
-            "complexity": self._assess_complexity(request),
-            "agent_requirements": self._extract_agent_requirements(request)
+            "analysis_task": self._find_similar_analysis(embedding, signature),
+            "complexity": complexity,
+            "agent_requirements": list(agent_requirements),
+            "n_agents": len(agent_requirements)
         }
+        return analysis, (embedding, signature)
+    
+    def _find_similar_analysis(self, embedding: Sequence[float], signature: tuple) -> Optional["TaskProgress"]:
+        """Return the analysis task of the closest cached request above the threshold, if any"""
+        oldest_allowed = time.monotonic() - ROUTE_CACHE_TTL_SECONDS
+        best_task, best_score = None, SIMILAR_ROUTE_THRESHOLD
+        for stored_at, cached_embedding, cached_signature, task in self._analysis_index:
+            if stored_at < oldest_allowed or cached_signature != signature:
+                continue
+            score = sum(map(mul, embedding, cached_embedding))
+            if score >= best_score:
+                best_task, best_score = task, score
+        
+        if best_task is not None:
+            _log.info("♻️ ORCHESTRATOR: Reusing workflow analysis of a similar request (%.2f similarity)", best_score)
+        return best_task
+    
+    async def _request_workflow_analysis_async(self, request: str, context_json: str) -> "TaskProgress":
+        """Ask the orchestrator agent for a structured workflow analysis"""
+        
+        analysis_prompt = _WORKFLOW_ANALYSIS_PROMPT_TEMPLATE.format(
+            request=request,
+            context_json=context_json
+        )
+        
+        return await self.agent_caller.call_agent_async(
+            _core_module("agent_caller").AgentType.ORCHESTRATOR,
+            (_WORKFLOW_ANALYSIS_PROMPT_PREFIX, analysis_prompt),
+            f"{self.session_id}_workflow_analysis_{next(self._task_sequence)}"
+        )
     
     def _extract_workflow_type(self, request: str) -> WorkflowType:
         """Extract primary workflow type from request"""
-        request_lower = request.lower()
-        
-        # Project management keywords
-        if any(keyword in request_lower for keyword in [
-            "implement", "build", "create", "develop", "project", "feature", 
-            "system", "application", "coordinate", "manage"
-        ]):
-            return WorkflowType.PROJECT_MANAGEMENT
-        
-        # Research keywords
-        elif any(keyword in request_lower for keyword in [
-            "research", "analyze", "investigate", "study", "compare", 
-            "competitive", "market", "evaluation", "assessment"
-        ]):
-            return WorkflowType.RESEARCH
-        
-        # Security keywords
-        elif any(keyword in request_lower for keyword in [
-            "security", "audit", "vulnerability", "compliance", "penetration",
-            "secure", "validate", "review"
-        ]):
-            return WorkflowType.SECURITY_AUDIT
-        
-        # Development keywords  
-        elif any(keyword in request_lower for keyword in [
-            "code", "api", "backend", "frontend", "database", "service",
-            "rust", "python", "javascript", "react"
-        ]):
-            return WorkflowType.DEVELOPMENT
-        
-        else:
-            return WorkflowType.CUSTOM
+        return _workflow_type_for(_normalize_request(request))
     
     def _assess_complexity(self, request: str) -> str:
         """Assess workflow complexity"""
-        indicators = {
-            "complex": ["enterprise", "production", "scalable", "comprehensive", "multi"],
-            "moderate": ["secure", "robust", "complete", "full"],
-            "simple": ["basic", "simple", "quick", "minimal"]
-        }
-        
-        request_lower = request.lower()
-        
-        for complexity, keywords in indicators.items():
-            if any(keyword in request_lower for keyword in keywords):
-                return complexity
-        
-        # Default based on request length and specificity
-        return "moderate" if len(request.split()) > 10 else "simple"
+        return _complexity_for(_normalize_request(request))
     
     def _extract_agent_requirements(self, request: str) -> List[str]:
         """Extract likely agent requirements from request"""
-        agents_needed = []
-        request_lower = request.lower()
-        
-        # Map keywords to agents
-        agent_keywords = {
-            "orchestrator": ["coordinate", "manage", "plan", "multiple", "complex"],
-            "codebase-locator": ["find", "locate", "discover", "where", "which"],
-            "codebase-analyzer": ["analyze", "review", "understand", "examine"],
-            "security-specialist": ["security", "secure", "audit", "vulnerability"],
-            "backend-architect": ["api", "backend", "service", "architecture"],
-            "rust-expert-developer": ["rust", "implement", "develop", "performance"],
-            "competitive-market-analyst": ["market", "competitive", "business", "strategy"],
-            "web-search-researcher": ["research", "web", "information", "investigate"]
-        }
-        
-        for agent, keywords in agent_keywords.items():
-            if any(keyword in request_lower for keyword in keywords):
-                agents_needed.append(agent)
-        
-        return agents_needed
+        return list(_agent_requirements_for(_normalize_request(request)))
     
     def _make_dispatch_decision(self, analysis: Dict, request: str) -> Dict:
         """Make intelligent dispatch decision based on analysis"""
@@ -233,9 +630,8 @@ Provide structured analysis with clear recommendations for orchestration strateg
         complexity = analysis["complexity"]
         
         # Check if we have a suitable template
-        if workflow_type in self.available_templates:
-            template_info = self.available_templates[workflow_type]
-            
+        template_info = self.available_templates.get(workflow_type)
+        if template_info is not None:
             decision = {
                 "strategy": "use_template",
                 "template": template_info["script"],
@@ -254,7 +650,7 @@ Provide structured analysis with clear recommendations for orchestration strateg
         decision.update({
             "workflow_type": workflow_type.value,
             "complexity": complexity,
-            "agent_coordination": len(analysis["agent_requirements"]) > 2,
+            "agent_coordination": analysis["n_agents"] > 2,
             "estimated_duration": self._estimate_execution_time(analysis)
         })
         
@@ -262,35 +658,23 @@ Provide structured analysis with clear recommendations for orchestration strateg
     
     def _estimate_execution_time(self, analysis: Dict) -> str:
         """Estimate execution time based on complexity and requirements"""
-        base_time = {
-            "simple": 15,
-            "moderate": 30, 
-            "complex": 60
-        }
-        
-        time_minutes = base_time[analysis["complexity"]]
-        agent_overhead = len(analysis["agent_requirements"]) * 5
-        
-        total_time = time_minutes + agent_overhead
-        return f"{total_time}-{total_time + 30} minutes"
+        return _execution_time_for(analysis["complexity"], analysis["n_agents"])
     
-    def _execute_dispatch(self, decision: Dict, request: str, context: Dict) -> Dict:
+    async def _execute_dispatch_async(self, decision: Dict, request: str, context: Dict,
+                                      context_json: Optional[str] = None) -> Dict:
         """Execute the dispatch decision"""
         
-        if decision["strategy"] == "use_template":
-            return self._execute_template(decision, request, context)
-        elif decision["strategy"] == "generate_custom_script":
-            return self._generate_and_execute_custom_script(decision, request, context)
-        else:
+        handler = self._strategies.get(decision["strategy"])
+        if handler is None:
             return {"error": "Unknown dispatch strategy", "strategy": decision["strategy"]}
+        return await handler(decision, request, context, context_json)
     
-    def _execute_template(self, decision: Dict, request: str, context: Dict) -> Dict:
+    async def _execute_template_async(self, decision: Dict, request: str, context: Dict,
+                                      context_json: Optional[str] = None) -> Dict:
         """Execute existing template script"""
-        template_path = os.path.join(
-            os.path.dirname(__file__), '..', 'templates', decision["template"]
-        )
+        template_path = _TEMPLATES_DIR / decision["template"]
         
-        print(f"🚀 Executing template: {decision['template']}")
+        _log.info("🚀 Executing template: %s", decision["template"])
         
         # For now, we'll call the template programmatically
         # In real implementation, this would execute the actual script
@@ -313,99 +697,104 @@ Provide structured analysis with clear recommendations for orchestration strateg
         
         return execution_report
     
-    def _generate_and_execute_custom_script(self, decision: Dict, request: str, context: Dict) -> Dict:
-        """Generate custom script using agent and execute it"""
-        
-        print(f"🔧 Generating custom script for: {decision['workflow_type']}")
-        
-        # Call agent to generate custom script
-        script_generation_prompt = f"""generate a custom workflow script for this specific use case:
-
-USER REQUEST: {request}
-CONTEXT: {json.dumps(context or {}, indent=2)}
-
-WORKFLOW ANALYSIS:
-- Type: {decision['workflow_type']}
-- Complexity: {decision['complexity']}
-- Agent Coordination Required: {decision['agent_coordination']}
-
-SCRIPT REQUIREMENTS:
-1. Use our standard agent protocol (Task Tool Proxy Pattern)
-2. Follow the template structure from project_manager_script.py
-3. Implement workflow-specific logic for this use case
-4. Include autonomous execution with progress tracking
-5. Provide orchestrator communication and reporting
-6. Generate comprehensive deliverables
-
-CUSTOM SCRIPT SPECIFICATIONS:
-- Main class: CustomWorkflowScript
-- Key methods: analyze_requirements(), create_execution_plan(), execute_workflow(), generate_deliverables()
-- Agent integration: Use AgentCaller and WorkflowAnalyzer from core modules
-- Progress tracking: Implement TodoWrite integration and checkpoint reporting
-- Error handling: Include retry logic and failure recovery
-
-BASE TEMPLATE STRUCTURE:
-```python
-#!/usr/bin/env python3
-\"\"\"
-Custom Workflow Script - {decision['workflow_type'].title()}
-Generated for specific use case: {request}
-\"\"\"
-
-import sys
-import os
-from datetime import datetime
-
-# Add core modules to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core'))
-
-from agent_caller import AgentCaller, AgentType
-from workflow_analyzer import WorkflowAnalyzer
-
-class CustomWorkflowScript:
-    def __init__(self, workflow_description: str):
-        self.workflow_description = workflow_description
-        self.session_id = f"custom_{int(datetime.now().timestamp())}"
-        # ... initialization code ...
-    
-    # ... implement custom workflow methods ...
-```
-
-Generate complete, production-ready Python script that implements this specific workflow with full autonomous execution capabilities."""
-        
-        script_task = self.agent_caller.call_agent(
-            AgentType.ORCHESTRATOR,
-            script_generation_prompt,
-            f"{self.session_id}_generate_script"
+    async def _generate_and_execute_custom_script_async(self, decision: Dict, request: str, context: Dict,
+                                                        context_json: Optional[str] = None) -> Dict:
+        """Generate custom script using agent, or reuse the one written for this request, and execute it"""
+        normalized_request = _normalize_request(request)
+        signature = _script_signature(
+            decision["workflow_type"], decision["complexity"],
+            _agent_requirements_for(normalized_request), normalized_request
         )
+        script_filename = self._script_index.get(signature)
+        if script_filename is not None and (GENERATED_SCRIPTS_DIR / script_filename).is_file():
+            _log.info("♻️ Reusing generated script for: %s", signature)
+            script_path = GENERATED_SCRIPTS_DIR / script_filename
+            script_task = None
+            status = "cached"
+        else:
+            script_filename, script_task = await self._generate_script_async(decision, request, context, context_json)
+            script_path = GENERATED_SCRIPTS_DIR / script_filename
+            status = "generated"
+            self._script_index[signature] = script_filename
+            self._save_script_index()
         
-        # Save generated script
-        script_filename = f"custom_workflow_{self.session_id}.py"
-        script_path = os.path.join(os.path.dirname(__file__), script_filename)
-        
-        # For now, simulate script generation and execution
         generated_script_info = {
             "script_generated": script_filename,
             "generation_task": script_task,
-            "script_path": script_path,
-            "status": "generated",
+            "script_path": str(script_path),
+            "status": status,
             "execution_ready": True
         }
         
-        print(f"✅ Custom script generated: {script_filename}")
-        
         # Execute the generated script (simulated)
-        execution_result = self._execute_generated_script(script_path, request, context)
+        execution_result = self._execute_generated_script(str(script_path), request, context)
         
         return {
             "script_generation": generated_script_info,
             "execution_result": execution_result
         }
     
+    async def _generate_script_async(self, decision: Dict, request: str, context: Dict,
+                                     context_json: Optional[str] = None) -> Tuple[str, "TaskProgress"]:
+        """Ask the orchestrator agent for a custom script and write its base file"""
+        if context_json is None:
+            context_json = _dumps_context(context)
+        
+        _log.info("🔧 Generating custom script for: %s", decision["workflow_type"])
+        
+        # Call agent to generate custom script
+        script_generation_prompt = _SCRIPT_GENERATION_PROMPT_TEMPLATE.format(
+            request=request,
+            context_json=context_json,
+            workflow_type=decision['workflow_type'],
+            complexity=decision['complexity'],
+            agent_coordination=decision['agent_coordination']
+        )
+        
+        script_number = next(self._task_sequence)
+        script_task = await self.agent_caller.call_agent_async(
+            _core_module("agent_caller").AgentType.ORCHESTRATOR,
+            (_SCRIPT_GENERATION_PROMPT_PREFIX, script_generation_prompt),
+            f"{self.session_id}_generate_script_{script_number}"
+        )
+        
+        # Write the base skeleton the generator was given; the agent's script
+        # itself comes back through the generation task, not into this file
+        script_filename = f"custom_workflow_{self.session_id}_{script_number}.py"
+        GENERATED_SCRIPTS_DIR.mkdir(parents=True, exist_ok=True)
+        (GENERATED_SCRIPTS_DIR / script_filename).write_text(
+            _render_custom_script(decision['workflow_type'], request), encoding="utf-8"
+        )
+        
+        _log.info("✅ Custom script generated: %s", script_filename)
+        return script_filename, script_task
+    
+    @cached_property
+    def _script_index(self) -> Dict[str, str]:
+        """Generated script filename per script signature, loaded once from disk"""
+        if not self.use_script_cache:
+            return {}
+        try:
+            with open(self.script_cache_path, 'r') as f:
+                script_index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return script_index if isinstance(script_index, dict) else {}
+    
+    def _save_script_index(self):
+        """Persist the script index so later sessions reuse generated scripts"""
+        if not self.use_script_cache:
+            return
+        try:
+            with open(self.script_cache_path, 'w') as f:
+                json.dump(self._script_index, f)
+        except OSError as e:
+            _log.warning("⚠️ Could not write script cache %s: %s", self.script_cache_path, e)
+    
     def _execute_generated_script(self, script_path: str, request: str, context: Dict) -> Dict:
         """Execute the generated custom script"""
         
-        print(f"🎯 Executing generated script...")
+        _log.info("🎯 Executing generated script...")
         
         # In real implementation, this would execute the actual generated script
         # For now, we'll simulate successful execution
@@ -436,6 +825,27 @@ Generate complete, production-ready Python script that implements this specific
         return execution_result
 
 # Main orchestrator interface
+_default_dispatcher_instance: Optional[OrchestratorDispatcher] = None
+_default_dispatcher_lock = threading.Lock()
+
+def _default_dispatcher() -> OrchestratorDispatcher:
+    """Process-wide dispatcher, so route and analysis caches persist across calls"""
+    global _default_dispatcher_instance
+    dispatcher = _default_dispatcher_instance
+    if dispatcher is None:
+        # Double-checked so concurrent first calls still build a single dispatcher
+        with _default_dispatcher_lock:
+            if _default_dispatcher_instance is None:
+                _default_dispatcher_instance = OrchestratorDispatcher()
+            dispatcher = _default_dispatcher_instance
+    return dispatcher
+
+def reset_dispatcher():
+    """Drop the shared dispatcher and its caches; the next call builds a fresh one"""
+    global _default_dispatcher_instance
+    with _default_dispatcher_lock:
+        _default_dispatcher_instance = None
+
 def orchestrate_workflow(user_request: str, context: Dict = None) -> Dict:
     """
     Main orchestrator interface for workflow dispatch
@@ -447,14 +857,21 @@ def orchestrate_workflow(user_request: str, context: Dict = None) -> Dict:
     Returns:
         Complete orchestration and execution result
     """
-    orchestrator = OrchestratorDispatcher()
-    return orchestrator.analyze_and_dispatch(user_request, context)
+    return _default_dispatcher().analyze_and_dispatch(user_request, context)
 
 # Example usage patterns
+# Requests of the bundled examples, also checked by --check-examples
+_EXAMPLE_REQUESTS = {
+    "project": "Implement secure user profile management system with Rust backend, React frontend, and comprehensive testing",
+    "research": "Research competitive landscape for AI-powered development tools and create strategic positioning recommendations",
+    "security": "Conduct comprehensive security audit of authentication system including vulnerability assessment and compliance validation",
+    "custom": "Create automated deployment pipeline with blue-green deployment strategy, rollback capabilities, and comprehensive monitoring",
+}
+
 def example_project_management():
     """Example: Project management workflow"""
     return orchestrate_workflow(
-        "Implement secure user profile management system with Rust backend, React frontend, and comprehensive testing",
+        _EXAMPLE_REQUESTS["project"],
         context={
             "tech_stack": ["Rust", "React", "PostgreSQL"],
             "security_requirements": ["OAuth2", "JWT", "RBAC"],
@@ -466,7 +883,7 @@ def example_project_management():
 def example_research_workflow():
     """Example: Research workflow"""
     return orchestrate_workflow(
-        "Research competitive landscape for AI-powered development tools and create strategic positioning recommendations",
+        _EXAMPLE_REQUESTS["research"],
         context={
             "research_scope": "Global market analysis",
             "competitors": ["GitHub Copilot", "Cursor", "JetBrains AI"],
@@ -478,7 +895,7 @@ def example_research_workflow():
 def example_security_audit():
     """Example: Security audit workflow"""
     return orchestrate_workflow(
-        "Conduct comprehensive security audit of authentication system including vulnerability assessment and compliance validation",
+        _EXAMPLE_REQUESTS["security"],
         context={
             "audit_scope": "Complete authentication flow",
             "compliance_frameworks": ["SOC2", "GDPR"],
@@ -490,7 +907,7 @@ def example_security_audit():
 def example_custom_workflow():
     """Example: Custom workflow that doesn't fit templates"""
     return orchestrate_workflow(
-        "Create automated deployment pipeline with blue-green deployment strategy, rollback capabilities, and comprehensive monitoring",
+        _EXAMPLE_REQUESTS["custom"],
         context={
             "infrastructure": "Kubernetes on AWS",
             "monitoring_stack": ["Prometheus", "Grafana", "AlertManager"],
@@ -499,24 +916,72 @@ def example_custom_workflow():
         }
     )
 
+_EXAMPLES = {
+    "project": example_project_management,
+    "research": example_research_workflow,
+    "security": example_security_audit,
+    "custom": example_custom_workflow,
+}
+
+def check_example_routing() -> Dict[str, str]:
+    """Bundled examples whose routed template script is missing, mapped to that script"""
+    missing = {}
+    for name, request in _EXAMPLE_REQUESTS.items():
+        template = _TEMPLATES.get(_workflow_type_for(_normalize_request(request)))
+        if template is not None and not (_TEMPLATES_DIR / template["script"]).is_file():
+            missing[name] = template["script"]
+    return missing
+
+def _write_result(result: Dict) -> None:
+    """Write an orchestration result to stdout as indented JSON"""
+    if orjson is not None:
+        # Flush pending text output before writing bytes under it
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE, default=str))
+        sys.stdout.buffer.flush()
+    else:
+        json.dump(result, sys.stdout, indent=2, default=str)
+        sys.stdout.write("\n")
+
+def _load_context_arg(value: str) -> Dict:
+    """Parse a --context value: inline JSON, or @path to a JSON file"""
+    if value.startswith("@"):
+        return json.loads(Path(value[1:]).read_bytes())
+    return json.loads(value)
+
 if __name__ == "__main__":
     # Command line interface
-    if len(sys.argv) > 1:
-        workflow_type = sys.argv[1]
-        
-        if workflow_type == "project":
-            result = example_project_management()
-        elif workflow_type == "research":
-            result = example_research_workflow()
-        elif workflow_type == "security":
-            result = example_security_audit()
-        elif workflow_type == "custom":
-            result = example_custom_workflow()
-        else:
-            print("Usage: python orchestrator_dispatcher.py [project|research|security|custom]")
-            sys.exit(1)
-            
-        print(json.dumps(result, indent=2, default=str))
+    parser = argparse.ArgumentParser(description="Analyze a request and dispatch it to the right workflow")
+    parser.add_argument("mode", nargs="?", choices=list(_EXAMPLES), help="Run a built-in example workflow")
+    parser.add_argument("--request", help="Describe what you want to accomplish")
+    parser.add_argument("--context", help="Additional context as JSON, or @file.json")
+    parser.add_argument("--check-examples", action="store_true",
+                        help="Verify every bundled example routes to an installed template")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
+    if args.check_examples:
+        missing = check_example_routing()
+        for name, script in missing.items():
+            print(f"❌ Example '{name}' routes to missing template: {script}")
+        if not missing:
+            print(f"✅ All {len(_EXAMPLE_REQUESTS)} examples route to installed templates")
+        sys.exit(1 if missing else 0)
+    
+    if args.mode:
+        _write_result(_EXAMPLES[args.mode]())
+        sys.exit(0)
+    
+    if args.request:
+        user_request = args.request
+        context = {}
+        if args.context:
+            try:
+                context = _load_context_arg(args.context)
+            except OSError as e:
+                parser.error(f"cannot read context file: {e}")
+            except json.JSONDecodeError as e:
+                parser.error(f"invalid context JSON: {e}")
     else:
         # Interactive mode
         user_request = input("Describe what you want to accomplish: ")
@@ -526,11 +991,11 @@ if __name__ == "__main__":
         if context_input.strip():
             try:
                 context = json.loads(context_input)
-            except:
+            except json.JSONDecodeError:
                 print("Invalid JSON, proceeding without context")
-        
-        result = orchestrate_workflow(user_request, context)
-        print("\n" + "="*60)
-        print("ORCHESTRATION COMPLETE")
-        print("="*60)
-        print(json.dumps(result, indent=2, default=str))
\ No newline at end of file
+    
+    result = orchestrate_workflow(user_request, context)
+    print("\n" + "="*60)
+    print("ORCHESTRATION COMPLETE")
+    print("="*60)
+    _write_result(result)